@@ -74,6 +74,7 @@ from .ten_gods import (
     _element_relation,
     ten_god,
     weighted_ten_god_distribution,
+    TEN_GOD_TABLE,
 )
 
 # ── Hidden Stems ──────────────────────────────────────────
@@ -86,6 +87,7 @@ from .longevity import (
     life_stage_detail,
     life_stages_for_chart,
     life_stage_for_luck_pillar,
+    LONGEVITY_TABLE,
 )
 
 # ── Na Yin ────────────────────────────────────────────────
@@ -95,6 +97,10 @@ from .nayin import (
     analyze_nayin_interactions,
 )
 
+# ── Chart ─────────────────────────────────────────────────
+from .frozen import FrozenDict, FrozenList
+from .chart import Chart, as_chart, PILLAR_NAMES
+
 # ── Core ──────────────────────────────────────────────────
 from .core import (
     normalize_gender,
@@ -110,6 +116,7 @@ from .branch_interactions import (
     detect_self_punishment,
     detect_xing,
     detect_branch_interactions,
+    detect_dynamic_interactions,
     evaluate_liu_he_transformation,
     evaluate_san_he_transformation,
     classify_ban_san_he,
@@ -185,6 +192,18 @@ from .projections import (
     generate_year_projections,
     generate_month_projections,
     generate_day_projections,
+    iter_new_moon_dates,
+    iter_year_projections,
+    iter_month_projections,
+    iter_day_projections,
+)
+from .projection_engine import (
+    PROJECTION_DTYPE,
+    TEN_GOD_NAMES,
+    Projector,
+    day_cycles,
+    year_cycles,
+    interaction_names,
 )
 
 # ── Analysis ─────────────────────────────────────────────
@@ -198,5 +217,18 @@ from .analysis import (
 # ── Narrative ────────────────────────────────────────────
 from .narrative import generate_narrative
 
+# ── Analysis Cache ───────────────────────────────────────
+from .cache import (
+    AnalysisCache,
+    ChartSignature,
+    MemoryBackend,
+    ShelveBackend,
+    NATAL_CACHE,
+    natal_analysis,
+    compute_natal_analysis,
+    freeze,
+    thaw,
+)
+
 # ── Report ───────────────────────────────────────────────
 from .report import generate_report_markdown
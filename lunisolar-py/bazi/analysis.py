@@ -8,10 +8,12 @@ from typing import Dict, List, Optional
 from .constants import (
     HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT, STEM_POLARITY,
     BRANCH_ELEMENT, GEN_MAP, CONTROL_MAP,
-    LIU_CHONG, LIU_HE, LIU_HAI, STEM_TRANSFORMATIONS,
+    STEM_TRANSFORMATIONS,
     SAN_HUI_ELEMENT,
 )
 from .core import ganzhi_from_cycle
+from .chart import as_chart
+from .branch_masks import branch_index, pair_tag_table
 from .ten_gods import ten_god, _element_relation
 from .longevity import life_stage_detail, life_stages_for_chart
 from .nayin import nayin_for_cycle, _nayin_pure_element, analyze_nayin_interactions
@@ -70,17 +72,8 @@ def analyze_time_range(
 
     # Interactions with natal branches
     yr_pillar = {"stem": yr_stem, "branch": yr_branch}
-    natal_branches = [p["branch"] for p in chart["pillars"].values()]
-    yr_interactions: List[str] = []
-    for b in natal_branches:
-        pair = frozenset({b, yr_branch})
-        if pair in LIU_CHONG:
-            yr_interactions.append("冲")
-        if pair in LIU_HE:
-            yr_interactions.append("合")
-        if pair in LIU_HAI:
-            yr_interactions.append("害")
-    result["year_interactions"] = yr_interactions
+    pair_tags = pair_tag_table(as_chart(chart).branches)
+    result["year_interactions"] = list(pair_tags[yr_b_idx])
 
     result["fu_yin_duplication"] = detect_fu_yin_duplication(chart, yr_pillar)
 
@@ -154,17 +147,7 @@ def analyze_time_range(
 
     # Luck pillar context
     if luck_pillar is not None:
-        lp_interactions: List[str] = []
-        lp_branch = luck_pillar["branch"]
-        for b in natal_branches:
-            pair = frozenset({b, lp_branch})
-            if pair in LIU_CHONG:
-                lp_interactions.append("冲")
-            if pair in LIU_HE:
-                lp_interactions.append("合")
-            if pair in LIU_HAI:
-                lp_interactions.append("害")
-        result["luck_pillar_interactions"] = lp_interactions
+        result["luck_pillar_interactions"] = list(pair_tags[branch_index(luck_pillar["branch"])])
         result["luck_fu_yin_duplication"] = detect_fu_yin_duplication(
             chart, luck_pillar
         )
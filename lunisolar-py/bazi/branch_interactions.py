@@ -1,25 +1,31 @@
 """
 Branch Interaction Detection — spec §8
 =======================================
+
+Pair and trio tests run on the integer branch masks of ``bazi.branch_masks``.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Union
 
 from .constants import (
-    ZI_XING_BRANCHES, BRANCH_HIDDEN_STEMS, BRANCH_ELEMENT,
+    EARTHLY_BRANCHES, ZI_XING_BRANCHES, BRANCH_HIDDEN_STEMS, BRANCH_ELEMENT,
     STEM_ELEMENT, GEN_MAP,
-    LIU_HE, LIU_CHONG, LIU_HAI, LIU_PO, AN_HE, GONG_HE,
-    SAN_HE, BAN_SAN_HE, SAN_HUI,
-    XING,
     LIU_HE_TRANSFORM_ELEMENT, LIU_HE_WU_WEI_PAIR, LIU_HE_WU_WEI_ELEMENTS,
     SAN_HE_ELEMENT,
-    GONG_HE_MISSING_MIDDLE, GONG_HE_ELEMENT,
+    GONG_HE_ELEMENT,
     ADJACENT_PAIRS,
 )
 from .glossary import (
     BAN_SAN_HE_BIRTH_PAIRS,
     BAN_SAN_HE_GRAVE_PAIRS,
 )
+from .chart import PILLAR_NAMES, as_chart
+from .branch_masks import (
+    HE, CHONG, HAI, PO, AN, GONG, BAN,
+    PAIR_FLAGS, GONG_HE_MIDDLE,
+    SAN_HE_MASKS, BAN_SAN_HE_MASKS, SAN_HUI_MASKS, XING_MASKS,
+    branch_index, branch_mask, clash_mask, complete, popcount,
+)
 
 
 # ── Pillar ordering utilities ──────────────────────────────
@@ -82,11 +88,10 @@ def detect_self_punishment(
 
 def detect_xing(chart: Dict, strict: bool = False) -> List[Dict]:
     """Detect 刑 (punishment) patterns among natal branches."""
-    branches = [p["branch"] for p in chart["pillars"].values()]
-    bset = set(branches)
+    mask = as_chart(chart).branch_mask
     results: List[Dict] = []
-    for trio in XING:
-        found = len(trio & bset)
+    for trio_mask, trio in XING_MASKS:
+        found = popcount(mask & trio_mask)
         if strict:
             if found == len(trio):
                 results.append({"pattern": trio, "found": found, "mode": "complete"})
@@ -211,13 +216,9 @@ def _has_leading_element(chart: Dict, target: str, exclude_pillars: set) -> bool
 
 def _branch_clashed_by_third(chart: Dict, b1: str, b2: str) -> bool:
     """Check if a third natal branch clashes either b1 or b2."""
-    for p in chart["pillars"].values():
-        b = p["branch"]
-        if b == b1 or b == b2:
-            continue
-        if frozenset({b, b1}) in LIU_CHONG or frozenset({b, b2}) in LIU_CHONG:
-            return True
-    return False
+    pair_mask = branch_mask((b1, b2))
+    others = as_chart(chart).branch_mask & ~pair_mask
+    return bool(others & clash_mask(pair_mask))
 
 
 # ── San He transformation ──────────────────────────────────
@@ -233,18 +234,9 @@ def evaluate_san_he_transformation(chart: Dict, trio: frozenset) -> Dict:
     month_support = (month_elem == target) or (GEN_MAP.get(month_elem) == target)
 
     # Check if any branch in trio is clashed by an external branch
-    branches_in_trio = set(trio)
-    obstructed = False
-    for p in chart["pillars"].values():
-        b = p["branch"]
-        if b in branches_in_trio:
-            continue
-        for tb in branches_in_trio:
-            if frozenset({b, tb}) in LIU_CHONG:
-                obstructed = True
-                break
-        if obstructed:
-            break
+    trio_mask = branch_mask(trio)
+    others = as_chart(chart).branch_mask & ~trio_mask
+    obstructed = bool(others & clash_mask(trio_mask))
 
     # Full trio present → strong formation
     if month_support and not obstructed:
@@ -346,9 +338,10 @@ def detect_branch_interactions(chart: Dict) -> Dict[str, list]:
     Detects: 六合, 六冲, 害, 六破, 暗合, 拱合, 三合, 半三合, 三会, 刑, 自刑.
     Also evaluates transformation outcomes for 六合 and 三合.
     """
-    pillar_names = list(chart["pillars"].keys())
-    branches = [chart["pillars"][n]["branch"] for n in pillar_names]
-    bset = set(branches)
+    c = as_chart(chart)
+    idx = c.branches
+    branches = [EARTHLY_BRANCHES[b] for b in idx]
+    mask = c.branch_mask
 
     results: Dict[str, list] = {
         "六合": [], "六冲": [], "害": [], "六破": [],
@@ -357,74 +350,116 @@ def detect_branch_interactions(chart: Dict) -> Dict[str, list]:
         "刑": [], "自刑": [],
     }
 
-    # Pairwise interactions
-    for i in range(len(branches)):
-        for j in range(i + 1, len(branches)):
-            pair = frozenset({branches[i], branches[j]})
-            p1, p2 = pillar_names[i], pillar_names[j]
-
-            if pair in LIU_HE:
-                transform = evaluate_liu_he_transformation(
-                    chart, branches[i], branches[j], p1, p2,
-                )
-                results["六合"].append(transform)
-
-            if pair in LIU_CHONG:
-                results["六冲"].append((branches[i], branches[j]))
-
-            if pair in LIU_HAI:
-                results["害"].append((branches[i], branches[j]))
-
-            if pair in LIU_PO:
-                results["六破"].append((branches[i], branches[j]))
-
-            if pair in AN_HE:
-                results["暗合"].append((branches[i], branches[j]))
-
-    # Arching combinations (拱合): pair present, middle branch ABSENT
-    for i in range(len(branches)):
-        for j in range(i + 1, len(branches)):
-            pair = frozenset({branches[i], branches[j]})
-            if pair in GONG_HE:
-                missing = GONG_HE_MISSING_MIDDLE.get(pair)
-                if missing and missing not in bset:
+    # Pairwise interactions: one flag lookup per pillar pair
+    for i in range(len(idx)):
+        row = PAIR_FLAGS[idx[i]]
+        for j in range(i + 1, len(idx)):
+            flags = row[idx[j]]
+            if not flags:
+                continue
+            pair = (branches[i], branches[j])
+
+            if flags & HE:
+                results["六合"].append(evaluate_liu_he_transformation(
+                    c, branches[i], branches[j], PILLAR_NAMES[i], PILLAR_NAMES[j],
+                ))
+            if flags & CHONG:
+                results["六冲"].append(pair)
+            if flags & HAI:
+                results["害"].append(pair)
+            if flags & PO:
+                results["六破"].append(pair)
+            if flags & AN:
+                results["暗合"].append(pair)
+
+            # Arching combinations (拱合): pair present, middle branch ABSENT
+            if flags & GONG:
+                middle = GONG_HE_MIDDLE[idx[i]][idx[j]]
+                if not mask >> middle & 1:
                     results["拱合"].append({
-                        "pair": (branches[i], branches[j]),
-                        "missing_middle": missing,
-                        "target_element": GONG_HE_ELEMENT.get(pair),
+                        "pair": pair,
+                        "missing_middle": EARTHLY_BRANCHES[middle],
+                        "target_element": GONG_HE_ELEMENT.get(frozenset(pair)),
                     })
 
     # Three Combinations (三合) with transformation evaluation
-    for trio in SAN_HE:
-        if trio.issubset(bset):
-            transform = evaluate_san_he_transformation(chart, trio)
-            results["三合"].append(transform)
+    full_masks = []
+    for trio_mask, trio in SAN_HE_MASKS:
+        if mask & trio_mask == trio_mask:
+            full_masks.append(trio_mask)
+            results["三合"].append(evaluate_san_he_transformation(c, trio))
 
     # Half Three Combinations (半三合) — only if not part of a full 三合
-    full_trio_branches = set()
-    for entry in results["三合"]:
-        if isinstance(entry, dict):
-            full_trio_branches.update(entry.get("trio", set()))
-    for pair in BAN_SAN_HE:
-        if pair.issubset(bset):
-            already_full = any(pair.issubset(entry.get("trio", set()) if isinstance(entry, dict) else entry) for entry in results["三合"])
-            if not already_full:
-                classification = classify_ban_san_he(pair)
-                results["半三合"].append(classification)
+    for pair_mask, pair in BAN_SAN_HE_MASKS:
+        if mask & pair_mask == pair_mask and not any(
+            pair_mask & m == pair_mask for m in full_masks
+        ):
+            results["半三合"].append(classify_ban_san_he(pair))
 
     # Directional Combinations (三会)
-    for trio in SAN_HUI:
-        if trio.issubset(bset):
-            results["三会"].append(trio)
+    results["三会"] = complete(mask, SAN_HUI_MASKS)
 
     # Punishments
-    for entry in detect_xing(chart, strict=False):
-        results["刑"].append(entry)
-
-    for entry in detect_self_punishment(chart):
-        results["自刑"].append(entry)
+    results["刑"] = detect_xing(c, strict=False)
+    results["自刑"] = detect_self_punishment(c)
 
     # Resolve conflicts
     results = resolve_interaction_conflicts(results)
 
     return results
+
+
+def detect_dynamic_interactions(
+    chart: Dict,
+    dynamic: Mapping[str, Union[str, int]],
+) -> Dict[str, list]:
+    """Branch interactions that dynamic pillars bring to a natal chart.
+
+    Args:
+        chart: Natal chart
+        dynamic: Label -> branch (character or index) of each dynamic pillar,
+                 e.g. ``{"luck": "午", "annual": "子", "monthly": 2}``
+
+    Pair entries are ``{"pillars": (label_a, label_b), "branches": (a, b)}``
+    for every pair with at least one dynamic side; natal pillars are
+    labelled by name, so dynamic labels must differ from them.  三合, 三会
+    and 刑 list the trios completed by natal and dynamic branches together
+    but not by the natal branches alone.
+    """
+    c = as_chart(chart)
+    labels = list(PILLAR_NAMES)
+    idx = list(c.branches)
+    for label, branch in dynamic.items():
+        if label in labels:
+            raise ValueError(f"Dynamic pillar label {label!r} is already used")
+        labels.append(label)
+        idx.append(branch_index(branch))
+
+    natal_mask = c.branch_mask
+    mask = branch_mask(idx)
+
+    results: Dict[str, list] = {
+        "六合": [], "六冲": [], "害": [], "六破": [], "暗合": [], "半三合": [],
+    }
+    pair_keys = ((HE, "六合"), (CHONG, "六冲"), (HAI, "害"), (PO, "六破"), (AN, "暗合"), (BAN, "半三合"))
+
+    for j in range(len(PILLAR_NAMES), len(idx)):
+        column = idx[j]
+        for i in range(j):
+            flags = PAIR_FLAGS[idx[i]][column]
+            if not flags:
+                continue
+            entry = {
+                "pillars": (labels[i], labels[j]),
+                "branches": (EARTHLY_BRANCHES[idx[i]], EARTHLY_BRANCHES[column]),
+            }
+            for flag, key in pair_keys:
+                if flags & flag:
+                    results[key].append(entry)
+
+    for key, table in (("三合", SAN_HE_MASKS), ("三会", SAN_HUI_MASKS), ("刑", XING_MASKS)):
+        results[key] = [
+            trio for trio_mask, trio in table
+            if mask & trio_mask == trio_mask and natal_mask & trio_mask != trio_mask
+        ]
+    return results
@@ -0,0 +1,131 @@
+"""
+Branch Bitmask Tables
+=====================
+
+A set of earthly branches is a 12-bit integer (bit *i* = branch *i*), so a
+natal chart is one mask (``Chart.branch_mask``) and adding luck, year,
+month or day pillars is a bitwise OR.  Pair relations are precomputed
+12×12 tables of flag bits and every trio / half-trio is a mask, so
+interaction detection reduces to table lookups and ``mask & m == m``
+tests instead of building a frozenset per pair::
+
+    PAIR_FLAGS[a][b] & CHONG          # do branches a and b clash?
+    PARTNERS[CHONG][b] & natal_mask   # which natal branches clash with b?
+    mask & trio_mask == trio_mask     # is a 三合 / 三会 / 刑 trio complete?
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from .constants import (
+    EARTHLY_BRANCHES,
+    LIU_HE, LIU_CHONG, LIU_HAI, LIU_PO, AN_HE, GONG_HE,
+    SAN_HE, BAN_SAN_HE, SAN_HUI, XING, ZI_XING_BRANCHES,
+    GONG_HE_MISSING_MIDDLE,
+)
+
+_BRANCH_INDEX: Dict[str, int] = {b: i for i, b in enumerate(EARTHLY_BRANCHES)}
+
+# Pair relation flags
+HE = 1       # 六合
+CHONG = 2    # 六冲
+HAI = 4      # 害
+PO = 8       # 六破
+AN = 16      # 暗合
+GONG = 32    # 拱合
+BAN = 64     # 半三合
+
+_PAIR_SETS = (
+    (HE, LIU_HE), (CHONG, LIU_CHONG), (HAI, LIU_HAI), (PO, LIU_PO),
+    (AN, AN_HE), (GONG, GONG_HE), (BAN, BAN_SAN_HE),
+)
+
+
+def branch_mask(branches: Iterable) -> int:
+    """12-bit mask of branches given as characters or 0-based indexes."""
+    mask = 0
+    for b in branches:
+        mask |= 1 << (_BRANCH_INDEX[b] if isinstance(b, str) else b)
+    return mask
+
+
+def _build_pair_flags() -> Tuple[Tuple[int, ...], ...]:
+    table = [[0] * 12 for _ in range(12)]
+    for flag, pairs in _PAIR_SETS:
+        for pair in pairs:
+            a, b = (_BRANCH_INDEX[x] for x in pair)
+            table[a][b] |= flag
+            table[b][a] |= flag
+    return tuple(tuple(row) for row in table)
+
+
+# [branch][branch] -> OR of relation flags
+PAIR_FLAGS: Tuple[Tuple[int, ...], ...] = _build_pair_flags()
+
+# flag -> [branch] -> mask of the branches holding that relation with it
+PARTNERS: Dict[int, Tuple[int, ...]] = {
+    flag: tuple(
+        sum(1 << b for b in range(12) if PAIR_FLAGS[a][b] & flag) for a in range(12)
+    )
+    for flag in (HE, CHONG, HAI, PO, AN, GONG, BAN)
+}
+
+# [branch][branch] -> index of the missing middle branch of a 拱合 pair, else -1
+GONG_HE_MIDDLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        _BRANCH_INDEX[GONG_HE_MISSING_MIDDLE[frozenset((EARTHLY_BRANCHES[a], EARTHLY_BRANCHES[b]))]]
+        if PAIR_FLAGS[a][b] & GONG else -1
+        for b in range(12)
+    )
+    for a in range(12)
+)
+
+# (mask, original frozenset) in the iteration order of the constants tables
+SAN_HE_MASKS: Tuple[Tuple[int, frozenset], ...] = tuple((branch_mask(t), t) for t in SAN_HE)
+BAN_SAN_HE_MASKS: Tuple[Tuple[int, frozenset], ...] = tuple((branch_mask(p), p) for p in BAN_SAN_HE)
+SAN_HUI_MASKS: Tuple[Tuple[int, frozenset], ...] = tuple((branch_mask(t), t) for t in SAN_HUI)
+XING_MASKS: Tuple[Tuple[int, frozenset], ...] = tuple((branch_mask(t), t) for t in XING)
+ZI_XING_MASK: int = branch_mask(ZI_XING_BRANCHES)
+
+
+def popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def clash_mask(mask: int) -> int:
+    """Mask of every branch that clashes (六冲) with some branch in ``mask``."""
+    # 冲 pairs are six apart: rotate the 12-bit mask by six
+    return ((mask << 6) | (mask >> 6)) & 0xFFF
+
+
+def complete(mask: int, table: Tuple[Tuple[int, frozenset], ...]) -> List[frozenset]:
+    """Entries of a trio / pair mask table fully contained in ``mask``."""
+    return [group for m, group in table if mask & m == m]
+
+
+# Tags reported by the year / month / day projections, in reporting order
+PROJECTION_TAGS: Tuple[Tuple[int, str], ...] = ((CHONG, "冲"), (HE, "合"), (HAI, "害"))
+
+
+def pair_tag_table(branches: Iterable[int],
+                   tags: Tuple[Tuple[int, str], ...] = PROJECTION_TAGS) -> Tuple[Tuple[str, ...], ...]:
+    """[dynamic branch] -> tags it forms with each of ``branches``, in order.
+
+    Built once per natal chart; a projection then reads its interaction
+    tags with a single index instead of testing every natal pair.
+    """
+    branches = tuple(branches)
+    return tuple(
+        tuple(name for b in branches for flag, name in tags if PAIR_FLAGS[b][x] & flag)
+        for x in range(12)
+    )
+
+
+def branch_index(branch) -> int:
+    """0-based index of a branch given as a character or index."""
+    if isinstance(branch, str):
+        if branch not in _BRANCH_INDEX:
+            raise ValueError(f"Unknown earthly branch: {branch!r}")
+        return _BRANCH_INDEX[branch]
+    if not 0 <= branch < 12:
+        raise ValueError(f"Branch index must be 0..11, got {branch}")
+    return branch
@@ -0,0 +1,305 @@
+"""
+Natal Analysis Cache
+====================
+
+Every natal analysis is a pure function of the chart signature
+``(year_cycle, month_cycle, day_cycle, hour_cycle, gender)``, so the full
+set of detectors run by ``python -m bazi`` is computed once per signature
+and served from a bounded, thread-safe cache afterwards.
+
+Cached results are frozen: dicts and lists become read-only subclasses
+(``FrozenDict`` / ``FrozenList``) and sets become frozensets, so they
+compare equal to freshly computed results but cannot be modified through
+the cache.  ``thaw()`` returns a mutable copy.
+
+Concurrent misses on the same key compute once: the first caller computes
+and the others wait for its result.
+
+Storage is pluggable: ``MemoryBackend`` (LRU, the default) or
+``ShelveBackend`` (an on-disk ``shelve`` file; on POSIX every access holds
+an ``flock`` on ``<path>.lock``, so concurrent processes may share it);
+any object with ``get``/``set``/``clear``/``__len__`` works.
+
+Usage::
+
+    from bazi.cache import natal_analysis, NATAL_CACHE
+
+    result = natal_analysis(43, 15, 9, 37, "male")
+    result["structure"]["primary"], result["comprehensive"]["summary"]
+    NATAL_CACHE.stats()      # CacheStats(hits=..., misses=..., size=...)
+"""
+
+import shelve
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+from .core import build_chart, normalize_gender
+from .ten_gods import weighted_ten_god_distribution
+from .longevity import longevity_map, life_stages_for_chart
+from .nayin import analyze_nayin_interactions
+from .scoring import score_day_master, rate_chart, recommend_useful_god
+from .branch_interactions import detect_branch_interactions
+from .stem_transformations import detect_stem_combinations, detect_transformations
+from .punishments import detect_punishments
+from .symbolic_stars import detect_symbolic_stars, void_in_pillars
+from .structure import classify_structure
+from .analysis import comprehensive_analysis, detect_missing_elements, detect_competing_frames
+from .narrative import generate_narrative
+from .frozen import FrozenDict, FrozenList, freeze, thaw
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_MISSING = object()
+
+
+# ============================================================
+# Signatures
+# ============================================================
+
+class ChartSignature(NamedTuple):
+    """Canonical cache key of a natal chart."""
+    year_cycle: int
+    month_cycle: int
+    day_cycle: int
+    hour_cycle: int
+    gender: str
+
+    @classmethod
+    def of(cls, year_cycle: int, month_cycle: int, day_cycle: int,
+           hour_cycle: int, gender: str) -> "ChartSignature":
+        """Validate cycles (1..60) and normalize gender aliases."""
+        cycles = (year_cycle, month_cycle, day_cycle, hour_cycle)
+        for cycle in cycles:
+            if not 1 <= cycle <= 60:
+                raise ValueError(f"Cycle must be between 1 and 60, got {cycle}")
+        return cls(*cycles, normalize_gender(gender))
+
+    @property
+    def key(self) -> str:
+        """String form used by the storage backends."""
+        return f"{self.year_cycle}-{self.month_cycle}-{self.day_cycle}-{self.hour_cycle}-{self.gender}"
+
+
+# ============================================================
+# Backends
+# ============================================================
+
+class MemoryBackend:
+    """Bounded in-process LRU store."""
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ShelveBackend:
+    """On-disk store in a ``shelve`` file; entries persist across runs.
+
+    The file is opened per operation under an exclusive ``flock`` on
+    ``<path>.lock``, so several processes may use the same path and each
+    sees the others' writes.  Without ``fcntl`` (Windows) only the threads
+    of one process are serialized.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _open(self):
+        with self._lock:
+            if fcntl is None:
+                with shelve.open(self.path) as db:
+                    yield db
+                return
+            with open(self.path + ".lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    with shelve.open(self.path) as db:
+                        yield db
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._open() as db:
+            return db.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        with self._open() as db:
+            db[key] = value
+
+    def clear(self) -> None:
+        with self._open() as db:
+            db.clear()
+
+    def __len__(self) -> int:
+        with self._open() as db:
+            return len(db)
+
+
+# ============================================================
+# Cache
+# ============================================================
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+def compute_natal_analysis(signature: ChartSignature) -> Dict:
+    """Run every natal detector for one signature (uncached, mutable result)."""
+    chart = build_chart(*signature)
+
+    score, strength = score_day_master(chart)
+    interactions = detect_branch_interactions(chart)
+    structure = classify_structure(chart, strength)
+    useful = recommend_useful_god(chart, strength, structure, interactions=interactions)
+    missing_elements = detect_missing_elements(chart)
+    competing_frames = detect_competing_frames(chart, interactions)
+
+    return {
+        "chart": chart,
+        "score": score,
+        "strength": strength,
+        "interactions": interactions,
+        "structure": structure,
+        "useful_god": useful,
+        "rating": rate_chart(chart),
+        "missing_elements": missing_elements,
+        "competing_frames": competing_frames,
+        "narrative": generate_narrative(
+            chart, strength, structure, interactions,
+            missing_elements=missing_elements,
+            competing_frames=competing_frames,
+        ),
+        "longevity_map": longevity_map(chart),
+        "ten_god_distribution": weighted_ten_god_distribution(chart),
+        "comprehensive": comprehensive_analysis(chart),
+        "symbolic_stars": detect_symbolic_stars(chart),
+        "void_status": void_in_pillars(chart),
+        "stem_combinations": detect_stem_combinations(chart),
+        "transformations": detect_transformations(chart),
+        "punishments": detect_punishments(chart),
+        "nayin_analysis": analyze_nayin_interactions(chart),
+        "life_stages": life_stages_for_chart(chart),
+    }
+
+
+class AnalysisCache:
+    """Thread-safe cache of frozen analysis results keyed by chart signature."""
+
+    def __init__(self, maxsize: int = 4096, backend: Optional[Any] = None):
+        """
+        Args:
+            maxsize: Entry bound of the default ``MemoryBackend``
+            backend: Storage backend; overrides ``maxsize`` when given
+        """
+        self.backend = backend if backend is not None else MemoryBackend(maxsize)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compute(self, signature: ChartSignature, kind: str,
+                       compute: Callable[[ChartSignature], Any]) -> Any:
+        """Frozen ``compute(signature)``, computed at most once per (kind, signature)
+        while the entry stays cached.
+
+        Callers that miss while another thread computes the same key wait
+        for that result instead of computing it again.
+        """
+        key = f"{kind}:{signature.key}"
+        while True:
+            value = self.backend.get(key, _MISSING)
+            if value is not _MISSING:
+                with self._lock:
+                    self._hits += 1
+                return value
+            with self._lock:
+                pending = self._in_flight.get(key)
+                if pending is None:
+                    pending = self._in_flight[key] = threading.Event()
+                    break
+            # Another thread is computing this key; re-read once it is done
+            pending.wait()
+
+        try:
+            # A computation may have finished between the miss and the claim
+            value = self.backend.get(key, _MISSING)
+            if value is not _MISSING:
+                with self._lock:
+                    self._hits += 1
+                return value
+            value = freeze(compute(signature))
+            self.backend.set(key, value)
+            with self._lock:
+                self._misses += 1
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set()
+
+    def natal_analysis(self, year_cycle: int, month_cycle: int, day_cycle: int,
+                       hour_cycle: int, gender: str) -> FrozenDict:
+        """Cached :func:`compute_natal_analysis`."""
+        signature = ChartSignature.of(year_cycle, month_cycle, day_cycle, hour_cycle, gender)
+        return self.get_or_compute(signature, "natal", compute_natal_analysis)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self.backend))
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self.backend.clear()
+        with self._lock:
+            self._hits = self._misses = 0
+
+
+NATAL_CACHE = AnalysisCache()
+
+
+def natal_analysis(year_cycle: int, month_cycle: int, day_cycle: int, hour_cycle: int,
+                   gender: str, cache: Optional[AnalysisCache] = None) -> FrozenDict:
+    """Frozen natal analysis bundle from ``cache`` (default: ``NATAL_CACHE``).
+
+    Keys: ``chart``, ``score``, ``strength``, ``interactions``, ``structure``,
+    ``useful_god``, ``rating``, ``missing_elements``, ``competing_frames``,
+    ``narrative``, ``longevity_map``, ``ten_god_distribution``,
+    ``comprehensive``, ``symbolic_stars``, ``void_status``,
+    ``stem_combinations``, ``transformations``, ``punishments``,
+    ``nayin_analysis``, ``life_stages``.
+    """
+    return (cache or NATAL_CACHE).natal_analysis(year_cycle, month_cycle, day_cycle, hour_cycle, gender)
@@ -0,0 +1,333 @@
+"""
+Integer-coded Natal Chart
+=========================
+
+``Chart`` stores a natal chart as a few small tuples of integers: the four
+cycle numbers (1..60), 0-based stem and branch indexes, hidden-stem
+indexes per branch and a 12-bit mask of the branches present.  Detectors
+that take a chart through ``as_chart()`` read those directly instead of
+re-deriving indexes from characters.
+
+A ``Chart`` is also a ``dict`` holding the nested layout ``build_chart``
+always returned, so callers index it and ``json.dumps`` it as before::
+
+    chart["pillars"]["day"]["stem"], chart["day_master"]["element"], chart["gender"]
+
+The layout is rendered on first dict access from read-only pillar dicts
+shared between charts, so consumers of the integers alone never build it.
+``pillars`` and ``day_master`` always follow the integers: the nested
+dicts cannot be edited in place, and assigning a whole ``chart["pillars"]``
+reads its stems and branches and re-renders both keys.  ``gender`` and any
+extra keys are ordinary entries.  Frozen copies (``copy(frozen=True)``,
+``freeze()``) reject every change.
+"""
+
+import threading
+from collections.abc import Mapping
+from typing import Dict, Iterable, Tuple, Union
+
+from shared.sexagenary import STEM_BRANCH_CYCLE
+
+from .constants import HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT, BRANCH_HIDDEN_STEMS
+from .frozen import FrozenDict, freeze, thaw, self_freezing
+from .hidden_stems import branch_hidden_with_roles
+from .nayin import nayin_for_cycle, _nayin_pure_element
+from .ten_gods import TEN_GOD_TABLE
+
+PILLAR_NAMES: Tuple[str, ...] = ("year", "month", "day", "hour")
+
+STEM_INDEX: Dict[str, int] = {s: i for i, s in enumerate(HEAVENLY_STEMS)}
+BRANCH_INDEX: Dict[str, int] = {b: i for i, b in enumerate(EARTHLY_BRANCHES)}
+
+# stem index -> element name
+STEM_ELEMENTS: Tuple[str, ...] = tuple(STEM_ELEMENT[s] for s in HEAVENLY_STEMS)
+
+# branch index -> stem indexes of its hidden stems (main, middle, residual)
+HIDDEN_STEM_INDEXES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(STEM_INDEX[s] for s in BRANCH_HIDDEN_STEMS[b]) for b in EARTHLY_BRANCHES
+)
+
+# Keys rendered from the integers; callers cannot set or remove them
+_DERIVED_KEYS = ("pillars", "day_master")
+_REQUIRED_KEYS = _DERIVED_KEYS + ("gender",)
+
+_DAY_MASTER_LAYOUTS: Tuple[FrozenDict, ...] = tuple(
+    FrozenDict(stem=HEAVENLY_STEMS[s], element=STEM_ELEMENTS[s]) for s in range(10)
+)
+
+# (day master stem, cycle) -> shared read-only pillar layout
+_PILLAR_LAYOUTS: Dict[Tuple[int, int], FrozenDict] = {}
+
+_RENDER_LOCK = threading.Lock()
+
+
+def _pillar_layout(dm: int, cycle: int) -> FrozenDict:
+    """Read-only layout of the pillar ``cycle`` for Day Master stem ``dm``."""
+    layout = _PILLAR_LAYOUTS.get((dm, cycle))
+    if layout is None:
+        s, b = (cycle - 1) % 10, (cycle - 1) % 12
+        pillar_data: Dict = {
+            "stem": HEAVENLY_STEMS[s],
+            "branch": EARTHLY_BRANCHES[b],
+            "hidden": branch_hidden_with_roles(b),
+            "ten_god": TEN_GOD_TABLE[dm][s],
+        }
+        ny = nayin_for_cycle(cycle)
+        if ny:
+            pillar_data["nayin"] = {
+                "element": _nayin_pure_element(ny["nayin_element"]),
+                "chinese": ny["nayin_chinese"],
+                "vietnamese": ny["nayin_vietnamese"],
+                "english": ny["nayin_english"],
+            }
+        layout = _PILLAR_LAYOUTS.setdefault((dm, cycle), freeze(pillar_data))
+    return layout
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("Chart is read-only; use thaw() for a mutable copy")
+
+
+def _rendered_first(method):
+    """Wrap a ``dict`` accessor so that it sees the rendered layout."""
+    def wrapper(self, *args, **kwargs):
+        self._render()
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+def _pillar_cycles(pillars: Mapping) -> Tuple[int, ...]:
+    """Cycle numbers of the four pillars of a dict-shaped chart."""
+    cycles = []
+    for name in PILLAR_NAMES:
+        pillar = pillars[name]
+        try:
+            stem, branch = STEM_INDEX[pillar["stem"]], BRANCH_INDEX[pillar["branch"]]
+        except KeyError as e:
+            raise ValueError(f"Invalid stem-branch pair: {pillar['stem']}{pillar['branch']}") from e
+        cycle = STEM_BRANCH_CYCLE[stem][branch]
+        if not cycle:
+            raise ValueError(f"Invalid stem-branch pair: {pillar['stem']}{pillar['branch']}")
+        cycles.append(cycle)
+    return tuple(cycles)
+
+
+@self_freezing
+class Chart(dict):
+    """Natal chart as integer tuples; the dict itself is the nested layout."""
+
+    __slots__ = ("cycles", "stems", "branches", "hidden", "branch_mask", "_frozen", "_rendered")
+
+    def __init__(
+        self,
+        year_cycle: int,
+        month_cycle: int,
+        day_cycle: int,
+        hour_cycle: int,
+        gender: str,
+    ):
+        if gender not in ("male", "female"):
+            raise ValueError("gender must be 'male' or 'female' (see normalize_gender)")
+        cycles = (year_cycle, month_cycle, day_cycle, hour_cycle)
+        for cycle in cycles:
+            if not (1 <= cycle <= 60):
+                raise ValueError(f"Cycle must be between 1 and 60, got {cycle}")
+        self._fill(cycles, {"gender": gender}, False)
+
+    def _set_cycles(self, cycles: Tuple[int, ...]) -> None:
+        self.cycles = cycles
+        self.stems = tuple((c - 1) % 10 for c in cycles)
+        self.branches = tuple((c - 1) % 12 for c in cycles)
+        self.hidden = tuple(HIDDEN_STEM_INDEXES[b] for b in self.branches)
+        mask = 0
+        for b in self.branches:
+            mask |= 1 << b
+        self.branch_mask = mask
+
+    def _fill(self, cycles: Tuple[int, ...], entries: Mapping, frozen: bool) -> None:
+        """Set the integers and the stored entries; the layout renders on first access.
+
+        ``entries`` always holds ``gender``, so the dict is never empty (the
+        C ``json`` encoder writes ``{}`` for an empty dict without asking).
+        """
+        self._set_cycles(tuple(cycles))
+        for key, value in entries.items():
+            dict.__setitem__(self, key, value)
+        self._frozen = frozen
+        self._rendered = False
+
+    @classmethod
+    def _create(cls, cycles: Tuple[int, ...], entries: Mapping, frozen: bool = False) -> "Chart":
+        chart = cls.__new__(cls)
+        chart._fill(cycles, entries, frozen)
+        return chart
+
+    @classmethod
+    def from_dict(cls, chart: Mapping) -> "Chart":
+        """Rebuild a ``Chart`` from a dict-shaped chart (stems, branches and gender)."""
+        return cls._create(_pillar_cycles(chart["pillars"]), {"gender": chart.get("gender", "male")})
+
+    # ------------------------------------------------------------------
+    # Integer accessors
+    # ------------------------------------------------------------------
+
+    @property
+    def day_master(self) -> int:
+        """0-based stem index of the Day Master."""
+        return self.stems[2]
+
+    @property
+    def day_cycle(self) -> int:
+        return self.cycles[2]
+
+    @property
+    def gender(self) -> str:
+        return dict.__getitem__(self, "gender")
+
+    def pillar(self, name: str) -> Tuple[int, int]:
+        """(stem, branch) indexes of a pillar by name."""
+        i = PILLAR_NAMES.index(name)
+        return self.stems[i], self.branches[i]
+
+    def has_branch(self, branch_idx: int) -> bool:
+        return bool(self.branch_mask >> branch_idx & 1)
+
+    # ------------------------------------------------------------------
+    # Dict layout
+    # ------------------------------------------------------------------
+
+    def _layout(self) -> Tuple[FrozenDict, FrozenDict]:
+        dm = self.day_master
+        pillars = FrozenDict(zip(PILLAR_NAMES, (_pillar_layout(dm, c) for c in self.cycles)))
+        return pillars, _DAY_MASTER_LAYOUTS[dm]
+
+    def _render(self) -> None:
+        """Insert ``pillars`` and ``day_master`` ahead of the stored entries."""
+        if self._rendered:
+            return
+        with _RENDER_LOCK:
+            if self._rendered:
+                return
+            entries = list(dict.items(self))
+            pillars, day_master = self._layout()
+            dict.__setitem__(self, "pillars", pillars)
+            dict.__setitem__(self, "day_master", day_master)
+            # Re-insert gender and extras after the layout keys, never emptying the dict
+            for key, value in entries:
+                dict.__delitem__(self, key)
+                dict.__setitem__(self, key, value)
+            self._rendered = True
+
+    def _entries(self) -> Dict:
+        """Stored (non-derived) entries: ``gender`` and any extra keys."""
+        return {k: v for k, v in dict.items(self) if k not in _DERIVED_KEYS}
+
+    def to_dict(self) -> Dict:
+        """Plain, mutable deep copy of the nested layout."""
+        return thaw(dict(self.items()))
+
+    __getitem__ = _rendered_first(dict.__getitem__)
+    __contains__ = _rendered_first(dict.__contains__)
+    __iter__ = _rendered_first(dict.__iter__)
+    __reversed__ = _rendered_first(dict.__reversed__)
+    __len__ = _rendered_first(dict.__len__)
+    __or__ = _rendered_first(dict.__or__)
+    __ror__ = _rendered_first(dict.__ror__)
+    get = _rendered_first(dict.get)
+    keys = _rendered_first(dict.keys)
+    values = _rendered_first(dict.values)
+    items = _rendered_first(dict.items)
+
+    def __eq__(self, other) -> bool:
+        self._render()
+        if isinstance(other, Chart):
+            other._render()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __setitem__(self, key: str, value) -> None:
+        if self._frozen:
+            _read_only(self)
+        if key == "day_master":
+            raise TypeError("day_master follows the pillars; assign chart['pillars'] instead")
+        self._render()
+        if key == "pillars":
+            self._set_cycles(_pillar_cycles(value))
+            pillars, day_master = self._layout()
+            dict.__setitem__(self, "pillars", pillars)
+            dict.__setitem__(self, "day_master", day_master)
+        else:
+            dict.__setitem__(self, key, value)
+
+    def _removable(self, key: str) -> None:
+        if self._frozen:
+            _read_only(self)
+        if key in _REQUIRED_KEYS:
+            raise TypeError(f"{key!r} cannot be removed from a Chart")
+        self._render()
+
+    def __delitem__(self, key: str) -> None:
+        self._removable(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key: str, *default):
+        self._removable(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._removable(next(reversed(self)))
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._removable("pillars")
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        if self._frozen:
+            _read_only(self)
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Iterable):
+        self.update(other)
+        return self
+
+    # ------------------------------------------------------------------
+    # Copies and identity
+    # ------------------------------------------------------------------
+
+    def copy(self, frozen: bool = False) -> "Chart":
+        """Deep copy of this chart; ``frozen=True`` makes it read-only.
+
+        The pillar layouts are shared read-only dicts, so only ``gender`` and
+        extra entries are copied.
+        """
+        if frozen and self._frozen:
+            return self
+        entries = self._entries()
+        return Chart._create(self.cycles, freeze(entries) if frozen else thaw(entries), frozen)
+
+    def __reduce__(self):
+        return Chart._create, (self.cycles, self._entries(), self._frozen)
+
+    def __repr__(self) -> str:
+        pillars = " ".join(HEAVENLY_STEMS[s] + EARTHLY_BRANCHES[b] for s, b in zip(self.stems, self.branches))
+        return f"Chart({pillars}, {self.gender!r})"
+
+
+ChartLike = Union[Chart, Mapping]
+
+
+def as_chart(chart: ChartLike) -> Chart:
+    """Return ``chart`` itself if it is a ``Chart``, else rebuild one from a dict chart."""
+    if isinstance(chart, Chart):
+        return chart
+    return Chart.from_dict(chart)
@@ -17,22 +17,12 @@ from lunisolar.api import solar_to_lunisolar
 
 from . import terminology
 from .constants import HEAVENLY_STEMS, STEM_POLARITY
-from .core import build_chart
-from .ten_gods import ten_god, weighted_ten_god_distribution
-from .longevity import longevity_map, life_stages_for_chart
-from .nayin import analyze_nayin_interactions
-from .scoring import score_day_master, rate_chart, recommend_useful_god
-from .branch_interactions import detect_branch_interactions
-from .stem_transformations import detect_stem_combinations, detect_transformations
-from .punishments import detect_punishments
-from .symbolic_stars import detect_symbolic_stars, void_in_pillars, void_branches, xun_name
-from .structure import classify_structure
+from .cache import natal_analysis
+from .ten_gods import ten_god
+from .symbolic_stars import void_branches, xun_name
 from .luck_pillars import (
     _luck_direction, find_governing_jie_term, generate_luck_pillars,
 )
-from .analysis import comprehensive_analysis
-from .analysis import detect_missing_elements, detect_competing_frames
-from .narrative import generate_narrative
 from .projections import generate_year_projections, generate_month_projections, generate_day_projections
 from .report import generate_report_markdown
 from .terminology import format_term
@@ -65,32 +55,27 @@ def main() -> None:
     gender = args.gender
 
     dto = solar_to_lunisolar(solar_date, solar_time, quiet=True)
-    chart = build_chart(
+    natal = natal_analysis(
         dto.year_cycle, dto.month_cycle, dto.day_cycle, dto.hour_cycle, gender
     )
-
-    score, strength = score_day_master(chart)
-    interactions = detect_branch_interactions(chart)
-    structure_dict = classify_structure(chart, strength)
-    useful = recommend_useful_god(chart, strength, structure_dict, interactions=interactions)
-    rating = rate_chart(chart)
-    missing_elements = detect_missing_elements(chart)
-    competing_frames = detect_competing_frames(chart, interactions)
-    narrative = generate_narrative(
-        chart, strength, structure_dict, interactions,
-        missing_elements=missing_elements,
-        competing_frames=competing_frames,
-    )
-    lmap = longevity_map(chart)
-    tg_dist = weighted_ten_god_distribution(chart)
-    comprehensive = comprehensive_analysis(chart)
-    symbolic_stars = detect_symbolic_stars(chart)
-    void_status = void_in_pillars(chart)
-    stem_combos = detect_stem_combinations(chart)
-    transformations = detect_transformations(chart)
-    punishments = detect_punishments(chart)
-    nayin_data = analyze_nayin_interactions(chart)
-    life_stages = life_stages_for_chart(chart)
+    chart = natal["chart"]
+
+    score, strength = natal["score"], natal["strength"]
+    interactions = natal["interactions"]
+    structure_dict = natal["structure"]
+    useful = natal["useful_god"]
+    rating = natal["rating"]
+    narrative = natal["narrative"]
+    lmap = natal["longevity_map"]
+    tg_dist = natal["ten_god_distribution"]
+    comprehensive = natal["comprehensive"]
+    symbolic_stars = natal["symbolic_stars"]
+    void_status = natal["void_status"]
+    stem_combos = natal["stem_combinations"]
+    transformations = natal["transformations"]
+    punishments = natal["punishments"]
+    nayin_data = natal["nayin_analysis"]
+    life_stages = natal["life_stages"]
 
     # Luck pillars
     try:
@@ -6,15 +6,14 @@ normalize_gender, ganzhi_from_cycle, _cycle_from_stem_branch, build_chart,
 from_lunisolar_dto, from_solar_date.
 """
 
-from typing import Dict, Tuple, Union
+from typing import Tuple, Union
 
 from shared.models import LunisolarDateDTO
+from shared.sexagenary import STEM_BRANCH_CYCLE
 from lunisolar.api import solar_to_lunisolar
 
-from .constants import HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT
-from .ten_gods import ten_god
-from .hidden_stems import branch_hidden_with_roles
-from .nayin import nayin_for_cycle, _nayin_pure_element
+from .constants import HEAVENLY_STEMS, EARTHLY_BRANCHES
+from .chart import Chart
 
 
 def normalize_gender(gender: Union[str, None]) -> str:
@@ -42,10 +41,10 @@ def _cycle_from_stem_branch(stem: str, branch: str) -> int:
     """Compute sexagenary cycle number (1-60) from stem and branch characters."""
     s_idx = HEAVENLY_STEMS.index(stem)
     b_idx = EARTHLY_BRANCHES.index(branch)
-    for c in range(1, 61):
-        if (c - 1) % 10 == s_idx and (c - 1) % 12 == b_idx:
-            return c
-    raise ValueError(f"Invalid stem-branch pair: {stem}{branch}")
+    cycle = STEM_BRANCH_CYCLE[s_idx][b_idx]
+    if not cycle:
+        raise ValueError(f"Invalid stem-branch pair: {stem}{branch}")
+    return cycle
 
 
 def build_chart(
@@ -54,49 +53,16 @@ def build_chart(
     day_cycle: int,
     hour_cycle: int,
     gender: str,
-) -> Dict:
-    """Build a structured natal chart from four sexagenary cycle numbers."""
-    gender = normalize_gender(gender)
+) -> Chart:
+    """Build a structured natal chart from four sexagenary cycle numbers.
+
+    Returns an integer-coded :class:`~bazi.chart.Chart`, which is also the
+    nested ``{"pillars", "day_master", "gender"}`` dict (JSON-serializable).
+    """
+    return Chart(year_cycle, month_cycle, day_cycle, hour_cycle, normalize_gender(gender))
+
 
-    pillar_cycles = {
-        "year": year_cycle, "month": month_cycle,
-        "day": day_cycle, "hour": hour_cycle,
-    }
-    pillars = {name: ganzhi_from_cycle(c) for name, c in pillar_cycles.items()}
-
-    dm_stem = pillars["day"][0]
-    dm_elem = STEM_ELEMENT[dm_stem]
-
-    chart: Dict = {
-        "pillars": {},
-        "day_master": {"stem": dm_stem, "element": dm_elem},
-        "gender": gender,
-    }
-
-    for name, (stem, branch) in pillars.items():
-        pillar_data: Dict = {
-            "stem": stem,
-            "branch": branch,
-            "hidden": branch_hidden_with_roles(EARTHLY_BRANCHES.index(branch)),
-            "ten_god": ten_god(
-                HEAVENLY_STEMS.index(dm_stem), HEAVENLY_STEMS.index(stem)
-            ),
-        }
-        p_cycle = pillar_cycles[name]
-        ny = nayin_for_cycle(p_cycle)
-        if ny:
-            pillar_data["nayin"] = {
-                "element": _nayin_pure_element(ny["nayin_element"]),
-                "chinese": ny["nayin_chinese"],
-                "vietnamese": ny["nayin_vietnamese"],
-                "english": ny["nayin_english"],
-            }
-        chart["pillars"][name] = pillar_data
-
-    return chart
-
-
-def from_lunisolar_dto(dto: LunisolarDateDTO, gender: str) -> Dict:
+def from_lunisolar_dto(dto: LunisolarDateDTO, gender: str) -> Chart:
     """Build a Bazi chart from a :class:`LunisolarDateDTO`."""
     gender = normalize_gender(gender)
     return build_chart(
@@ -110,7 +76,7 @@ def from_solar_date(
     solar_time: str = "12:00",
     gender: str = "male",
     timezone_name: str = "Asia/Shanghai",
-) -> Dict:
+) -> Chart:
     """Build a Bazi chart from a Gregorian date using the lunisolar engine."""
     gender = normalize_gender(gender)
     dto = solar_to_lunisolar(solar_date, solar_time, timezone_name, quiet=True)
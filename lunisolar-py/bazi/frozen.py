@@ -0,0 +1,82 @@
+"""
+Read-only Containers
+====================
+
+``FrozenDict`` / ``FrozenList`` are ``dict`` / ``list`` subclasses whose
+mutators raise ``TypeError``, so shared results (cached analyses, the dict
+view of a ``Chart``) compare equal to and serialize like plain containers
+but cannot be modified in place.  ``freeze()`` / ``thaw()`` convert whole
+nested results.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Tuple, Type
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is read-only; use thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """Read-only ``dict``."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """Read-only ``list``."""
+
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+# Mapping types frozen / thawed through their own ``copy(frozen=...)``
+_SELF_FREEZING: Tuple[Type, ...] = ()
+
+
+def self_freezing(cls: Type) -> Type:
+    """Class decorator: ``freeze``/``thaw`` use ``cls.copy(frozen=...)``."""
+    global _SELF_FREEZING
+    _SELF_FREEZING += (cls,)
+    return cls
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts, lists and sets into read-only equivalents.
+
+    ``bazi.chart.Chart`` is replaced by its frozen copy; any other mapping
+    becomes a ``FrozenDict``.
+    """
+    if isinstance(value, _SELF_FREEZING):
+        return value.copy(frozen=True)
+    if isinstance(value, Mapping):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    if isinstance(value, tuple):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen result (frozensets are left as they are)."""
+    if isinstance(value, _SELF_FREEZING):
+        return value.copy(frozen=False)
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(thaw(v) for v in value)
+    return value
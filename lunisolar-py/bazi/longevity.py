@@ -10,31 +10,34 @@ from .constants import (
     LONGEVITY_STAGES, LONGEVITY_START,
     LONGEVITY_STAGES_EN, LONGEVITY_STAGES_VI,
 )
+from .chart import PILLAR_NAMES, BRANCH_INDEX, as_chart
 
 
-def changsheng_stage(stem_idx: int, branch_idx: int) -> Tuple[int, str]:
-    """Return (1-based stage index, stage name) for the stem at branch."""
+def _stage_index(stem_idx: int, branch_idx: int) -> int:
     stem = HEAVENLY_STEMS[stem_idx]
-    start = LONGEVITY_START[stem]
-    i_start = EARTHLY_BRANCHES.index(start)
-
+    i_start = EARTHLY_BRANCHES.index(LONGEVITY_START[stem])
     if STEM_POLARITY[stem] == "Yang":
-        offset = (branch_idx - i_start) % 12
-    else:
-        offset = (i_start - branch_idx) % 12
+        return (branch_idx - i_start) % 12 + 1
+    return (i_start - branch_idx) % 12 + 1
 
-    idx = offset + 1
+
+# [stem][branch] -> 1-based longevity stage index
+LONGEVITY_TABLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_stage_index(s, b) for b in range(12)) for s in range(10)
+)
+
+
+def changsheng_stage(stem_idx: int, branch_idx: int) -> Tuple[int, str]:
+    """Return (1-based stage index, stage name) for the stem at branch."""
+    idx = LONGEVITY_TABLE[stem_idx][branch_idx % 12]
     return idx, LONGEVITY_STAGES[idx - 1]
 
 
 def longevity_map(chart: Dict) -> Dict[str, Tuple[int, str]]:
     """Map the Day Master's 12 Longevity Stage across all four natal pillars."""
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    result: Dict[str, Tuple[int, str]] = {}
-    for name, p in chart["pillars"].items():
-        b_idx = EARTHLY_BRANCHES.index(p["branch"])
-        result[name] = changsheng_stage(dm_idx, b_idx)
-    return result
+    c = as_chart(chart)
+    dm_idx = c.day_master
+    return {name: changsheng_stage(dm_idx, b) for name, b in zip(PILLAR_NAMES, c.branches)}
 
 
 def life_stage_detail(stem_idx: int, branch_idx: int) -> Dict:
@@ -51,16 +54,11 @@ def life_stage_detail(stem_idx: int, branch_idx: int) -> Dict:
 
 def life_stages_for_chart(chart: Dict) -> Dict[str, Dict]:
     """Return the Day Master's life stage at each natal pillar."""
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    result: Dict[str, Dict] = {}
-    for pname, p in chart["pillars"].items():
-        b_idx = EARTHLY_BRANCHES.index(p["branch"])
-        result[pname] = life_stage_detail(dm_idx, b_idx)
-    return result
+    c = as_chart(chart)
+    dm_idx = c.day_master
+    return {name: life_stage_detail(dm_idx, b) for name, b in zip(PILLAR_NAMES, c.branches)}
 
 
 def life_stage_for_luck_pillar(chart: Dict, luck_pillar: Dict) -> Dict:
     """Return the Day Master's life stage at a luck pillar."""
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    b_idx = EARTHLY_BRANCHES.index(luck_pillar["branch"])
-    return life_stage_detail(dm_idx, b_idx)
+    return life_stage_detail(as_chart(chart).day_master, BRANCH_INDEX[luck_pillar["branch"]])
@@ -6,8 +6,9 @@ Luck Pillar Calculation (大运) — spec §5
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
-from .constants import HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_POLARITY
-from .core import normalize_gender, ganzhi_from_cycle, _cycle_from_stem_branch
+from .constants import HEAVENLY_STEMS, EARTHLY_BRANCHES
+from .chart import as_chart
+from .core import normalize_gender
 from .longevity import changsheng_stage, life_stage_detail
 from .ten_gods import ten_god
 from .nayin import nayin_for_cycle, _nayin_pure_element
@@ -21,22 +22,11 @@ except ImportError:
 from ephemeris.solar_terms import calculate_solar_terms
 
 
-def _next_ganzhi(stem: str, branch: str, forward: bool = True) -> Tuple[str, str]:
-    """Advance (or retreat) one position in the sexagenary cycle."""
-    s_idx = HEAVENLY_STEMS.index(stem)
-    b_idx = EARTHLY_BRANCHES.index(branch)
-    delta = 1 if forward else -1
-    return (
-        HEAVENLY_STEMS[(s_idx + delta) % 10],
-        EARTHLY_BRANCHES[(b_idx + delta) % 12],
-    )
-
-
 def _luck_direction(chart: Dict) -> bool:
     """Return *True* if luck pillars advance forward (clockwise)."""
-    year_stem = chart["pillars"]["year"]["stem"]
-    gender = normalize_gender(chart.get("gender", "male"))
-    is_yang = STEM_POLARITY[year_stem] == "Yang"
+    c = as_chart(chart)
+    gender = normalize_gender(c.gender)
+    is_yang = c.stems[0] % 2 == 0  # even stem indexes are Yang
     return (is_yang and gender == "male") or (not is_yang and gender == "female")
 
 
@@ -84,8 +74,9 @@ def generate_luck_pillars(
     birth_year: Optional[int] = None,
 ) -> List[Dict]:
     """Generate *count* Luck Pillars (大运) from the month pillar."""
-    forward = _luck_direction(chart)
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
+    c = as_chart(chart)
+    forward = _luck_direction(c)
+    dm_idx = c.day_master
 
     start_years: Optional[int] = None
     start_months: int = 0
@@ -104,21 +95,19 @@ def generate_luck_pillars(
     elif birth_year is not None:
         effective_birth_year = birth_year
 
-    stem = chart["pillars"]["month"]["stem"]
-    branch = chart["pillars"]["month"]["branch"]
+    step = 1 if forward else -1
+    lp_cycle = c.cycles[1]
     pillars: List[Dict] = []
     for i in range(count):
-        stem, branch = _next_ganzhi(stem, branch, forward)
-        b_idx = EARTHLY_BRANCHES.index(branch)
-        s_idx = HEAVENLY_STEMS.index(stem)
+        lp_cycle = (lp_cycle - 1 + step) % 60 + 1
+        s_idx, b_idx = (lp_cycle - 1) % 10, (lp_cycle - 1) % 12
         entry: Dict = {
-            "stem": stem,
-            "branch": branch,
+            "stem": HEAVENLY_STEMS[s_idx],
+            "branch": EARTHLY_BRANCHES[b_idx],
             "longevity_stage": changsheng_stage(dm_idx, b_idx),
             "ten_god": ten_god(dm_idx, s_idx),
             "life_stage_detail": life_stage_detail(dm_idx, b_idx),
         }
-        lp_cycle = _cycle_from_stem_branch(stem, branch)
         lp_nayin = nayin_for_cycle(lp_cycle)
         if lp_nayin:
             entry["nayin"] = {
@@ -0,0 +1,172 @@
+"""
+Columnar Projection Engine
+==========================
+
+Everything a year / month / day projection reports about a dynamic pillar
+is a function of two small integers: the Day Master stem and the pillar's
+cycle number (ten god, life stage, strength delta), or the natal branch
+mask and the pillar's branch (interactions).  Those are precomputed
+tables, so projecting any number of pillars is a few fancy-indexing
+operations over an array of cycle numbers::
+
+    projector = Projector(chart)
+    records = projector.project(day_cycles)       # PROJECTION_DTYPE array
+    records['interactions'] & CHONG               # clash days, no dicts built
+    list(projector.iter_fields(records))          # render only what is shown
+
+Ten gods are coded by their index in ``TEN_GOD_NAMES`` and life stages by
+their 1-based index in ``LONGEVITY_STAGES``; interactions are
+``bazi.branch_masks`` pair flags OR-ed over the natal branches.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from shared.sexagenary import DAY_CYCLE_ANCHOR_ORDINAL
+
+from .constants import (
+    HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT, BRANCH_ELEMENT,
+    GEN_MAP, CONTROL_MAP,
+)
+from .branch_masks import HE, CHONG, HAI, PO, AN, GONG, BAN, PAIR_FLAGS, pair_tag_table
+from .chart import ChartLike, as_chart
+from .longevity import LONGEVITY_TABLE, life_stage_detail
+from .ten_gods import TEN_GOD_TABLE
+
+PROJECTION_DTYPE = np.dtype([
+    ('cycle', np.int8),
+    ('ten_god', np.int8),
+    ('life_stage', np.int8),
+    ('interactions', np.uint8),
+    ('strength_delta', np.int8),
+])
+
+# Ten-God names in code order (relative to a 甲 Day Master: 甲..癸)
+TEN_GOD_NAMES: Tuple[str, ...] = TEN_GOD_TABLE[0]
+_TEN_GOD_CODE = {name: i for i, name in enumerate(TEN_GOD_NAMES)}
+
+# Relation flags of the ``interactions`` column, in reporting order
+INTERACTION_FLAG_NAMES: Tuple[Tuple[int, str], ...] = (
+    (HE, "六合"), (CHONG, "六冲"), (HAI, "害"), (PO, "六破"),
+    (AN, "暗合"), (GONG, "拱合"), (BAN, "半三合"),
+)
+
+
+def _strength_delta(dm_elem: str, stem: str, branch: str) -> int:
+    """Compute approximate Day-Master strength delta from a pillar."""
+    delta = 0
+    elem_stem = STEM_ELEMENT[stem]
+    elem_branch = BRANCH_ELEMENT[branch]
+
+    if GEN_MAP.get(elem_stem) == dm_elem or elem_stem == dm_elem:
+        delta += 1
+    elif CONTROL_MAP.get(elem_stem) == dm_elem or GEN_MAP.get(dm_elem) == elem_stem:
+        delta -= 1
+
+    if GEN_MAP.get(elem_branch) == dm_elem or elem_branch == dm_elem:
+        delta += 2
+    elif CONTROL_MAP.get(elem_branch) == dm_elem or GEN_MAP.get(dm_elem) == elem_branch:
+        delta -= 2
+
+    return delta
+
+
+def _cycle_table(value) -> np.ndarray:
+    """[day master stem, cycle 1..60] table (column 0 unused, -1)."""
+    table = np.full((10, 61), -1, dtype=np.int8)
+    for dm in range(10):
+        for cycle in range(1, 61):
+            table[dm, cycle] = value(dm, (cycle - 1) % 10, (cycle - 1) % 12)
+    return table
+
+
+# [day master stem, cycle] -> ten-god code / 1-based life stage / strength delta
+TEN_GOD_BY_CYCLE = _cycle_table(lambda dm, s, b: _TEN_GOD_CODE[TEN_GOD_TABLE[dm][s]])
+LIFE_STAGE_BY_CYCLE = _cycle_table(lambda dm, s, b: LONGEVITY_TABLE[dm][b])
+STRENGTH_DELTA_BY_CYCLE = _cycle_table(
+    lambda dm, s, b: _strength_delta(
+        STEM_ELEMENT[HEAVENLY_STEMS[dm]], HEAVENLY_STEMS[s], EARTHLY_BRANCHES[b],
+    )
+)
+
+# [natal branch mask (12 bits), branch] -> pair flags the branch forms with the mask
+_PAIR = np.array(PAIR_FLAGS, dtype=np.uint8)
+_MASKS = np.arange(4096)
+INTERACTION_TABLE = np.zeros((4096, 12), dtype=np.uint8)
+for _b in range(12):
+    INTERACTION_TABLE[(_MASKS >> _b) & 1 == 1] |= _PAIR[_b]
+
+for _table in (TEN_GOD_BY_CYCLE, LIFE_STAGE_BY_CYCLE, STRENGTH_DELTA_BY_CYCLE, INTERACTION_TABLE):
+    _table.setflags(write=False)
+
+_STEM_OF_CYCLE: Tuple[str, ...] = tuple(HEAVENLY_STEMS[(c - 1) % 10] for c in range(61))
+_BRANCH_OF_CYCLE: Tuple[str, ...] = tuple(EARTHLY_BRANCHES[(c - 1) % 12] for c in range(61))
+
+
+def day_cycles(first_ordinal: int, count: int) -> np.ndarray:
+    """Day pillar cycle numbers of ``count`` consecutive civil days from an ordinal."""
+    ordinals = np.arange(first_ordinal, first_ordinal + count, dtype=np.int64)
+    return ((ordinals - DAY_CYCLE_ANCHOR_ORDINAL) % 60 + 1).astype(np.int8)
+
+
+def year_cycles(first_year: int, count: int) -> np.ndarray:
+    """Year pillar cycle numbers of ``count`` consecutive years (甲子 = 1984)."""
+    years = np.arange(first_year, first_year + count, dtype=np.int64)
+    return ((years - 1984) % 60 + 1).astype(np.int8)
+
+
+class Projector:
+    """Per-chart projection of dynamic pillars into columnar records."""
+
+    __slots__ = ("chart", "day_master", "natal_mask", "pair_tags", "_stages")
+
+    def __init__(self, chart: ChartLike):
+        self.chart = as_chart(chart)
+        self.day_master = self.chart.day_master
+        self.natal_mask = self.chart.branch_mask
+        # Ordered 冲/合/害 tags per dynamic branch, one per natal pillar involved
+        self.pair_tags = pair_tag_table(self.chart.branches)
+        self._stages = tuple(life_stage_detail(self.day_master, b) for b in range(12))
+
+    def project(self, cycles) -> np.ndarray:
+        """``PROJECTION_DTYPE`` records for an array of cycle numbers (1..60)."""
+        cycles = np.asarray(cycles, dtype=np.intp)
+        if cycles.size and (cycles.min() < 1 or cycles.max() > 60):
+            raise ValueError("Cycle numbers must be between 1 and 60")
+        dm = self.day_master
+        out = np.empty(cycles.shape, dtype=PROJECTION_DTYPE)
+        out['cycle'] = cycles
+        out['ten_god'] = TEN_GOD_BY_CYCLE[dm, cycles]
+        out['life_stage'] = LIFE_STAGE_BY_CYCLE[dm, cycles]
+        out['interactions'] = INTERACTION_TABLE[self.natal_mask, (cycles - 1) % 12]
+        out['strength_delta'] = STRENGTH_DELTA_BY_CYCLE[dm, cycles]
+        return out
+
+    def fields(self, cycle: int, ten_god: int, life_stage: int, strength_delta: int) -> Dict:
+        """Projection entry fields (``cycle`` .. ``strength_delta``) of one record."""
+        stem, branch = _STEM_OF_CYCLE[cycle], _BRANCH_OF_CYCLE[cycle]
+        return {
+            "cycle": cycle,
+            "stem": stem,
+            "branch": branch,
+            "ganzhi": stem + branch,
+            "ten_god": TEN_GOD_NAMES[ten_god],
+            "life_stage": dict(self._stages[(cycle - 1) % 12]),
+            "interactions": list(self.pair_tags[(cycle - 1) % 12]),
+            "strength_delta": strength_delta,
+        }
+
+    def iter_fields(self, records: np.ndarray) -> Iterator[Dict]:
+        """Render records to entry-field dicts, one at a time."""
+        columns = (
+            records['cycle'].tolist(), records['ten_god'].tolist(),
+            records['life_stage'].tolist(), records['strength_delta'].tolist(),
+        )
+        for row in zip(*columns):
+            yield self.fields(*row)
+
+
+def interaction_names(flags: int) -> List[str]:
+    """Names of the relation flags set in an ``interactions`` value."""
+    return [name for flag, name in INTERACTION_FLAG_NAMES if flags & flag]
@@ -4,16 +4,11 @@ Time Projection Functions (Year / Month / Day)
 """
 
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
-
-from .constants import (
-    HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT, BRANCH_ELEMENT,
-    GEN_MAP, CONTROL_MAP, LIU_CHONG, LIU_HE, LIU_HAI,
-)
-from .core import ganzhi_from_cycle
-from .ten_gods import ten_god
-from .longevity import life_stage_detail
+from itertools import islice, takewhile
+from typing import Dict, Iterable, Iterator, List, Optional
+
 from .nayin import nayin_for_cycle, _nayin_pure_element
+from .projection_engine import Projector, day_cycles, year_cycles
 from .punishments import detect_fu_yin_duplication
 
 try:
@@ -27,6 +22,12 @@ from lunisolar.api import solar_to_lunisolar, solar_to_lunisolar_batch
 from ephemeris.moon_phases import calculate_moon_phases
 
 
+_LUNAR_YEAR_WINDOW_DAYS = 390   # moon-phase search window (13 synodic months and change)
+_MONTHS_PER_BATCH = 13          # target dates converted per solar_to_lunisolar_batch call
+_DAYS_PER_CHUNK = 366
+_YEARS_PER_CHUNK = 60
+
+
 def get_year_cycle_for_gregorian(year: int) -> int:
     """Get the sexagenary cycle number for a Gregorian year (立春 based)."""
     base_year = 1984
@@ -47,254 +48,197 @@ def get_day_cycle_for_date(solar_date: str, solar_time: str = "12:00") -> int:
     return dto.day_cycle
 
 
-def get_new_moon_dates(start_date: date, count: int = 36) -> List[date]:
-    """Return the next *count* new moon solar dates on or after *start_date*."""
-    results: List[date] = []
+def iter_new_moon_dates(start_date: date) -> Iterator[date]:
+    """Yield new moon solar dates on or after *start_date*, one lunar year of phases at a time."""
     window_start = datetime(
         start_date.year, start_date.month, start_date.day, tzinfo=utc
     )
-    while len(results) < count:
-        window_end = window_start + timedelta(days=365 * 3)
-        phases = calculate_moon_phases(window_start, window_end)
-        for ts, phase_idx, _name in phases:
+    last: Optional[date] = None
+    while True:
+        window_end = window_start + timedelta(days=_LUNAR_YEAR_WINDOW_DAYS)
+        for ts, phase_idx, _name in calculate_moon_phases(window_start, window_end):
             if phase_idx == 0:  # New Moon
                 nm_date = datetime.fromtimestamp(ts, tz=utc).date()
                 if nm_date >= start_date:
-                    results.append(nm_date)
-        if results:
-            last = results[-1]
+                    last = nm_date
+                    yield nm_date
+        if last is not None:
             window_start = datetime(
                 last.year, last.month, last.day, tzinfo=utc
             ) + timedelta(days=1)
         else:
             window_start = window_end
-    return results[:count]
-
 
-def _strength_delta(dm_elem: str, stem: str, branch: str) -> int:
-    """Compute approximate Day-Master strength delta from a pillar."""
-    delta = 0
-    elem_stem = STEM_ELEMENT[stem]
-    elem_branch = BRANCH_ELEMENT[branch]
 
-    if GEN_MAP.get(elem_stem) == dm_elem or elem_stem == dm_elem:
-        delta += 1
-    elif CONTROL_MAP.get(elem_stem) == dm_elem or GEN_MAP.get(dm_elem) == elem_stem:
-        delta -= 1
-
-    if GEN_MAP.get(elem_branch) == dm_elem or elem_branch == dm_elem:
-        delta += 2
-    elif CONTROL_MAP.get(elem_branch) == dm_elem or GEN_MAP.get(dm_elem) == elem_branch:
-        delta -= 2
+def get_new_moon_dates(start_date: date, count: int = 36) -> List[date]:
+    """Return the next *count* new moon solar dates on or after *start_date*."""
+    return list(islice(iter_new_moon_dates(start_date), count))
 
-    return delta
 
+# ── Streaming projections ────────────────────────────────────
 
-def generate_year_projections(
-    chart: Dict, start_year: int, end_year: int
-) -> List[Dict]:
-    """Generate year-by-year projections from start_year up to end_year."""
-    projections: List[Dict] = []
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    dm_elem = chart["day_master"]["element"]
-
-    natal_branches = [p["branch"] for p in chart["pillars"].values()]
-
-    for year in range(start_year, end_year + 1):
-        cycle = get_year_cycle_for_gregorian(year)
-        if cycle < 1 or cycle > 60:
-            cycle = ((cycle - 1) % 60) + 1
-
-        stem, branch = ganzhi_from_cycle(cycle)
-        b_idx = EARTHLY_BRANCHES.index(branch)
-
-        interactions: List[str] = []
-        for b in natal_branches:
-            pair = frozenset({b, branch})
-            if pair in LIU_CHONG:
-                interactions.append("冲")
-            if pair in LIU_HE:
-                interactions.append("合")
-            if pair in LIU_HAI:
-                interactions.append("害")
-
-        life_stage = life_stage_detail(dm_idx, b_idx)
-        tg = ten_god(dm_idx, HEAVENLY_STEMS.index(stem))
-        nayin = nayin_for_cycle(cycle)
-
-        delta = _strength_delta(dm_elem, stem, branch)
-
-        entry: Dict = {
-            "year": year,
-            "cycle": cycle,
-            "stem": stem,
-            "branch": branch,
-            "ganzhi": stem + branch,
-            "ten_god": tg,
-            "life_stage": life_stage,
-            "interactions": interactions,
-            "strength_delta": delta,
-        }
-        if nayin:
-            entry["nayin"] = {
-                "element": _nayin_pure_element(nayin["nayin_element"]),
-                "chinese": nayin["nayin_chinese"],
-            }
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
 
-        fu_yin_duplication = detect_fu_yin_duplication(
-            chart, {"stem": stem, "branch": branch}
-        )
-        if fu_yin_duplication:
-            entry["fu_yin_duplication"] = fu_yin_duplication
 
-        projections.append(entry)
+def _stepped_dates(start_date: date, end_date: Optional[date], step_days: int) -> Iterator[date]:
+    """start_date, start_date + step, ... up to the first date on or after end_date."""
+    current = start_date
+    while True:
+        yield current
+        if end_date and current >= end_date:
+            return
+        current += timedelta(days=step_days)
+
+
+def iter_year_projections(
+    chart: Dict, start_year: int, end_year: Optional[int] = None
+) -> Iterator[Dict]:
+    """Yield year projections from start_year through end_year (open-ended if None)."""
+    projector = Projector(chart)
+    year = start_year
+    while end_year is None or year <= end_year:
+        count = _YEARS_PER_CHUNK if end_year is None else min(_YEARS_PER_CHUNK, end_year - year + 1)
+        records = projector.project(year_cycles(year, count))
+        for fields in projector.iter_fields(records):
+            entry: Dict = {"year": year, **fields}
+            cycle = fields["cycle"]
+            nayin = nayin_for_cycle(cycle)
+            if nayin:
+                entry["nayin"] = {
+                    "element": _nayin_pure_element(nayin["nayin_element"]),
+                    "chinese": nayin["nayin_chinese"],
+                }
+
+            if projector.chart.has_branch((cycle - 1) % 12):
+                fu_yin_duplication = detect_fu_yin_duplication(
+                    chart, {"stem": fields["stem"], "branch": fields["branch"]}
+                )
+                if fu_yin_duplication:
+                    entry["fu_yin_duplication"] = fu_yin_duplication
 
-    return projections
+            yield entry
+            year += 1
 
 
-def generate_month_projections(
+def iter_month_projections(
     chart: Dict,
     start_date: date,
-    end_date: Optional[date],
+    end_date: Optional[date] = None,
     use_new_moons: bool = True,
-) -> List[Dict]:
-    """Generate month-by-month projections."""
-    projections: List[Dict] = []
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    dm_elem = chart["day_master"]["element"]
-
+) -> Iterator[Dict]:
+    """Yield month projections from start_date, converting about one lunar year per batch.
+
+    With ``use_new_moons`` each entry is a new moon (00:00); otherwise dates
+    step by 30 days (12:00) up to the first one on or after *end_date*.  New
+    moons stop after *end_date* when given.  Without *end_date* the stream
+    is unbounded: take what you need (``itertools.islice``).
+    """
+    projector = Projector(chart)
     if use_new_moons:
-        target_dates = get_new_moon_dates(start_date, 36)
-        date_tuples = [(dt.strftime("%Y-%m-%d"), "00:00") for dt in target_dates]
-        lunisolar_infos = solar_to_lunisolar_batch(date_tuples, quiet=True) if date_tuples else []
+        target_dates: Iterable[date] = iter_new_moon_dates(start_date)
+        if end_date:
+            target_dates = takewhile(lambda dt: dt <= end_date, target_dates)
+        solar_time = "00:00"
     else:
-        target_dates = []
-        current = start_date
-        max_entries = 1200
-        count = 0
-        while count < max_entries:
-            target_dates.append(current)
-            if end_date and current >= end_date:
-                break
-            current = current + timedelta(days=30)
-            count += 1
-        date_tuples = [(dt.strftime("%Y-%m-%d"), "12:00") for dt in target_dates]
-        lunisolar_infos = solar_to_lunisolar_batch(date_tuples, quiet=True) if date_tuples else []
-
-    if not target_dates:
-        return []
-
-    natal_branches = [p["branch"] for p in chart["pillars"].values()]
-
-    for i, (dt, dto) in enumerate(zip(target_dates, lunisolar_infos)):
-        try:
-            month_cycle = dto.month_cycle
-            stem, branch = ganzhi_from_cycle(month_cycle)
-            b_idx = EARTHLY_BRANCHES.index(branch)
-
-            interactions: List[str] = []
-            for b in natal_branches:
-                pair = frozenset({b, branch})
-                if pair in LIU_CHONG:
-                    interactions.append("冲")
-                if pair in LIU_HE:
-                    interactions.append("合")
-                if pair in LIU_HAI:
-                    interactions.append("害")
-
-            life_stage = life_stage_detail(dm_idx, b_idx)
-            tg = ten_god(dm_idx, HEAVENLY_STEMS.index(stem))
-            delta = _strength_delta(dm_elem, stem, branch)
+        target_dates = _stepped_dates(start_date, end_date, 30)
+        solar_time = "12:00"
 
+    month_num = 0
+    for chunk in _chunks(target_dates, _MONTHS_PER_BATCH):
+        dtos = solar_to_lunisolar_batch(
+            [(dt.strftime("%Y-%m-%d"), solar_time) for dt in chunk], quiet=True,
+        )
+        records = projector.project([dto.month_cycle for dto in dtos])
+        for dt, dto, fields in zip(chunk, dtos, projector.iter_fields(records)):
+            month_num += 1
             entry: Dict = {
-                "month_num": i + 1,
+                "month_num": month_num,
                 "solar_date": dt.strftime("%Y-%m-%d"),
                 "date": dt.strftime("%Y-%m-%d"),
                 "year": dt.year,
                 "month": dt.month,
-                "cycle": month_cycle,
-                "stem": stem,
-                "branch": branch,
-                "ganzhi": stem + branch,
-                "ten_god": tg,
-                "life_stage": life_stage,
-                "interactions": interactions,
-                "strength_delta": delta,
+                **fields,
             }
             if use_new_moons:
                 leap_tag = "*" if dto.is_leap_month else ""
                 entry["lunisolar_date"] = (
                     dto.year, dto.month, dto.day, dto.is_leap_month, leap_tag,
                 )
-            projections.append(entry)
-        except Exception:
-            pass
+            yield entry
+
+
+def iter_day_projections(
+    chart: Dict, start_date: date, end_date: Optional[date] = None
+) -> Iterator[Dict]:
+    """Yield day projections from start_date through end_date (open-ended if None).
+
+    Day pillars follow the civil date, so cycle numbers come straight from
+    date ordinals (one year of days per chunk) with no lunisolar conversion.
+    A start after *end_date* yields the start day only.
+    """
+    projector = Projector(chart)
+    first = start_date.toordinal()
+    last = max(end_date.toordinal(), first) if end_date else None
+
+    ordinal = first
+    while last is None or ordinal <= last:
+        count = _DAYS_PER_CHUNK if last is None else min(_DAYS_PER_CHUNK, last - ordinal + 1)
+        records = projector.project(day_cycles(ordinal, count))
+        for fields in projector.iter_fields(records):
+            dt = date.fromordinal(ordinal)
+            yield {
+                "day_num": ordinal - first + 1,
+                "date": dt.strftime("%Y-%m-%d"),
+                "weekday": dt.strftime("%a"),
+                **fields,
+            }
+            ordinal += 1
 
-    return projections
 
+# ── List projections ─────────────────────────────────────────
 
-def generate_day_projections(
-    chart: Dict, start_date: date, end_date: Optional[date]
+def generate_year_projections(
+    chart: Dict, start_year: int, end_year: int
 ) -> List[Dict]:
-    """Generate day-by-day projections up to end_date (or a default of 100 days)."""
-    projections: List[Dict] = []
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    dm_elem = chart["day_master"]["element"]
+    """Generate year-by-year projections from start_year up to end_year."""
+    return list(iter_year_projections(chart, start_year, end_year))
 
-    target_dates: List[date] = []
-    current = start_date
-    max_days = 100 if not end_date else 4000
-    count = 0
 
-    while count < max_days:
-        target_dates.append(current)
-        if end_date and current >= end_date:
-            break
-        current += timedelta(days=1)
-        count += 1
-
-    date_tuples = [(dt.strftime("%Y-%m-%d"), "12:00") for dt in target_dates]
-    if not date_tuples:
-        return []
-
-    dtos = solar_to_lunisolar_batch(date_tuples, quiet=True)
-    natal_branches = [p["branch"] for p in chart["pillars"].values()]
-
-    for i, (dt, dto) in enumerate(zip(target_dates, dtos)):
-        try:
-            day_cycle = dto.day_cycle
-            stem, branch = ganzhi_from_cycle(day_cycle)
-            b_idx = EARTHLY_BRANCHES.index(branch)
-
-            interactions: List[str] = []
-            for b in natal_branches:
-                pair = frozenset({b, branch})
-                if pair in LIU_CHONG:
-                    interactions.append("冲")
-                if pair in LIU_HE:
-                    interactions.append("合")
-                if pair in LIU_HAI:
-                    interactions.append("害")
-
-            life_stage = life_stage_detail(dm_idx, b_idx)
-            tg = ten_god(dm_idx, HEAVENLY_STEMS.index(stem))
-            delta = _strength_delta(dm_elem, stem, branch)
+def generate_month_projections(
+    chart: Dict,
+    start_date: date,
+    end_date: Optional[date],
+    use_new_moons: bool = True,
+) -> List[Dict]:
+    """Generate month-by-month projections.
+
+    New-moon projections cover the next 36 new moons.  Otherwise dates step
+    by 30 days through *end_date*, or for 1200 steps when it is None; use
+    :func:`iter_month_projections` to stream longer spans.
+    """
+    if use_new_moons:
+        return list(islice(iter_month_projections(chart, start_date, None, True), 36))
+    months = iter_month_projections(chart, start_date, end_date, use_new_moons=False)
+    if end_date is None:
+        months = islice(months, 1200)
+    return list(months)
 
-            entry: Dict = {
-                "day_num": i + 1,
-                "date": dt.strftime("%Y-%m-%d"),
-                "weekday": dt.strftime("%a"),
-                "cycle": day_cycle,
-                "stem": stem,
-                "branch": branch,
-                "ganzhi": stem + branch,
-                "ten_god": tg,
-                "life_stage": life_stage,
-                "interactions": interactions,
-                "strength_delta": delta,
-            }
-            projections.append(entry)
-        except Exception:
-            pass
 
-    return projections
+def generate_day_projections(
+    chart: Dict, start_date: date, end_date: Optional[date]
+) -> List[Dict]:
+    """Generate day-by-day projections through end_date (or a default of 100 days).
+
+    Spans of any length are returned in full; use :func:`iter_day_projections`
+    to stream them instead of materializing the list.
+    """
+    days = iter_day_projections(chart, start_date, end_date)
+    if end_date is None:
+        days = islice(days, 100)
+    return list(days)
@@ -6,9 +6,10 @@ Day-Master Scoring, Chart Rating & Useful God (用神)
 from typing import Dict, List, Optional, Tuple, Union
 
 from .constants import (
-    HEAVENLY_STEMS, STEM_ELEMENT, BRANCH_ELEMENT,
-    GEN_MAP, CONTROL_MAP, PILLAR_WEIGHTS, LU_MAP,
+    HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT, BRANCH_ELEMENT,
+    GEN_MAP, CONTROL_MAP, PILLAR_WEIGHTS, LU_MAP, HIDDEN_ROLES,
 )
+from .chart import PILLAR_NAMES, STEM_ELEMENTS, as_chart
 from .branch_interactions import detect_branch_interactions
 from .structure import classify_structure
 
@@ -43,11 +44,11 @@ def score_day_master(
     Classifications: extreme_strong / strong / balanced / weak / extreme_weak.
     Optionally integrates interaction and rooting data for more accurate scoring.
     """
-    dm_stem = chart["day_master"]["stem"]
-    dm_elem = chart["day_master"]["element"]
+    c = as_chart(chart)
+    dm_elem = STEM_ELEMENTS[c.day_master]
     inverse_gen = {v: k for k, v in GEN_MAP.items()}
     resource_elem = inverse_gen[dm_elem]
-    month_branch = chart["pillars"]["month"]["branch"]
+    month_branch = EARTHLY_BRANCHES[c.branches[1]]
     month_elem = BRANCH_ELEMENT[month_branch]
 
     score = 0.0
@@ -62,10 +63,10 @@ def score_day_master(
         # Use pre-computed rooting strength
         score += rooting.get("total_strength", 0)
     else:
-        for pname, p in chart["pillars"].items():
+        for pname, hidden in zip(PILLAR_NAMES, c.hidden):
             w = PILLAR_WEIGHTS.get(pname, 1.0)
-            for role, stem in p["hidden"]:
-                if STEM_ELEMENT[stem] == dm_elem:
+            for role, stem in zip(HIDDEN_ROLES, hidden):
+                if STEM_ELEMENTS[stem] == dm_elem:
                     if role == "main":
                         score += 2 * w
                     elif role == "middle":
@@ -74,10 +75,10 @@ def score_day_master(
                         score += 0.5 * w
 
     # 2b) Resource element support (印星 — element that generates DM)
-    for pname, p in chart["pillars"].items():
+    for pname, hidden in zip(PILLAR_NAMES, c.hidden):
         w = PILLAR_WEIGHTS.get(pname, 1.0)
-        for role, stem in p["hidden"]:
-            if STEM_ELEMENT[stem] == resource_elem:
+        for role, stem in zip(HIDDEN_ROLES, hidden):
+            if STEM_ELEMENTS[stem] == resource_elem:
                 if role == "main":
                     score += 1.2 * w
                 elif role == "middle":
@@ -86,9 +87,9 @@ def score_day_master(
                     score += 0.3 * w
 
     # 3) Visible stem support (peers + resource)
-    for pname, p in chart["pillars"].items():
+    for pname, stem in zip(PILLAR_NAMES, c.stems):
         w = PILLAR_WEIGHTS.get(pname, 1.0)
-        s_elem = STEM_ELEMENT[p["stem"]]
+        s_elem = STEM_ELEMENTS[stem]
         if s_elem == dm_elem:
             score += 1 * w
         elif s_elem == resource_elem:
@@ -135,10 +136,11 @@ def score_day_master(
 
 def rate_chart(chart: Dict) -> int:
     """Quantitative 100-point chart rating."""
+    c = as_chart(chart)
     total = 0
 
     # 1. Strength balance (max 30, 5 tiers)
-    _score, strength = score_day_master(chart)
+    _score, strength = score_day_master(c)
     strength_points = {
         "balanced": 30,
         "strong": 22,
@@ -149,7 +151,7 @@ def rate_chart(chart: Dict) -> int:
     total += strength_points.get(strength, 15)
 
     # 2. Structure purity (max 25)
-    struct_dict = classify_structure(chart, strength)
+    struct_dict = classify_structure(c, strength)
     s_score = struct_dict.get("dominance_score", 0)
     is_broken = struct_dict.get("is_broken", False)
     composite = struct_dict.get("composite")
@@ -167,20 +169,20 @@ def rate_chart(chart: Dict) -> int:
 
     # 3. Element spread (max 20)
     elem_counts: Dict[str, int] = {}
-    for p in chart["pillars"].values():
-        e = STEM_ELEMENT[p["stem"]]
+    for stem, hidden in zip(c.stems, c.hidden):
+        e = STEM_ELEMENTS[stem]
         elem_counts[e] = elem_counts.get(e, 0) + 1
-        for _role, stem in p["hidden"]:
-            e = STEM_ELEMENT[stem]
+        for hidden_stem in hidden:
+            e = STEM_ELEMENTS[hidden_stem]
             elem_counts[e] = elem_counts.get(e, 0) + 1
     total += min(len(elem_counts) * 4, 20)
 
     # 4. Root depth (max 15)
     root = 0
-    dm_elem = chart["day_master"]["element"]
-    for p in chart["pillars"].values():
-        for role, stem in p["hidden"]:
-            if STEM_ELEMENT[stem] == dm_elem:
+    dm_elem = STEM_ELEMENTS[c.day_master]
+    for hidden in c.hidden:
+        for role, stem in zip(HIDDEN_ROLES, hidden):
+            if STEM_ELEMENTS[stem] == dm_elem:
                 if role == "main":
                     root += 5
                 elif role == "middle":
@@ -188,7 +190,7 @@ def rate_chart(chart: Dict) -> int:
     total += min(root, 15)
 
     # 5. Interaction stability (max 10)
-    interactions = detect_branch_interactions(chart)
+    interactions = detect_branch_interactions(c)
     stability = 10
     if interactions.get("六冲"):
         stability -= 3 * len(interactions["六冲"])
@@ -11,10 +11,11 @@ Three-tier classification:
 from typing import Dict, List, Optional, Tuple, Union
 
 from .constants import (
-    HEAVENLY_STEMS, STEM_ELEMENT, BRANCH_ELEMENT,
+    HEAVENLY_STEMS, EARTHLY_BRANCHES, STEM_ELEMENT, BRANCH_ELEMENT,
     STEM_TRANSFORMATIONS, LU_MAP, GOAT_BLADE_TABLE,
     GEN_MAP, CONTROL_MAP, SAN_HE_ELEMENT, SAN_HUI_ELEMENT,
 )
+from .chart import STEM_ELEMENTS, as_chart
 from .ten_gods import ten_god, weighted_ten_god_distribution
 from .glossary import (
     TEN_GOD_TO_REGULAR_STRUCTURE,
@@ -30,14 +31,12 @@ def detect_month_pillar_structure(chart: Dict) -> Optional[str]:
     primary determinant of the Eight Regular Structures.  Protrusion
     of non-main hidden stems no longer overrides the main qi.
     """
-    month_hidden = chart["pillars"]["month"]["hidden"]
+    c = as_chart(chart)
+    month_hidden = c.hidden[1]
     if not month_hidden:
         return None
 
-    dm_idx = HEAVENLY_STEMS.index(chart["day_master"]["stem"])
-    main_hidden_stem = month_hidden[0][1]
-    main_hidden_idx = HEAVENLY_STEMS.index(main_hidden_stem)
-    return ten_god(dm_idx, main_hidden_idx)
+    return ten_god(c.day_master, month_hidden[0])
 
 
 # ── Tier 1: Special Structures ──────────────────────────────
@@ -53,7 +52,7 @@ def detect_transform_structure(
     if not transformations:
         return None
 
-    dm_stem = chart["day_master"]["stem"]
+    dm_stem = HEAVENLY_STEMS[as_chart(chart).day_master]
     for t in transformations:
         if t.get("status", "").startswith("Hóa") and "suppressed" not in t.get("status", ""):
             stems = t.get("stems", ())
@@ -147,9 +146,9 @@ def detect_five_element_dominance(
 
     Requires one element to dominate via season + branch frames (三合/三会).
     """
-    dm_elem = chart["day_master"]["element"]
-    month_branch = chart["pillars"]["month"]["branch"]
-    month_elem = BRANCH_ELEMENT[month_branch]
+    c = as_chart(chart)
+    dm_elem = STEM_ELEMENTS[c.day_master]
+    month_elem = BRANCH_ELEMENT[EARTHLY_BRANCHES[c.branches[1]]]
 
     # DM element must match the month's seasonal element
     if month_elem != dm_elem and GEN_MAP.get(month_elem) != dm_elem:
@@ -200,20 +199,21 @@ def detect_special_structures(
     2. Follow Structures (从格)
     3. Five-Element Dominance (专旺格)
     """
-    dist = weighted_ten_god_distribution(chart)
+    c = as_chart(chart)
+    dist = weighted_ten_god_distribution(c)
 
     # 1. Transform structures
-    result = detect_transform_structure(chart, transformations)
+    result = detect_transform_structure(c, transformations)
     if result:
         return result
 
     # 2. Follow structures
-    result = detect_follow_structure(chart, strength, score, rooting, dist)
+    result = detect_follow_structure(c, strength, score, rooting, dist)
     if result:
         return result
 
     # 3. Five-Element Dominance
-    result = detect_five_element_dominance(chart, interactions)
+    result = detect_five_element_dominance(c, interactions)
     if result:
         return result
 
@@ -228,8 +228,9 @@ def detect_extreme_prosperous(
     rooting: Optional[Dict] = None,
 ) -> Optional[Dict]:
     """Detect Tier 2: 建禄格 or 羊刃格."""
-    dm_stem = chart["day_master"]["stem"]
-    month_branch = chart["pillars"]["month"]["branch"]
+    c = as_chart(chart)
+    dm_stem = HEAVENLY_STEMS[c.day_master]
+    month_branch = EARTHLY_BRANCHES[c.branches[1]]
 
     lu_branch = LU_MAP.get(dm_stem)
     if lu_branch == month_branch:
@@ -313,7 +314,7 @@ def _assess_structure_quality(
     # Check for clash disruption if interactions provided
     has_month_clash = False
     if interactions:
-        month_branch = chart["pillars"]["month"]["branch"]
+        month_branch = EARTHLY_BRANCHES[as_chart(chart).branches[1]]
         for clash in interactions.get("六冲", []):
             if isinstance(clash, tuple) and month_branch in clash:
                 has_month_clash = True
@@ -389,9 +390,11 @@ def classify_structure(
 
     Backward compatible: (chart, strength) still works; new params are optional.
     """
+    c = as_chart(chart)
+
     # Tier 1: Special structures
     special = detect_special_structures(
-        chart, strength,
+        c, strength,
         score=score or 0.0,
         rooting=rooting,
         interactions=interactions,
@@ -408,19 +411,19 @@ def classify_structure(
             "notes": special.get("note", "Special structure takes precedence"),
         }
 
-    dist = weighted_ten_god_distribution(chart)
+    dist = weighted_ten_god_distribution(c)
     if not dist:
         dist = {"比肩": 1.0}
 
     # Tier 2: Extreme Prosperous
-    extreme = detect_extreme_prosperous(chart, strength, rooting)
+    extreme = detect_extreme_prosperous(c, strength, rooting)
 
     # Tier 3: Eight Regular Structures
     # Traditional Zi Ping (Tử Bình): Month Branch Main Qi (Nguyệt Lệnh) is
     # the primary determinant of structure for the Eight Regular Structures.
     # Only fall back to the dominant Ten-God when the month qi yields a peer
     # (比肩/劫財) — those cases are handled by Tier 2 (建禄格/羊刃格).
-    month_tg = detect_month_pillar_structure(chart)
+    month_tg = detect_month_pillar_structure(c)
     dominant_tg = max(dist, key=lambda k: dist[k])
     dominance_score = dist[dominant_tg]
 
@@ -435,7 +438,7 @@ def classify_structure(
     dominance_score = dist.get(primary_tg, dominance_score)
 
     # Check for composite structures
-    composite = detect_composite_structures(chart, strength, dist)
+    composite = detect_composite_structures(c, strength, dist)
 
     structure_map = {
         "正官": "正官格", "七杀": "七杀格",
@@ -454,7 +457,7 @@ def classify_structure(
         category = _get_structure_category(primary_tg)
 
     quality, is_broken = _assess_structure_quality(
-        chart, primary_tg, strength, dist, interactions, transformations
+        c, primary_tg, strength, dist, interactions, transformations
     )
 
     notes = f"Based on {primary_tg} {notes_source}"
@@ -9,9 +9,9 @@ from .constants import (
     NOBLEMAN_TABLE, ACADEMIC_STAR_TABLE, PEACH_BLOSSOM_TABLE,
     TRAVEL_HORSE_TABLE, GENERAL_STAR_TABLE, CANOPY_STAR_TABLE,
     GOAT_BLADE_TABLE, PROSPERITY_STAR_TABLE, RED_CLOUD_TABLE,
-    BLOOD_KNIFE_TABLE, VOID_BRANCH_TABLE, XUN_NAMES,
+    BLOOD_KNIFE_TABLE, VOID_BRANCH_TABLE, XUN_NAMES, EARTHLY_BRANCHES,
 )
-from .core import _cycle_from_stem_branch
+from .chart import PILLAR_NAMES, as_chart
 
 
 def void_branches(day_cycle: int) -> Tuple[str, str]:
@@ -28,14 +28,9 @@ def xun_name(day_cycle: int) -> str:
 
 def void_in_pillars(chart: Dict) -> Dict[str, bool]:
     """Check which natal pillars have void branches."""
-    day_cycle = _cycle_from_stem_branch(
-        chart["pillars"]["day"]["stem"], chart["pillars"]["day"]["branch"]
-    )
-    void1, void2 = void_branches(day_cycle)
-    result: Dict[str, bool] = {}
-    for pname, p in chart["pillars"].items():
-        result[pname] = p["branch"] in (void1, void2)
-    return result
+    c = as_chart(chart)
+    void = void_branches(c.day_cycle)
+    return {name: EARTHLY_BRANCHES[b] in void for name, b in zip(PILLAR_NAMES, c.branches)}
 
 
 def detect_symbolic_stars(chart: Dict) -> List[Dict]:
@@ -135,11 +130,7 @@ def detect_symbolic_stars(chart: Dict) -> List[Dict]:
             })
 
     # Void stars
-    void1, void2 = void_branches(
-        _cycle_from_stem_branch(
-            chart["pillars"]["day"]["stem"], chart["pillars"]["day"]["branch"]
-        )
-    )
+    void1, void2 = void_branches(as_chart(chart).day_cycle)
     for pname, p in chart["pillars"].items():
         if p["branch"] == void1 or p["branch"] == void2:
             results.append({
@@ -162,10 +153,7 @@ def detect_symbolic_stars(chart: Dict) -> List[Dict]:
 
 def get_void_branches_for_chart(chart: Dict) -> set:
     """Return the set of void branches for this chart's day pillar."""
-    day_cycle = _cycle_from_stem_branch(
-        chart["pillars"]["day"]["stem"], chart["pillars"]["day"]["branch"]
-    )
-    v1, v2 = void_branches(day_cycle)
+    v1, v2 = void_branches(as_chart(chart).day_cycle)
     return {v1, v2} - {""}
 
 
@@ -3,10 +3,10 @@ Ten Gods (十神) — spec §1
 =========================
 """
 
-from typing import Dict
+from typing import Dict, Tuple
 
 from .constants import (
-    HEAVENLY_STEMS, STEM_ELEMENT, STEM_POLARITY, GEN_MAP, CONTROL_MAP,
+    HEAVENLY_STEMS, STEM_ELEMENT, STEM_POLARITY, GEN_MAP, CONTROL_MAP, HIDDEN_ROLES,
 )
 
 
@@ -25,8 +25,7 @@ def _element_relation(dm_elem: str, other_elem: str) -> str:
     raise ValueError(f"Unexpected element pair: {dm_elem}, {other_elem}")
 
 
-def ten_god(dm_stem_idx: int, target_stem_idx: int) -> str:
-    """Return the Ten-God name of the stem at *target_stem_idx* relative to Day Master."""
+def _ten_god_name(dm_stem_idx: int, target_stem_idx: int) -> str:
     dm_stem = HEAVENLY_STEMS[dm_stem_idx]
     target_stem = HEAVENLY_STEMS[target_stem_idx]
     dm_elem = STEM_ELEMENT[dm_stem]
@@ -45,19 +44,32 @@ def ten_god(dm_stem_idx: int, target_stem_idx: int) -> str:
     return same_pol_name if same_polarity else diff_pol_name
 
 
+# [day master stem][target stem] -> Ten-God name
+TEN_GOD_TABLE: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(_ten_god_name(dm, t) for t in range(10)) for dm in range(10)
+)
+
+
+def ten_god(dm_stem_idx: int, target_stem_idx: int) -> str:
+    """Return the Ten-God name of the stem at *target_stem_idx* relative to Day Master."""
+    return TEN_GOD_TABLE[dm_stem_idx][target_stem_idx]
+
+
 def weighted_ten_god_distribution(chart: Dict) -> Dict[str, float]:
     """Weighted Ten-God distribution (month pillar stem weighs most)."""
-    dm = chart["day_master"]["stem"]
+    from .chart import PILLAR_NAMES, as_chart
+    c = as_chart(chart)
+    gods = TEN_GOD_TABLE[c.day_master]
     dist: Dict[str, float] = {}
     weight_map = {"month": 3}
 
-    for pname, p in chart["pillars"].items():
+    for pname, stem, hidden in zip(PILLAR_NAMES, c.stems, c.hidden):
         w_stem = weight_map.get(pname, 2)
-        tg = ten_god(HEAVENLY_STEMS.index(dm), HEAVENLY_STEMS.index(p["stem"]))
+        tg = gods[stem]
         dist[tg] = dist.get(tg, 0) + w_stem
 
-        for role, stem in p["hidden"]:
-            tg_h = ten_god(HEAVENLY_STEMS.index(dm), HEAVENLY_STEMS.index(stem))
+        for role, hidden_stem in zip(HIDDEN_ROLES, hidden):
+            tg_h = gods[hidden_stem]
             w_hidden = {"main": 2, "middle": 1}.get(role, 0.5)
             dist[tg_h] = dist.get(tg_h, 0) + w_hidden
 
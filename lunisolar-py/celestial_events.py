@@ -15,11 +15,12 @@ import argparse
 from datetime import datetime
 from typing import List, Tuple
 from concurrent.futures import ProcessPoolExecutor, as_completed
-from skyfield.api import utc, load, wgs84
+from skyfield.api import utc, wgs84
 from skyfield import almanac
 from skyfield.almanac import find_transits
 from antitransit import find_antitransits
-from config import EPHEMERIS_FILE, CELESTIAL_BODIES, DEFAULT_LOCATION, NUM_PROCESSES
+from config import CELESTIAL_BODIES, DEFAULT_LOCATION, NUM_PROCESSES
+from ephemeris.registry import get_ephemeris, get_timescale
 from utils import setup_logging, write_csv_file
 
 def calculate_body_events(body_data: Tuple[str, str], start_time: datetime, end_time: datetime, 
@@ -38,8 +39,8 @@ def calculate_body_events(body_data: Tuple[str, str], start_time: datetime, end_
     logger = setup_logging()
     try:
         lat, lon = location_data
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
+        ts = get_timescale()
+        eph = get_ephemeris()
         topo = eph['earth'] + wgs84.latlon(lat, lon)
         body_name, body_key = body_data
         body = eph[body_key]
@@ -82,9 +83,6 @@ def calculate_body_events(body_data: Tuple[str, str], start_time: datetime, end_
     except Exception as e:
         logger.error(f"Error calculating events for {body_data[0]}: {e}")
         return body_data[0], [], 0
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def calculate_all_celestial_events(start_time: datetime, end_time: datetime, 
                                   location_data: Tuple[float, float]) -> List[Tuple[int, str, str]]:
@@ -7,6 +7,13 @@ import multiprocessing as mp
 # Using an absolute path ensures correct resolution regardless of CWD.
 _MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 EPHEMERIS_FILE = os.path.normpath(os.path.join(_MODULE_DIR, '../nasa/de440.bsp'))
+# Persistent event cache (ephemeris/event_cache.py) in the user cache directory
+# ($XDG_CACHE_HOME, else ~/.cache); an empty string disables it.
+_USER_CACHE_DIR = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+EVENT_CACHE_DIR = os.environ.get(
+    'LUNISOLAR_EVENT_CACHE_DIR',
+    os.path.join(_USER_CACHE_DIR, 'lunisolar', 'events'),
+)
 OUTPUT_DIR = 'output'
 AU_TO_M = 149597870700.0
 TIDAL_INTERVAL_MINUTES = 4
@@ -2,8 +2,20 @@
 ephemeris — Grouped astronomical helpers
 ==========================================
 
-Re-exports: calculate_solar_terms, calculate_moon_phases
+Re-exports: calculate_solar_terms, calculate_moon_phases, and the shared
+ephemeris registry (get_ephemeris, get_timescale, open/close/reload_ephemeris)
+and the persistent event cache (EventCache, get_event_cache)
 """
 
+from .registry import (
+    EphemerisRegistry,
+    get_registry,
+    get_ephemeris,
+    get_timescale,
+    open_ephemeris,
+    close_ephemeris,
+    reload_ephemeris,
+)
+from .event_cache import EventCache, get_event_cache, ephemeris_fingerprint
 from .solar_terms import calculate_solar_terms, main as solar_terms_main
 from .moon_phases import calculate_moon_phases, main as moon_phases_main
@@ -0,0 +1,306 @@
+"""Persistent on-disk cache of ephemeris events.
+
+New moons, solar terms and winter solstices are deterministic for a given
+ephemeris file, so they only need to be root-found once per machine.  The
+cache stores flat ``.npy`` chunk files per event kind under a directory
+keyed by an ephemeris fingerprint (size, mtime and header bytes, so a cold
+start never reads the whole kernel); each row is an int64 UTC instant
+(microseconds since the Unix epoch) plus an int16 event code (solar-term
+index, moon phase, season).  Coverage is tracked in disjoint ranges of
+whole UTC calendar years: a request computes only its own missing years
+and is merged with the chunks it overlaps or touches, so asking for a
+far-away year never back-fills the gap.  Each new chunk is written
+atomically and re-mapped; reads are served from
+``np.load(mmap_mode='r')``, so a cold worker pages in only the rows it
+touches.
+
+Usage:
+    from ephemeris.event_cache import get_event_cache
+
+    cache = get_event_cache()               # None when disabled
+    times, codes = cache.events('solar_terms', 2000, 2100, compute_year)
+
+``compute_year(year)`` must return ``(times_us, codes)`` for events in
+``[year-01-01, year+1-01-01)`` UTC.  The cache lives in the user cache
+directory (``$XDG_CACHE_HOME/lunisolar/events``, else
+``~/.cache/lunisolar/events``); set ``LUNISOLAR_EVENT_CACHE_DIR`` to
+relocate it, or to an empty string to disable it.
+"""
+
+import glob
+import hashlib
+import os
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from config import EPHEMERIS_FILE, EVENT_CACHE_DIR
+from utils import setup_logging
+
+# Bump whenever the row layout or an event definition changes.
+EVENT_CACHE_VERSION = 1
+
+EVENT_DTYPE = np.dtype([('t', np.int64), ('code', np.int16)])
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+EventArrays = Tuple[np.ndarray, np.ndarray]
+YearComputer = Callable[[int], Tuple[Iterable[int], Iterable[int]]]
+
+
+def datetime_to_us(value: datetime) -> int:
+    """Naive-UTC (or aware) datetime to integer microseconds since the epoch."""
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    delta = value - _UNIX_EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def us_to_datetime(value: int) -> datetime:
+    """Integer microseconds since the epoch to a naive UTC datetime."""
+    return _UNIX_EPOCH + timedelta(microseconds=int(value))
+
+
+def _year_start_us(year: int) -> int:
+    return datetime_to_us(datetime(year, 1, 1))
+
+
+# Bytes hashed from the start of the kernel: the DAF file record and the
+# first summary / name records, which identify the segments it holds.
+_FINGERPRINT_HEADER_BYTES = 64 * 1024
+
+
+def ephemeris_fingerprint(path: Optional[str] = None) -> str:
+    """SHA-256 of an ephemeris file's size, mtime and header bytes."""
+    path = os.path.abspath(path or EPHEMERIS_FILE)
+    stat = os.stat(path)
+    digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}:".encode())
+    with open(path, 'rb') as f:
+        digest.update(f.read(_FINGERPRINT_HEADER_BYTES))
+    return digest.hexdigest()
+
+
+class _Entry:
+    """One mapped event file and the year range it covers."""
+
+    __slots__ = ('first_year', 'last_year', 'rows', 'path')
+
+    def __init__(self, first_year: int, last_year: int, rows: np.ndarray, path: str):
+        self.first_year = first_year
+        self.last_year = last_year
+        self.rows = rows
+        self.path = path
+
+    def covers(self, first_year: int, last_year: int) -> bool:
+        return self.first_year <= first_year and last_year <= self.last_year
+
+    def touches(self, first_year: int, last_year: int) -> bool:
+        """True if this chunk overlaps or is adjacent to the year range."""
+        return self.first_year <= last_year + 1 and first_year - 1 <= self.last_year
+
+
+def _disjoint(entries: Iterable[_Entry]) -> List[_Entry]:
+    """Widest-first selection of non-overlapping chunks, sorted by first year.
+
+    Superseded chunk files another process could not delete yet overlap
+    the chunk that replaced them and are skipped.
+    """
+    chosen: List[_Entry] = []
+    for entry in sorted(entries, key=lambda e: e.last_year - e.first_year, reverse=True):
+        if not any(entry.first_year <= c.last_year and c.first_year <= entry.last_year for c in chosen):
+            chosen.append(entry)
+    return sorted(chosen, key=lambda e: e.first_year)
+
+
+class EventCache:
+    """Lazily filled, memory-mapped event store for one ephemeris file."""
+
+    def __init__(self, cache_dir: str, ephemeris_path: Optional[str] = None):
+        self.logger = setup_logging()
+        self.ephemeris_path = os.path.abspath(ephemeris_path or EPHEMERIS_FILE)
+        self.fingerprint = ephemeris_fingerprint(self.ephemeris_path)
+        self.directory = os.path.join(
+            cache_dir, f"v{EVENT_CACHE_VERSION}", self.fingerprint[:16]
+        )
+        self._lock = threading.Lock()
+        self._chunks: Dict[str, List[_Entry]] = {}
+
+    def events(
+        self, kind: str, first_year: int, last_year: int, compute_year: YearComputer
+    ) -> EventArrays:
+        """Return ``(times_us, codes)`` for every ``kind`` event in the UTC years
+        ``first_year`` .. ``last_year`` (inclusive), computing missing years."""
+        if last_year < first_year:
+            raise ValueError("last_year must not be before first_year")
+
+        entry = self._covering(kind, first_year, last_year)
+        if entry is None:
+            with self._lock:
+                entry = self._covering(kind, first_year, last_year)
+                if entry is None:
+                    # Another process may have written the range meanwhile
+                    self._chunks[kind] = _disjoint(self._chunks.get(kind, []) + self._find_on_disk(kind))
+                    entry = self._covering(kind, first_year, last_year)
+                if entry is None:
+                    entry = self._extend(kind, first_year, last_year, compute_year)
+
+        times = entry.rows['t']
+        lo = np.searchsorted(times, _year_start_us(first_year), side='left')
+        hi = np.searchsorted(times, _year_start_us(last_year + 1), side='left')
+        return times[lo:hi], entry.rows['code'][lo:hi]
+
+    def events_between(
+        self, kind: str, start: datetime, end: datetime, compute_year: YearComputer
+    ) -> EventArrays:
+        """Return ``(times_us, codes)`` for ``kind`` events with start <= t <= end."""
+        lo, hi = datetime_to_us(start), datetime_to_us(end)
+        times, codes = self.events(
+            kind, us_to_datetime(lo).year, us_to_datetime(hi).year, compute_year
+        )
+        i = np.searchsorted(times, lo, side='left')
+        j = np.searchsorted(times, hi, side='right')
+        return times[i:j], codes[i:j]
+
+    def coverage(self, kind: str) -> List[Tuple[int, int]]:
+        """Return the cached ``(first_year, last_year)`` ranges for ``kind``."""
+        with self._lock:
+            chunks = _disjoint(self._chunks.get(kind, []) + self._find_on_disk(kind))
+        return [(c.first_year, c.last_year) for c in chunks]
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Forget and delete cached events for ``kind`` (or every kind)."""
+        with self._lock:
+            pattern = f"{kind}.*.npy" if kind else "*.npy"
+            if kind is None:
+                self._chunks.clear()
+            else:
+                self._chunks.pop(kind, None)
+            for path in glob.glob(os.path.join(self.directory, pattern)):
+                self._remove(path)
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _covering(self, kind: str, first_year: int, last_year: int) -> Optional[_Entry]:
+        for entry in self._chunks.get(kind, ()):
+            if entry.covers(first_year, last_year):
+                return entry
+        return None
+
+    def _find_on_disk(self, kind: str) -> List[_Entry]:
+        """Map every event chunk file for ``kind`` written by any process."""
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, f"{kind}.*.npy")):
+            try:
+                first, last = (int(y) for y in os.path.basename(path)[len(kind) + 1:-4].split('_'))
+            except ValueError:
+                continue
+            try:
+                rows = np.load(path, mmap_mode='r')
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Ignoring unreadable event cache file {path}: {e}")
+                continue
+            if rows.dtype == EVENT_DTYPE:
+                entries.append(_Entry(first, last, rows, path))
+        return entries
+
+    def _extend(
+        self,
+        kind: str,
+        first_year: int,
+        last_year: int,
+        compute_year: YearComputer,
+    ) -> _Entry:
+        """Compute the requested years not yet cached and merge them with the
+        chunks they overlap or touch into one new chunk."""
+        chunks = self._chunks.get(kind, [])
+        merged = [c for c in chunks if c.touches(first_year, last_year)]
+        new_first = min([first_year] + [c.first_year for c in merged])
+        new_last = max([last_year] + [c.last_year for c in merged])
+        missing = [
+            year for year in range(first_year, last_year + 1)
+            if not any(c.first_year <= year <= c.last_year for c in merged)
+        ]
+
+        self.logger.debug(f"Event cache: computing {kind} for {len(missing)} year(s)")
+        parts = [np.asarray(c.rows) for c in merged]
+        for year in missing:
+            times, codes = compute_year(year)
+            chunk = np.empty(len(times), dtype=EVENT_DTYPE)
+            chunk['t'] = np.fromiter(times, dtype=np.int64, count=len(times))
+            chunk['code'] = np.fromiter(codes, dtype=np.int16, count=len(times))
+            parts.append(chunk)
+        rows = np.concatenate(parts) if parts else np.empty(0, dtype=EVENT_DTYPE)
+        rows = np.unique(rows)  # sorted by instant; drops boundary duplicates
+
+        path = os.path.join(self.directory, f"{kind}.{new_first}_{new_last}.npy")
+        try:
+            self._write_atomic(path, rows)
+        except OSError as e:
+            self.logger.warning(f"Event cache not persisted ({path}): {e}")
+            entry = _Entry(new_first, new_last, rows, path)
+        else:
+            entry = _Entry(new_first, new_last, np.load(path, mmap_mode='r'), path)
+            for old in merged:
+                if old.path != path:
+                    self._remove(old.path)
+
+        self._chunks[kind] = sorted(
+            [c for c in chunks if c not in merged] + [entry], key=lambda e: e.first_year
+        )
+        return entry
+
+    def _write_atomic(self, path: str, rows: np.ndarray) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, rows)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            # Still mapped by another process (Windows) or already gone
+            pass
+
+
+_CACHES: Dict[Tuple[str, int, int], EventCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_event_cache(ephemeris_path: Optional[str] = None) -> Optional[EventCache]:
+    """Return the process-wide cache for ``ephemeris_path``, or None when the
+    cache is disabled (empty ``EVENT_CACHE_DIR``) or the file is unreadable.
+
+    Caches are keyed by path, size and mtime, so replacing the ephemeris on
+    disk switches to a fresh fingerprint directory on the next call.
+    """
+    if not EVENT_CACHE_DIR:
+        return None
+    path = os.path.abspath(ephemeris_path or EPHEMERIS_FILE)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    cache = _CACHES.get(key)
+    if cache is None:
+        with _CACHES_LOCK:
+            cache = _CACHES.get(key)
+            if cache is None:
+                try:
+                    cache = EventCache(EVENT_CACHE_DIR, path)
+                except OSError as e:
+                    setup_logging().warning(f"Event cache disabled: {e}")
+                    return None
+                _CACHES[key] = cache
+    return cache
@@ -9,9 +9,9 @@ Usage:
 
 from datetime import datetime
 from typing import List, Tuple
-from skyfield.api import utc, load
+from skyfield.api import utc
 from skyfield import almanac
-from config import EPHEMERIS_FILE
+from .registry import get_ephemeris, get_timescale
 from utils import setup_logging, write_csv_file, parse_date_args
 
 def calculate_moon_phases(start_time: datetime, end_time: datetime) -> List[Tuple[int, int, str]]:
@@ -26,8 +26,8 @@ def calculate_moon_phases(start_time: datetime, end_time: datetime) -> List[Tupl
     """
     logger = setup_logging()
     try:
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
+        ts = get_timescale()
+        eph = get_ephemeris()
         t0 = ts.from_datetime(start_time)
         t1 = ts.from_datetime(end_time)
         t, y = almanac.find_discrete(t0, t1, almanac.moon_phases(eph))
@@ -43,9 +43,6 @@ def calculate_moon_phases(start_time: datetime, end_time: datetime) -> List[Tupl
     except Exception as e:
         logger.error(f"Error calculating moon phases: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def main():
     """Main function for moon phases calculation."""
@@ -0,0 +1,144 @@
+"""Process-wide ephemeris registry.
+
+Opening a JPL kernel parses its DAF summary records and maps the segment
+data into memory, so every caller in the process should share one
+:class:`SpiceKernel` per file instead of calling ``load(EPHEMERIS_FILE)``
+per request.  The registry opens kernels lazily on first use (jplephem
+memory-maps the segment arrays, so only the pages actually read are paged
+in), keys them by absolute file path, and exposes explicit
+``open`` / ``close`` / ``reload`` hooks for long-running workers.
+
+Usage:
+    from ephemeris.registry import get_ephemeris, get_timescale
+
+    ts = get_timescale()
+    eph = get_ephemeris()            # config.EPHEMERIS_FILE
+    eph = get_ephemeris('/path/to/de440s.bsp')
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional
+
+from skyfield.api import load, load_file
+from skyfield.jpllib import SpiceKernel
+from skyfield.timelib import Timescale
+
+from config import EPHEMERIS_FILE
+from utils import setup_logging
+
+
+def _normalize_path(path: Optional[str]) -> str:
+    """Return the canonical registry key for an ephemeris path."""
+    return os.path.normcase(os.path.abspath(path or EPHEMERIS_FILE))
+
+
+class EphemerisRegistry:
+    """Thread-safe cache of opened ephemeris kernels keyed by file path."""
+
+    def __init__(self):
+        self.logger = setup_logging()
+        self._lock = threading.RLock()
+        self._kernels: Dict[str, SpiceKernel] = {}
+        self._timescale: Optional[Timescale] = None
+
+    def timescale(self) -> Timescale:
+        """Return the shared :class:`Timescale` (built-in leap-second and ΔT data)."""
+        ts = self._timescale
+        if ts is None:
+            with self._lock:
+                if self._timescale is None:
+                    self._timescale = load.timescale()
+                ts = self._timescale
+        return ts
+
+    def get(self, path: Optional[str] = None) -> SpiceKernel:
+        """Return the kernel for ``path``, opening it on first use."""
+        key = _normalize_path(path)
+        kernel = self._kernels.get(key)
+        if kernel is None:
+            with self._lock:
+                kernel = self._kernels.get(key)
+                if kernel is None:
+                    kernel = self._open_locked(key)
+        return kernel
+
+    def open(self, path: Optional[str] = None) -> SpiceKernel:
+        """Eagerly open ``path`` (no-op if already open). Intended for worker start-up."""
+        return self.get(path)
+
+    def close(self, path: Optional[str] = None) -> None:
+        """Close the kernel for ``path``, or every open kernel when ``path`` is None."""
+        with self._lock:
+            if path is None:
+                keys = list(self._kernels)
+            else:
+                keys = [_normalize_path(path)]
+            for key in keys:
+                kernel = self._kernels.pop(key, None)
+                if kernel is not None:
+                    kernel.close()
+                    self.logger.debug(f"Closed ephemeris {key}")
+
+    def reload(self, path: Optional[str] = None) -> SpiceKernel:
+        """Close and re-open ``path`` (e.g. after the file was replaced on disk)."""
+        key = _normalize_path(path)
+        with self._lock:
+            self.close(key)
+            return self._open_locked(key)
+
+    def is_open(self, path: Optional[str] = None) -> bool:
+        """Return True if ``path`` is currently held open by the registry."""
+        return _normalize_path(path) in self._kernels
+
+    def open_paths(self) -> List[str]:
+        """Return the registry keys of every open kernel."""
+        return list(self._kernels)
+
+    def _open_locked(self, key: str) -> SpiceKernel:
+        kernel = load_file(key)
+        self._kernels[key] = kernel
+        self.logger.debug(f"Opened ephemeris {key}")
+        return kernel
+
+    def _reset_after_fork(self) -> None:
+        # A forked child must not share the parent's file offsets; forget the
+        # inherited kernels and let the child reopen them lazily.
+        self._lock = threading.RLock()
+        self._kernels = {}
+
+
+_REGISTRY = EphemerisRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_REGISTRY._reset_after_fork)
+
+
+def get_registry() -> EphemerisRegistry:
+    """Return the process-wide :class:`EphemerisRegistry`."""
+    return _REGISTRY
+
+
+def get_timescale() -> Timescale:
+    """Return the process-wide shared :class:`Timescale`."""
+    return _REGISTRY.timescale()
+
+
+def get_ephemeris(path: Optional[str] = None) -> SpiceKernel:
+    """Return the shared kernel for ``path`` (default: ``config.EPHEMERIS_FILE``)."""
+    return _REGISTRY.get(path)
+
+
+def open_ephemeris(path: Optional[str] = None) -> SpiceKernel:
+    """Eagerly open an ephemeris so the first request does not pay the load cost."""
+    return _REGISTRY.open(path)
+
+
+def close_ephemeris(path: Optional[str] = None) -> None:
+    """Close one ephemeris, or all of them when ``path`` is None."""
+    _REGISTRY.close(path)
+
+
+def reload_ephemeris(path: Optional[str] = None) -> SpiceKernel:
+    """Re-open an ephemeris from disk, replacing the cached kernel."""
+    return _REGISTRY.reload(path)
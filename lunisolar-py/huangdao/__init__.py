@@ -3,7 +3,7 @@ huangdao — Huangdao Systems Package (十二建星与大黄道)
 =====================================================
 
 Public API:
-    HuangdaoCalculator, ConstructionStars, GreatYellowPath
+    HuangdaoCalculator, ConstructionStars, GreatYellowPath, HuangdaoDay, match_mask
 """
 
 from .constants import (
@@ -18,4 +18,7 @@ from .constants import (
 )
 from .construction_stars import ConstructionStars
 from .great_yellow_path import GreatYellowPath
+from .records import HuangdaoDay, HUANGDAO_DAY_DTYPE, records_to_array
+from .tables import SPIRIT_TABLE, STAR_TABLE, LUNAR_MONTH_STAR_TABLE, STAR_SCORES, SPIRIT_IS_YELLOW
+from .search import match_mask
 from .calculator import HuangdaoCalculator
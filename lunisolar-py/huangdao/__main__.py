@@ -1,10 +1,12 @@
 """CLI entry point for ``python -m huangdao``."""
 
 import argparse
+import importlib.util
 import io
 import sys
 
 from .calculator import HuangdaoCalculator
+from .export import FORMATS, write_csv, write_jsonl, write_parquet
 
 
 def main() -> None:
@@ -20,6 +22,8 @@ Examples:
   %(prog)s --year 2025 --month 10
   %(prog)s -y 2025 -m 1 --timezone Asia/Shanghai
   %(prog)s -y 2024 -m 12 -tz Asia/Tokyo
+  %(prog)s --start 2025-01-01 --end 2124-12-31 --format jsonl > almanac.jsonl
+  %(prog)s --start 2025-01-01 --end 2034-12-31 --format parquet --output almanac.parquet
 
 Legend:
   Construction Stars (十二建星):
@@ -33,15 +37,36 @@ Legend:
     ⚫ Black Path (黑道): Inauspicious days
         """
     )
-    parser.add_argument('--year', '-y', type=int, required=True,
+    parser.add_argument('--year', '-y', type=int,
                         help='Gregorian year (e.g., 2025)')
-    parser.add_argument('--month', '-m', type=int, required=True,
+    parser.add_argument('--month', '-m', type=int,
                         help='Month number (1-12)')
     parser.add_argument('--timezone', '-tz', default='Asia/Ho_Chi_Minh',
                         help='Timezone (IANA format, default: Asia/Ho_Chi_Minh)')
+    parser.add_argument('--start', type=str,
+                        help='First day of an almanac range (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str,
+                        help='Last day of an almanac range (YYYY-MM-DD, inclusive)')
+    parser.add_argument('--format', choices=FORMATS, default='jsonl',
+                        help='Range output format (default: jsonl)')
+    parser.add_argument('--output', '-o', type=str, default=None,
+                        help='Range output file (default: stdout; required for parquet)')
 
     args = parser.parse_args()
 
+    if args.start or args.end:
+        if not (args.start and args.end):
+            parser.error("--start and --end must be given together")
+        if args.format == 'parquet':
+            if not args.output:
+                parser.error("--format parquet requires --output")
+            if importlib.util.find_spec('pyarrow') is None:
+                parser.error("--format parquet requires pyarrow (pip install pyarrow)")
+        _write_range(HuangdaoCalculator(args.timezone), args)
+        return
+
+    if args.year is None or args.month is None:
+        parser.error("either --year and --month, or --start and --end, are required")
     if not 1 <= args.month <= 12:
         parser.error("Month must be between 1 and 12")
 
@@ -49,5 +74,20 @@ Legend:
     calculator.print_month_calendar(args.year, args.month)
 
 
+def _write_range(calculator: HuangdaoCalculator, args) -> None:
+    """Stream ``generate_range`` records in the requested format."""
+    records = (day.to_dict() for day in calculator.generate_range(args.start, args.end))
+    if args.format == 'parquet':
+        write_parquet(records, args.output)
+        return
+
+    writer = write_jsonl if args.format == 'jsonl' else write_csv
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer(records, f)
+    else:
+        writer(records, sys.stdout)
+
+
 if __name__ == "__main__":
     main()
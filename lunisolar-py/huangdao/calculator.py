@@ -3,21 +3,36 @@
 from __future__ import annotations
 
 import calendar
-from datetime import datetime
-from typing import Dict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
 
 from lunisolar.api import solar_to_lunisolar, solar_to_lunisolar_batch
-from shared.constants import EARTHLY_BRANCH_PINYIN
+from lunisolar.vectorized import solar_to_lunisolar_array
+from timezone_handler import local_to_utc_array
+from shared.constants import BRANCH_CHARS, EARTHLY_BRANCH_PINYIN
 from shared.models import LunisolarDateDTO
 
 from .constants import (
     BRANCH_INDEX,
-    BUILDING_BRANCH_BY_MONTH,
     AZURE_DRAGON_MONTHLY_START,
     MNEMONIC_FORMULAS,
 )
 from .construction_stars import ConstructionStars
 from .great_yellow_path import GreatYellowPath
+from .records import HUANGDAO_DAY_DTYPE, HuangdaoDay
+from .search import match_mask
+from .tables import SPIRIT_TABLE, STAR_TABLE
+
+
+def _as_date(value: Union[date, datetime, str]) -> date:
+    """Accept a date, a datetime or a YYYY-MM-DD string."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
 
 
 class HuangdaoCalculator:
@@ -27,6 +42,31 @@ class HuangdaoCalculator:
         self.timezone_name = timezone_name
         self.construction_stars = ConstructionStars(timezone_name)
         self.great_yellow_path = GreatYellowPath()
+        # Gregorian year -> HUANGDAO_DAY_DTYPE records, built on first query
+        self._day_index: Dict[int, np.ndarray] = {}
+
+    def day_record(self, date_obj: Union[date, datetime], dto: LunisolarDateDTO = None) -> HuangdaoDay:
+        """Integer-coded Construction Star and Great Yellow Path data for one day.
+
+        Args:
+            date_obj: Target date
+            dto: Lunisolar data (optional, will fetch if not provided)
+        """
+        if dto is None:
+            dto = solar_to_lunisolar(date_obj.strftime("%Y-%m-%d"), "12:00", self.timezone_name, quiet=True)
+
+        day_branch_index = BRANCH_INDEX[dto.day_branch]
+        building_branch_index = self.construction_stars.building_branch_index(date_obj)
+        return HuangdaoDay(
+            date_obj.toordinal(),
+            self.construction_stars._star_index_from_branches(building_branch_index, day_branch_index),
+            self.great_yellow_path.spirit_index(dto.month, day_branch_index),
+            day_branch_index,
+            building_branch_index,
+            dto.month,
+            dto.is_leap_month,
+            self.construction_stars._is_principal_solar_term_day(date_obj),
+        )
 
     def calculate_day_info(self, date_obj: datetime, dto: LunisolarDateDTO = None,
                            prev_star_index: int = None) -> Dict:
@@ -35,36 +75,107 @@ class HuangdaoCalculator:
         Args:
             date_obj: Target date
             dto: Lunisolar data (optional, will fetch if not provided)
-            prev_star_index: 0-based index of the previous day's star for sequential tracking
+            prev_star_index: Accepted for compatibility; each day's star is
+                             computed independently (see ``ConstructionStars``)
         """
-        if dto is None:
-            dto = solar_to_lunisolar(date_obj.strftime("%Y-%m-%d"), "12:00", self.timezone_name, quiet=True)
+        return self.day_record(date_obj, dto).to_dict()
+
+    def day_records(self, start: Union[date, datetime, str],
+                    end: Union[date, datetime, str]) -> np.ndarray:
+        """``HUANGDAO_DAY_DTYPE`` array for every day in [start, end].
+
+        Days are converted at local noon by ``solar_to_lunisolar_array``
+        (month table lookups); spirits and stars are then single lookups
+        into the precomputed ``SPIRIT_TABLE`` / ``STAR_TABLE`` over the
+        whole span.
+        """
+        start, end = _as_date(start), _as_date(end)
+        if end < start:
+            raise ValueError("end must not be before start")
+
+        days = np.arange(np.datetime64(start, 'D'), np.datetime64(end, 'D') + 1)
+        epoch_days = days.astype(np.int64)
+        utc = local_to_utc_array(epoch_days * 86400 + 12 * 3600, self.timezone_name)
+        lunisolar = solar_to_lunisolar_array(utc, self.timezone_name)
+
+        months = lunisolar['month'].astype(np.intp)
+        day_branches = (lunisolar['day_cycle'].astype(np.intp) - 1) % 12
+        building_branches = self.construction_stars.building_branch_indexes(days)
+
+        out = np.empty(days.shape, dtype=HUANGDAO_DAY_DTYPE)
+        out['ordinal'] = epoch_days + date(1970, 1, 1).toordinal()
+        out['star'] = STAR_TABLE[building_branches, day_branches]
+        out['spirit'] = SPIRIT_TABLE[months, day_branches]
+        out['day_branch'] = day_branches
+        out['building_branch'] = building_branches
+        out['lunar_month'] = months
+        out['is_leap_month'] = lunisolar['is_leap']
+        out['is_solar_term'] = self.construction_stars.sectional_term_mask(days)
+        return out
+
+    def year_index(self, year: int) -> np.ndarray:
+        """Cached :meth:`day_records` for one Gregorian year (read-only)."""
+        records = self._day_index.get(year)
+        if records is None:
+            records = self.day_records(date(year, 1, 1), date(year, 12, 31))
+            records.setflags(write=False)
+            self._day_index[year] = records
+        return records
+
+    def find_days(self, start: Union[date, datetime, str], end: Union[date, datetime, str],
+                  limit: Optional[int] = None, **criteria) -> List[HuangdaoDay]:
+        """First ``limit`` days in [start, end] matching ``criteria``, in date order.
+
+        ``criteria`` are the keyword filters of :func:`huangdao.search.match_mask`
+        (``yellow_path``, ``min_score``, ``stars``, ``spirits``,
+        ``avoid_clash_with``, ``lunar_months``, ``allow_leap_month``,
+        ``solar_term``).  Years are indexed on first use and scanned in
+        order, so the search stops in the year holding the ``limit``-th match.
+
+        Example:
+            calc.find_days('2026-01-01', '2030-12-31', limit=5,
+                           yellow_path=True, min_score=3, avoid_clash_with='午')
+        """
+        start, end = _as_date(start), _as_date(end)
+        if end < start:
+            raise ValueError("end must not be before start")
+        if limit is not None and limit <= 0:
+            return []
+
+        first, last = start.toordinal(), end.toordinal()
+        found: List[HuangdaoDay] = []
+        for year in range(start.year, end.year + 1):
+            records = self.year_index(year)
+            lo = max(first - int(records['ordinal'][0]), 0)
+            hi = min(last - int(records['ordinal'][0]) + 1, len(records))
+            window = records[lo:hi]
+            hits = np.flatnonzero(match_mask(window, **criteria))
+            if limit is not None:
+                hits = hits[:limit - len(found)]
+            found.extend(HuangdaoDay(*row) for row in window[hits].tolist())
+            if limit is not None and len(found) >= limit:
+                break
+        return found
+
+    def generate_range(self, start: Union[date, datetime, str],
+                       end: Union[date, datetime, str]) -> Iterator[HuangdaoDay]:
+        """Yield a :class:`HuangdaoDay` for every day in [start, end].
+
+        Days come from :meth:`day_records` one Gregorian year per batch, so
+        ranges, searches and exports resolve lunar months through the same
+        month-table path; every star is computed independently, so a range
+        can be split at any day and generated in parallel.
+        """
+        start, end = _as_date(start), _as_date(end)
+        if end < start:
+            raise ValueError("end must not be before start")
 
-        is_solar_term = self.construction_stars._is_principal_solar_term_day(date_obj)
-
-        star = self.construction_stars.get_construction_star(date_obj, dto, prev_star_index)
-        ausp = self.construction_stars.AUSPICIOUSNESS[star]
-
-        spirit = self.great_yellow_path.calculate_spirit(dto.month, BRANCH_INDEX[dto.day_branch])
-
-        return {
-            "date": date_obj.strftime("%Y-%m-%d"),
-            "star": star,
-            "translation": self.construction_stars.STAR_TRANSLATIONS[star],
-            "level": ausp["level"],
-            "score": ausp["score"],
-            "day_branch": dto.day_branch,
-            "lunar_month": dto.month,
-            "lunar_month_display": f"{'閏' if dto.is_leap_month else ''}{dto.month}",
-            "building_branch": BUILDING_BRANCH_BY_MONTH[dto.month],
-            "is_leap_month": dto.is_leap_month,
-            "is_solar_term": is_solar_term,
-            "gyp_spirit": spirit.chinese,
-            "gyp_spirit_eng": spirit.english,
-            "gyp_is_auspicious": spirit.is_auspicious,
-            "gyp_auspiciousness": "吉" if spirit.is_auspicious else "凶",
-            "gyp_path_type": "黄道" if spirit.is_auspicious else "黑道",
-        }
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(end, date(chunk_start.year, 12, 31))
+            for row in self.day_records(chunk_start, chunk_end).tolist():
+                yield HuangdaoDay(*row)
+            chunk_start = chunk_end + timedelta(days=1)
 
     def print_month_calendar(self, year: int, month: int) -> None:
         """Print formatted calendar table for a specific month."""
@@ -79,8 +190,14 @@ class HuangdaoCalculator:
         mid_idx = 14  # 15th day (0-indexed)
         mid_dto = lunisolar_results[mid_idx]
 
-        month_branch = BUILDING_BRANCH_BY_MONTH[mid_dto.month]
-        month_pinyin = EARTHLY_BRANCH_PINYIN.get(month_branch, "")
+        # Stars follow the sectional-term (jie) month, which changes mid-month
+        days = np.arange(date(year, month, 1), date(year, month, days_in_month) + timedelta(days=1),
+                         dtype='datetime64[D]')
+        building = self.construction_stars.building_branch_indexes(days).tolist()
+        building_segments = ", ".join(
+            f"{BRANCH_CHARS[b]} ({EARTHLY_BRANCH_PINYIN[BRANCH_CHARS[b]]}) from {i + 1:02d}"
+            for i, b in enumerate(building) if i == 0 or b != building[i - 1]
+        )
         azure_start = AZURE_DRAGON_MONTHLY_START[mid_dto.month]
         mnemonic = MNEMONIC_FORMULAS[mid_dto.month]
 
@@ -88,30 +205,26 @@ class HuangdaoCalculator:
         print(f"\n{'='*150}")
         print(f"{month_name} {year} - Construction Stars & Great Yellow Path Calendar")
         print(f"{'='*150}")
-        print(f"Lunar Month: {mid_dto.month} ({month_branch} - {month_pinyin})")
+        print(f"Lunar Month: {mid_dto.month} | Building Branch: {building_segments}")
         print(f"Azure Dragon Start: {azure_start.chinese} ({EARTHLY_BRANCH_PINYIN[azure_start.chinese]}) | Mnemonic: {mnemonic}")
         print(f"{'='*150}")
         print(f"{'Date':<6} {'Star':<4} {'Translation':<15} {'Level':<16} {'Score':<5} {'Spirit':<8} {'Path':<6} {'Day Branch':<12} {'Icons':<6}")
         print(f"{'-'*150}")
 
-        prev_star_index = None
-
         for day, dto in enumerate(lunisolar_results, start=1):
-            date_obj = datetime(year, month, day)
-            info = self.calculate_day_info(date_obj, dto, prev_star_index)
-
-            prev_star_index = self.construction_stars.CONSTRUCTION_STARS.index(info["star"])
+            record = self.day_record(date(year, month, day), dto)
 
             date_str = f"{day:02d}"
-            star = info["star"]
-            translation = info["translation"][:13]
-            level = info["level"][:14]
-            score = info["score"]
+            star = record.star_char
+            translation = self.construction_stars.STAR_TRANSLATIONS[star][:13]
+            level = record.level[:14]
+            score = record.score
 
-            gyp_spirit = info["gyp_spirit"][:6]
-            gyp_path = info["gyp_path_type"][:4]
+            spirit = record.spirit_enum
+            gyp_spirit = spirit.chinese[:6]
+            gyp_path = ("黄道" if spirit.is_auspicious else "黑道")[:4]
 
-            day_branch = info["day_branch"]
+            day_branch = dto.day_branch
             day_pinyin = EARTHLY_BRANCH_PINYIN.get(day_branch, "")
             day_branch_display = f"{day_branch}({day_pinyin})"
 
@@ -124,7 +237,7 @@ class HuangdaoCalculator:
             else:
                 cs_icon = "🟥"
 
-            gyp_icon = "🟡" if info["gyp_is_auspicious"] else "⚫"
+            gyp_icon = "🟡" if spirit.is_auspicious else "⚫"
 
             print(f"{date_str:<6} {star:<4} {translation:<15} {level:<16} {score:<5} {gyp_spirit:<8} {gyp_path:<6} {day_branch_display:<12} {cs_icon}{gyp_icon}")
 
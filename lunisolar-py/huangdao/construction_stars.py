@@ -1,17 +1,43 @@
-"""ConstructionStars — Twelve Construction Stars (十二建星) Calculator."""
+"""ConstructionStars — Twelve Construction Stars (十二建星) Calculator.
+
+The star of a day is ``(day_branch - building_branch) mod 12``, where the
+building branch (月建) belongs to the solar month opened by the latest
+sectional term (节, ``PRINCIPAL_TERM_NAMES``) on or before that local
+date: 立春 opens 寅, 驚蟄 卯, ... 小寒 丑.  Because the building branch
+advances by one exactly on a sectional-term day, this closed form
+reproduces the traditional "repeat the previous star on a 节 day" rule
+without walking day by day, so any date (or array of dates) resolves
+independently.
+
+Sectional-term dates are indexed per Gregorian year from a single
+solar-term sweep (or the shared event cache).
+"""
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Dict
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, FrozenSet, Tuple, Union
 
+import numpy as np
 import pytz
-from skyfield.api import utc
 
-from solar_terms import calculate_solar_terms
-from shared.constants import PRINCIPAL_TERM_NAMES
+from timezone_handler import get_offset_table
+from shared import sexagenary
 from shared.models import LunisolarDateDTO
-from .constants import BRANCH_INDEX, BUILDING_BRANCH_BY_MONTH
+from lunisolar.ephemeris_service import EphemerisService
+
+_SECONDS_PER_DAY = 86400
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_UNIX_EPOCH_ORDINAL = _UNIX_EPOCH.toordinal()
+_DAY_BRANCH_SHIFT = _UNIX_EPOCH_ORDINAL - sexagenary.DAY_CYCLE_ANCHOR_ORDINAL
+
+
+def building_branch_of_term(term_index: int) -> int:
+    """Building branch (0 = 子) opened by a sectional term's skyfield index
+    (odd, 0 = 春分): 清明 (1) -> 辰, 立春 (21) -> 寅, 大雪 (17) -> 子."""
+    return ((term_index - 1) // 2 + 4) % 12
 
 
 class ConstructionStars:
@@ -42,60 +68,135 @@ class ConstructionStars:
         "闭": {"level": "very_inauspicious", "score": 1},
     }
 
-    def __init__(self, timezone_name: str):
+    def __init__(self, timezone_name: str, ephemeris_service: EphemerisService = None):
         self.timezone_name = timezone_name
         self.tz = pytz.timezone(timezone_name)
-        self._solar_term_cache: Dict[str, bool] = {}
-
-    def _is_principal_solar_term_day(self, date_obj: datetime) -> bool:
-        """Check if date is a principal solar term day (with caching)."""
-        date_key = date_obj.strftime("%Y-%m-%d")
-        if date_key in self._solar_term_cache:
-            return self._solar_term_cache[date_key]
-
-        start_local = self.tz.localize(datetime(date_obj.year, date_obj.month, date_obj.day, 0, 0, 0))
-        end_local = start_local + timedelta(days=1, seconds=-1)
-        start_utc = start_local.astimezone(pytz.utc)
-        end_utc = end_local.astimezone(pytz.utc)
-
-        results = calculate_solar_terms(start_utc, end_utc)
-        is_term = False
-        for unix_ts, idx, zht, zhs, _vn in results:
-            utc_dt = datetime.fromtimestamp(unix_ts, tz=utc)
-            local_dt = utc_dt.astimezone(self.tz)
-            if local_dt.date() == date_obj.date():
-                if (zht and zht in PRINCIPAL_TERM_NAMES) or (zhs and zhs in PRINCIPAL_TERM_NAMES):
-                    is_term = True
-                    break
-
-        self._solar_term_cache[date_key] = is_term
-        return is_term
+        self.ephemeris_service = ephemeris_service or EphemerisService()
+        self._term_dates: Dict[int, FrozenSet[date]] = {}
+        # year -> (sectional-term local ordinals ascending, building branch each opens)
+        self._terms: Dict[int, Tuple[array, array]] = {}
+
+    def principal_term_dates(self, year: int) -> FrozenSet[date]:
+        """Local dates in Gregorian ``year`` on which a sectional term (节) falls."""
+        dates = self._term_dates.get(year)
+        if dates is None:
+            self.load_years(year, year)
+            dates = self._term_dates[year]
+        return dates
+
+    def load_years(self, year_start: int, year_end: int) -> None:
+        """Index the sectional-term dates of ``year_start`` .. ``year_end`` in one sweep."""
+        table = get_offset_table(self.timezone_name)
+        bounds = np.array([
+            (datetime(year_start, 1, 1) - _UNIX_EPOCH).total_seconds(),
+            (datetime(year_end + 1, 1, 1) - _UNIX_EPOCH).total_seconds(),
+        ], dtype=np.int64)
+        start_utc, end_utc = (_UNIX_EPOCH + timedelta(seconds=s) for s in table.local_to_utc(bounds).tolist())
+
+        terms = self.ephemeris_service.compute_solar_terms(start_utc, end_utc)
+        # Sectional terms (立春, 驚蟄, 清明, ...) have odd skyfield indexes
+        sectional = [(instant, idx) for instant, idx in terms if idx % 2 == 1]
+        instants = np.array(
+            [int((instant - _UNIX_EPOCH).total_seconds()) for instant, _ in sectional],
+            dtype=np.int64,
+        )
+        local_ordinals = np.floor_divide(table.utc_to_local(instants), _SECONDS_PER_DAY) + _UNIX_EPOCH_ORDINAL
+
+        by_year: Dict[int, list] = {year: [] for year in range(year_start, year_end + 1)}
+        for ordinal, (_, idx) in sorted(zip(local_ordinals.tolist(), sectional)):
+            year = date.fromordinal(ordinal).year
+            if year in by_year:
+                by_year[year].append((ordinal, building_branch_of_term(idx)))
+        for year, rows in by_year.items():
+            self._term_dates[year] = frozenset(date.fromordinal(ordinal) for ordinal, _ in rows)
+            self._terms[year] = (array('i', [o for o, _ in rows]), array('b', [b for _, b in rows]))
+
+    def _year_terms(self, year: int) -> Tuple[array, array]:
+        terms = self._terms.get(year)
+        if terms is None:
+            self.load_years(year, year)
+            terms = self._terms[year]
+        return terms
+
+    def _is_principal_solar_term_day(self, date_obj: Union[date, datetime]) -> bool:
+        """Check if date is a principal solar term day (O(1) after the yearly sweep)."""
+        day = date_obj.date() if isinstance(date_obj, datetime) else date_obj
+        return day in self.principal_term_dates(day.year)
+
+    def building_branch_index(self, date_obj: Union[date, datetime]) -> int:
+        """Building branch (0 = 子) of the solar month containing a local date."""
+        day = date_obj.date() if isinstance(date_obj, datetime) else date_obj
+        ordinals, branches = self._year_terms(day.year)
+        i = bisect_right(ordinals, day.toordinal()) - 1
+        if i >= 0:
+            return branches[i]
+        # Before this year's first sectional term (小寒): last one of the previous year
+        previous = self._year_terms(day.year - 1)[1]
+        if not previous:
+            raise ValueError(f"No sectional term found before {day}")
+        return previous[-1]
 
     def _star_index_from_branches(self, building_branch_index: int, day_branch_index: int) -> int:
         """Calculate star index: (day_branch_index - building_branch_index) mod 12"""
         return (day_branch_index - building_branch_index) % 12
 
-    def get_construction_star(self, date_obj: datetime, dto: LunisolarDateDTO,
-                              prev_star_index: int = None) -> str:
-        """Get construction star for date (with solar term repeat rule).
-
-        Args:
-            date_obj: Target date
-            dto: Lunisolar date data for target
-            prev_star_index: 0-based index of the previous day's star (for sequential tracking)
+    def star_index(self, date_obj: Union[date, datetime]) -> int:
+        """0-based star of a local date, straight from its day branch and solar month."""
+        day = date_obj.date() if isinstance(date_obj, datetime) else date_obj
+        day_branch_index = (day.toordinal() - sexagenary.DAY_CYCLE_ANCHOR_ORDINAL) % 12
+        return self._star_index_from_branches(self.building_branch_index(day), day_branch_index)
+
+    def _term_arrays(self, epoch_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Sectional-term epoch days and their building branches (int64) covering
+        ``epoch_days`` and the year before it."""
+        first = date.fromordinal(int(epoch_days.min()) + _UNIX_EPOCH_ORDINAL).year
+        last = date.fromordinal(int(epoch_days.max()) + _UNIX_EPOCH_ORDINAL).year
+        missing = [y for y in range(first - 1, last + 1) if y not in self._terms]
+        if missing:
+            self.load_years(missing[0], missing[-1])
+
+        term_days = np.concatenate([
+            np.frombuffer(self._terms[y][0], dtype=np.int32) for y in range(first - 1, last + 1)
+        ]).astype(np.int64) - _UNIX_EPOCH_ORDINAL
+        term_branches = np.concatenate([
+            np.frombuffer(self._terms[y][1], dtype=np.int8) for y in range(first - 1, last + 1)
+        ]).astype(np.int64)
+        return term_days, term_branches
+
+    def building_branch_indexes(self, days) -> np.ndarray:
+        """Vectorized :meth:`building_branch_index` for a ``datetime64`` array of local dates (int8)."""
+        epoch_days = np.asarray(days).astype('datetime64[D]').astype(np.int64)
+        if epoch_days.size == 0:
+            return np.empty(epoch_days.shape, dtype=np.int8)
+
+        term_days, term_branches = self._term_arrays(epoch_days)
+        row = np.searchsorted(term_days, epoch_days, side='right') - 1
+        if (row < 0).any():
+            raise ValueError("Dates precede the first indexed sectional term")
+        return term_branches[row].astype(np.int8)
+
+    def sectional_term_mask(self, days) -> np.ndarray:
+        """Vectorized :meth:`_is_principal_solar_term_day` for a ``datetime64`` array (bool)."""
+        epoch_days = np.asarray(days).astype('datetime64[D]').astype(np.int64)
+        if epoch_days.size == 0:
+            return np.zeros(epoch_days.shape, dtype=np.bool_)
+        return np.isin(epoch_days, self._term_arrays(epoch_days)[0])
+
+    def star_indexes(self, days) -> np.ndarray:
+        """Vectorized :meth:`star_index` for a ``datetime64`` array of local dates.
+
+        Returns an int8 array of 0-based stars with the input's shape.
         """
-        is_solar_term = self._is_principal_solar_term_day(date_obj)
-
-        building_branch = BUILDING_BRANCH_BY_MONTH[dto.month]
-        base_star_index = self._star_index_from_branches(BRANCH_INDEX[building_branch], BRANCH_INDEX[dto.day_branch])
-        base_star = self.CONSTRUCTION_STARS[base_star_index]
+        days = np.asarray(days).astype('datetime64[D]')
+        day_branch = (days.astype(np.int64) + _DAY_BRANCH_SHIFT) % 12
+        return ((day_branch - self.building_branch_indexes(days)) % 12).astype(np.int8)
 
-        if prev_star_index is None:
-            actual_star = base_star
-        elif is_solar_term:
-            actual_star = self.CONSTRUCTION_STARS[prev_star_index]
-        else:
-            actual_star_index = (prev_star_index + 1) % 12
-            actual_star = self.CONSTRUCTION_STARS[actual_star_index]
+    def get_construction_star(self, date_obj: datetime, dto: LunisolarDateDTO = None,
+                              prev_star_index: int = None) -> str:
+        """Get construction star for date.
 
-        return actual_star
+        Computed directly from the day branch and the sectional-term month,
+        which already encodes the solar-term repeat rule; ``dto`` and
+        ``prev_star_index`` are accepted for compatibility but not needed.
+        """
+        return self.CONSTRUCTION_STARS[self.star_index(date_obj)]
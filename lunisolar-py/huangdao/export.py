@@ -0,0 +1,78 @@
+"""Streaming writers for Huangdao almanac records.
+
+Each writer consumes an iterator of day records (``calculate_day_info``
+dicts, or ``HuangdaoDay.to_dict()`` rendered on the fly) and writes them
+as it goes, so a 100-year almanac never has to be held in memory.
+Parquet output needs the optional ``pyarrow`` package and is written one
+row group per ``batch_size`` records.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from typing import Dict, Iterable, Iterator, List, TextIO
+
+FORMATS = ("jsonl", "csv", "parquet")
+DEFAULT_PARQUET_BATCH = 4096
+
+
+def write_jsonl(records: Iterable[Dict], stream: TextIO) -> int:
+    """Write one compact JSON object per line. Returns the number of records."""
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(records: Iterable[Dict], stream: TextIO) -> int:
+    """Write CSV with a header taken from the first record. Returns the number of records."""
+    writer = None
+    count = 0
+    for record in records:
+        if writer is None:
+            writer = csv.DictWriter(stream, fieldnames=list(record))
+            writer.writeheader()
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+def _batches(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    batch: List[Dict] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_parquet(records: Iterable[Dict], path: str, batch_size: int = DEFAULT_PARQUET_BATCH) -> int:
+    """Write a Parquet file, one row group per ``batch_size`` records.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from e
+
+    writer = None
+    count = 0
+    try:
+        for batch in _batches(records, batch_size):
+            table = pa.Table.from_pylist(batch)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            count += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
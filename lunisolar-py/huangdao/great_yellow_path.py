@@ -12,8 +12,10 @@ from .constants import (
 class GreatYellowPath:
     """Great Yellow Path (大黄道) Calculator"""
 
+    def spirit_index(self, lunar_month: int, day_branch_index: int) -> int:
+        """Index into ``SPIRIT_SEQUENCE`` of the day's spirit (0 = 青龙)."""
+        return (day_branch_index - AZURE_DRAGON_MONTHLY_START[lunar_month].index) % 12
+
     def calculate_spirit(self, lunar_month: int, day_branch_index: int) -> GreatYellowPathSpirit:
         """Calculate spirit for the day."""
-        azure_start = AZURE_DRAGON_MONTHLY_START[lunar_month]
-        spirit_index = (day_branch_index - azure_start.index) % 12
-        return SPIRIT_SEQUENCE[spirit_index]
+        return SPIRIT_SEQUENCE[self.spirit_index(lunar_month, day_branch_index)]
@@ -0,0 +1,95 @@
+"""Compact, integer-coded Huangdao day records.
+
+A :class:`HuangdaoDay` holds only small integers and flags: the star,
+spirit and branch indexes, the lunar month and the leap / sectional-term
+flags.  Characters, translations, levels and the legacy 17-key dict are
+resolved from the shared tables only when a record is rendered, so
+multi-year almanacs stay small and allocation-free until output.
+``HUANGDAO_DAY_DTYPE`` is the same layout as a NumPy structured array.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, Iterable, NamedTuple
+
+import numpy as np
+
+from .constants import BRANCH_ORDER, GreatYellowPathSpirit, SPIRIT_SEQUENCE
+from .construction_stars import ConstructionStars
+
+HUANGDAO_DAY_DTYPE = np.dtype([
+    ('ordinal', np.int32),
+    ('star', np.int8),
+    ('spirit', np.int8),
+    ('day_branch', np.int8),
+    ('building_branch', np.int8),
+    ('lunar_month', np.int8),
+    ('is_leap_month', np.bool_),
+    ('is_solar_term', np.bool_),
+])
+
+
+class HuangdaoDay(NamedTuple):
+    """One day of Construction Star / Great Yellow Path data, integer-coded."""
+    ordinal: int            # proleptic-Gregorian ordinal of the local date
+    star: int               # index into ConstructionStars.CONSTRUCTION_STARS (0 = 建)
+    spirit: int             # index into SPIRIT_SEQUENCE (0 = 青龙)
+    day_branch: int         # 0 = 子
+    building_branch: int    # 0 = 子, branch of the sectional-term month
+    lunar_month: int
+    is_leap_month: bool
+    is_solar_term: bool
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def star_char(self) -> str:
+        return ConstructionStars.CONSTRUCTION_STARS[self.star]
+
+    @property
+    def score(self) -> int:
+        return ConstructionStars.AUSPICIOUSNESS[self.star_char]["score"]
+
+    @property
+    def level(self) -> str:
+        return ConstructionStars.AUSPICIOUSNESS[self.star_char]["level"]
+
+    @property
+    def spirit_enum(self) -> GreatYellowPathSpirit:
+        return SPIRIT_SEQUENCE[self.spirit]
+
+    @property
+    def is_yellow_path(self) -> bool:
+        return SPIRIT_SEQUENCE[self.spirit].is_auspicious
+
+    def to_dict(self) -> Dict:
+        """Render the ``calculate_day_info`` dict (strings resolved here)."""
+        star = self.star_char
+        spirit = SPIRIT_SEQUENCE[self.spirit]
+        ausp = ConstructionStars.AUSPICIOUSNESS[star]
+        return {
+            "date": self.date.strftime("%Y-%m-%d"),
+            "star": star,
+            "translation": ConstructionStars.STAR_TRANSLATIONS[star],
+            "level": ausp["level"],
+            "score": ausp["score"],
+            "day_branch": BRANCH_ORDER[self.day_branch],
+            "lunar_month": self.lunar_month,
+            "lunar_month_display": f"{'閏' if self.is_leap_month else ''}{self.lunar_month}",
+            "building_branch": BRANCH_ORDER[self.building_branch],
+            "is_leap_month": self.is_leap_month,
+            "is_solar_term": self.is_solar_term,
+            "gyp_spirit": spirit.chinese,
+            "gyp_spirit_eng": spirit.english,
+            "gyp_is_auspicious": spirit.is_auspicious,
+            "gyp_auspiciousness": "吉" if spirit.is_auspicious else "凶",
+            "gyp_path_type": "黄道" if spirit.is_auspicious else "黑道",
+        }
+
+
+def records_to_array(records: Iterable[HuangdaoDay]) -> np.ndarray:
+    """Pack day records into a ``HUANGDAO_DAY_DTYPE`` structured array."""
+    return np.array([tuple(record) for record in records], dtype=HUANGDAO_DAY_DTYPE)
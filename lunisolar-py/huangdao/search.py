@@ -0,0 +1,126 @@
+"""Auspicious-day queries over integer-coded Huangdao records.
+
+Every criterion is a property of one small integer column (star, spirit,
+day branch, lunar month, sectional-term flag), so a query compiles to a
+handful of 12- or 13-entry boolean lookup tables.  Matching a block of
+``HUANGDAO_DAY_DTYPE`` records is then one fancy-index per column and a
+logical AND, with no strings and no per-day Python.
+
+Usage:
+    from huangdao.search import match_mask
+
+    mask = match_mask(records, yellow_path=True, min_score=3, avoid_clash_with='午')
+    records[mask]
+
+``HuangdaoCalculator.find_days`` runs these masks over a per-year day
+index and stops as soon as the requested number of days is found.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from .constants import BRANCH_INDEX, GreatYellowPathSpirit, SPIRIT_SEQUENCE
+from .construction_stars import ConstructionStars
+from .tables import SPIRIT_IS_YELLOW, STAR_SCORES
+
+StarLike = Union[int, str]
+SpiritLike = Union[int, str, GreatYellowPathSpirit]
+BranchLike = Union[int, str]
+
+_STAR_INDEX = {star: i for i, star in enumerate(ConstructionStars.CONSTRUCTION_STARS)}
+_SPIRIT_INDEX = {}
+for _i, _spirit in enumerate(SPIRIT_SEQUENCE):
+    _SPIRIT_INDEX[_spirit] = _SPIRIT_INDEX[_spirit.chinese] = _SPIRIT_INDEX[_spirit.english] = _i
+
+
+def _star_index(star: StarLike) -> int:
+    if isinstance(star, str):
+        if star not in _STAR_INDEX:
+            raise ValueError(f"Unknown construction star: {star!r}")
+        return _STAR_INDEX[star]
+    if not 0 <= star < 12:
+        raise ValueError(f"Star index must be 0..11, got {star}")
+    return star
+
+
+def _spirit_index(spirit: SpiritLike) -> int:
+    if isinstance(spirit, (str, GreatYellowPathSpirit)):
+        if spirit not in _SPIRIT_INDEX:
+            raise ValueError(f"Unknown Great Yellow Path spirit: {spirit!r}")
+        return _SPIRIT_INDEX[spirit]
+    if not 0 <= spirit < 12:
+        raise ValueError(f"Spirit index must be 0..11, got {spirit}")
+    return spirit
+
+
+def _branch_index(branch: BranchLike) -> int:
+    if isinstance(branch, str):
+        if branch not in BRANCH_INDEX:
+            raise ValueError(f"Unknown earthly branch: {branch!r}")
+        return BRANCH_INDEX[branch]
+    if not 0 <= branch < 12:
+        raise ValueError(f"Branch index must be 0..11, got {branch}")
+    return branch
+
+
+def match_mask(
+    records: np.ndarray,
+    *,
+    yellow_path: Optional[bool] = None,
+    min_score: Optional[int] = None,
+    stars: Optional[Iterable[StarLike]] = None,
+    spirits: Optional[Iterable[SpiritLike]] = None,
+    avoid_clash_with: Optional[BranchLike] = None,
+    lunar_months: Optional[Iterable[int]] = None,
+    allow_leap_month: bool = True,
+    solar_term: Optional[bool] = None,
+) -> np.ndarray:
+    """Boolean mask of the ``HUANGDAO_DAY_DTYPE`` records meeting every criterion.
+
+    Args:
+        records: Structured array of day records
+        yellow_path: Require a Yellow (True) or Black (False) Path spirit
+        min_score: Minimum construction-star score (1..4)
+        stars: Allowed stars (characters or 0-based indexes)
+        spirits: Allowed spirits (enum members, Chinese / English names or indexes)
+        avoid_clash_with: Exclude days whose branch clashes (六冲) with this
+                          branch, e.g. the year branch of the person involved
+        lunar_months: Allowed lunar month numbers
+        allow_leap_month: False excludes days in leap months
+        solar_term: Require (True) or exclude (False) sectional-term days
+    """
+    star_ok = np.ones(12, dtype=np.bool_)
+    if min_score is not None:
+        star_ok &= STAR_SCORES >= min_score
+    if stars is not None:
+        allowed = np.zeros(12, dtype=np.bool_)
+        allowed[[_star_index(s) for s in stars]] = True
+        star_ok &= allowed
+
+    spirit_ok = np.ones(12, dtype=np.bool_)
+    if yellow_path is not None:
+        spirit_ok &= SPIRIT_IS_YELLOW == yellow_path
+    if spirits is not None:
+        allowed = np.zeros(12, dtype=np.bool_)
+        allowed[[_spirit_index(s) for s in spirits]] = True
+        spirit_ok &= allowed
+
+    mask = star_ok[records['star']] & spirit_ok[records['spirit']]
+
+    if avoid_clash_with is not None:
+        mask &= records['day_branch'] != (_branch_index(avoid_clash_with) + 6) % 12
+    if lunar_months is not None:
+        months = list(lunar_months)
+        if any(not 1 <= m <= 12 for m in months):
+            raise ValueError(f"Lunar months must be 1..12, got {months}")
+        month_ok = np.zeros(13, dtype=np.bool_)
+        month_ok[months] = True
+        mask &= month_ok[records['lunar_month']]
+    if not allow_leap_month:
+        mask &= ~records['is_leap_month']
+    if solar_term is not None:
+        mask &= records['is_solar_term'] == solar_term
+    return mask
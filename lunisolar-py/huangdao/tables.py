@@ -0,0 +1,64 @@
+"""Precomputed int8 lookup tables for the Huangdao systems.
+
+Both systems are a function of two small integers per day, so each is one
+12-column table and a whole year (or century) of days classifies with a
+single fancy-indexing operation over month and day-branch arrays, such as
+the ``month`` and ``day_cycle`` columns of
+``lunisolar.vectorized.solar_to_lunisolar_array``:
+
+    SPIRIT_TABLE[result['month'], (result['day_cycle'] - 1) % 12]
+
+``SPIRIT_TABLE`` is indexed by lunar month number (row 0 is unused and
+holds -1).  Construction stars follow the solar month opened by the
+sectional terms, so ``STAR_TABLE`` is indexed by building branch (月建,
+see ``ConstructionStars.building_branch_indexes``);
+``LUNAR_MONTH_STAR_TABLE`` is the nominal lunar-month form
+(``BUILDING_BRANCH_BY_MONTH``) for callers that only have month numbers.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .constants import (
+    AZURE_DRAGON_MONTHLY_START,
+    BRANCH_INDEX,
+    BUILDING_BRANCH_BY_MONTH,
+    SPIRIT_SEQUENCE,
+)
+from .construction_stars import ConstructionStars
+
+_BRANCHES = np.arange(12)
+
+# [lunar_month 1..12, day_branch] -> index into SPIRIT_SEQUENCE (0 = 青龙)
+SPIRIT_TABLE = np.full((13, 12), -1, dtype=np.int8)
+for _month, _azure in AZURE_DRAGON_MONTHLY_START.items():
+    SPIRIT_TABLE[_month] = (_BRANCHES - _azure.index) % 12
+
+# [building_branch, day_branch] -> index into CONSTRUCTION_STARS (0 = 建)
+STAR_TABLE = ((_BRANCHES[None, :] - _BRANCHES[:, None]) % 12).astype(np.int8)
+
+# [lunar_month 1..12, day_branch] -> star, reckoning the month's nominal building branch
+LUNAR_MONTH_STAR_TABLE = np.full((13, 12), -1, dtype=np.int8)
+for _month, _branch in BUILDING_BRANCH_BY_MONTH.items():
+    LUNAR_MONTH_STAR_TABLE[_month] = STAR_TABLE[BRANCH_INDEX[_branch]]
+
+# Per-star score (1..4) and per-spirit Yellow Path flag
+STAR_SCORES = np.array(
+    [ConstructionStars.AUSPICIOUSNESS[star]["score"] for star in ConstructionStars.CONSTRUCTION_STARS],
+    dtype=np.int8,
+)
+SPIRIT_IS_YELLOW = np.array([spirit.is_auspicious for spirit in SPIRIT_SEQUENCE], dtype=np.bool_)
+
+for _table in (SPIRIT_TABLE, STAR_TABLE, LUNAR_MONTH_STAR_TABLE, STAR_SCORES, SPIRIT_IS_YELLOW):
+    _table.setflags(write=False)
+
+
+def spirit_indexes(lunar_months, day_branches) -> np.ndarray:
+    """Vectorized ``GreatYellowPath.spirit_index`` (int8, broadcast shape)."""
+    return SPIRIT_TABLE[np.asarray(lunar_months, dtype=np.intp), np.asarray(day_branches, dtype=np.intp)]
+
+
+def star_indexes(building_branches, day_branches) -> np.ndarray:
+    """Vectorized star index from building and day branches (int8, broadcast shape)."""
+    return STAR_TABLE[np.asarray(building_branches, dtype=np.intp), np.asarray(day_branches, dtype=np.intp)]
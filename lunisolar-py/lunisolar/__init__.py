@@ -3,17 +3,63 @@ lunisolar — Lunisolar Calendar Engine Package
 ===============================================
 
 Public API:
-    solar_to_lunisolar, solar_to_lunisolar_batch,
-    LunisolarDateDTO, get_stem_pinyin, get_branch_pinyin
+    solar_to_lunisolar, solar_to_lunisolar_batch, solar_to_lunisolar_instants,
+    LunisolarConverter, LunisolarDateDTO, CalendarMeridian, get_meridian, get_stem_pinyin, get_branch_pinyin,
+    MonthTable, use_month_table, get_month_table,
+    solar_to_lunisolar_array, BatchPlanner,
+    day_hour_pillars, day_hour_pillars_array
+
+Submodules are imported on first attribute access (PEP 562), so
+``lunisolar.pillars`` and the shared constants load without pulling in
+Skyfield or opening the ephemeris.
 """
 
+import importlib
+
 from shared.models import PrincipalTerm, MonthPeriod, LunisolarDateDTO
 from shared.constants import HEAVENLY_STEMS, EARTHLY_BRANCHES, PRINCIPAL_TERMS
 
-from .api import solar_to_lunisolar, solar_to_lunisolar_batch, get_stem_pinyin, get_branch_pinyin
-from .timezone_service import TimezoneService
-from .window_planner import WindowPlanner
-from .ephemeris_service import EphemerisService
-from .month_builder import MonthBuilder, TermIndexer, LeapMonthAssigner
-from .sexagenary import SexagenaryEngine
-from .resolver import LunarMonthResolver, ResultAssembler
+_EXPORTS = {
+    '.api': (
+        'solar_to_lunisolar', 'solar_to_lunisolar_batch', 'solar_to_lunisolar_instants',
+        'get_stem_pinyin',
+        'get_branch_pinyin', 'use_month_table', 'get_month_table',
+    ),
+    '.timezone_service': ('TimezoneService',),
+    '.window_planner': ('WindowPlanner',),
+    '.solstice_provider': ('SolsticeProvider', 'get_solstice_provider'),
+    '.ephemeris_service': ('EphemerisService',),
+    '.month_builder': ('MonthBuilder', 'TermIndexer', 'LeapMonthAssigner'),
+    '.sexagenary': ('SexagenaryEngine',),
+    '.resolver': ('LunarMonthResolver', 'ResultAssembler'),
+    '.period_index': ('PeriodIndex',),
+    '.month_table': ('MonthTable', 'MonthTableRow', 'MONTH_TABLE_VERSION'),
+    '.batch_planner': ('BatchPlanner', 'BatchPlan', 'YearSegment'),
+    '.converter': ('LunisolarConverter', 'get_converter', 'get_default_converter'),
+    '.meridian': ('CalendarMeridian', 'get_meridian', 'CHINESE', 'VIETNAMESE', 'KOREAN'),
+    '.vectorized': ('solar_to_lunisolar_array', 'LUNISOLAR_DTYPE'),
+    '.pillars': (
+        'DayHourPillars', 'day_pillar', 'hour_pillar', 'day_hour_pillars',
+        'day_hour_pillars_array', 'PILLARS_DTYPE',
+    ),
+}
+_LOCATIONS = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [
+    'PrincipalTerm', 'MonthPeriod', 'LunisolarDateDTO',
+    'HEAVENLY_STEMS', 'EARTHLY_BRANCHES', 'PRINCIPAL_TERMS',
+    *_LOCATIONS,
+]
+
+
+def __getattr__(name):
+    module = _LOCATIONS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LOCATIONS))
@@ -1,27 +1,41 @@
-"""CLI entry point for ``python -m lunisolar``."""
+"""CLI entry point for ``python -m lunisolar``.
+
+Usage:
+    python -m lunisolar --date 2025-01-20 --time 12:00 --tz Asia/Ho_Chi_Minh [--meridian vietnamese]
+    python -m lunisolar pillars --date 2025-01-20 --time 23:30 [--count N --step MIN]
+
+The ``pillars`` subcommand needs neither Skyfield nor the ephemeris file.
+"""
 
 import argparse
 import io
 import sys
 
-from .api import solar_to_lunisolar, get_stem_pinyin, get_branch_pinyin
-
 
 def main() -> None:
     # Ensure stdout can handle CJK characters on Windows
     if sys.stdout.encoding and sys.stdout.encoding.lower() != 'utf-8':
         sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
+    if len(sys.argv) > 1 and sys.argv[1] == 'pillars':
+        from .pillars import main as pillars_main
+        pillars_main(sys.argv[2:])
+        return
+
+    from .api import solar_to_lunisolar, get_stem_pinyin, get_branch_pinyin
+
     parser = argparse.ArgumentParser(description='Lunisolar Calendar Conversion')
     parser.add_argument('--date', type=str, required=True, help='Solar date in YYYY-MM-DD format')
     parser.add_argument('--time', type=str, default='12:00', help='Solar time in HH:MM format')
     parser.add_argument('--tz', type=str, default='Asia/Ho_Chi_Minh',
                         help='IANA timezone name (e.g., Asia/Ho_Chi_Minh)')
+    parser.add_argument('--meridian', type=str, default=None,
+                        help='Calendar meridian: chinese (UTC+8, default), vietnamese, korean, or an IANA zone')
 
     args = parser.parse_args()
 
     try:
-        result = solar_to_lunisolar(args.date, args.time, args.tz)
+        result = solar_to_lunisolar(args.date, args.time, args.tz, meridian=args.meridian)
 
         year_stem_pinyin = get_stem_pinyin((result.year_cycle - 1) % 10)
         year_branch_pinyin = get_branch_pinyin((result.year_cycle - 1) % 12)
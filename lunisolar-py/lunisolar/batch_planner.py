@@ -0,0 +1,167 @@
+"""BatchPlanner — splits an arbitrary span into per-lunar-year month segments.
+
+A lunar year (岁) runs from the Zi month containing one Winter Solstice to
+the Zi month containing the next, and every date from one Zi month's first
+(reference-meridian) day up to the next Zi month is numbered from the
+earlier solstice.  The planner computes new moons and
+principal terms for the whole span in one ephemeris pass, builds and tags
+the month periods once, locates each Zi month with a single forward scan,
+and numbers each solstice year independently.  Cost is linear in the
+length of the span, so century-long batch exports stay correct and cheap.
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import List, Tuple
+
+from utils import setup_logging
+from shared.models import MonthPeriod, NumberedMonth
+
+from .window_planner import WindowPlanner
+from .ephemeris_service import EphemerisService
+from .month_builder import MonthBuilder, TermIndexer, LeapMonthAssigner
+from .period_index import PeriodIndex
+
+
+@dataclass(frozen=True)
+class YearSegment:
+    """Months numbered from one Winter Solstice anchor.
+
+    ``months`` runs from the anchor's Zi month through the next Zi month
+    (plus one trailing month when available).  The first ``span`` months are
+    the ones that belong to this lunar year: the segment owns the CST dates
+    ``start_cst_date <= d < end_cst_date``.
+    """
+    anchor_solstice: datetime
+    next_solstice: datetime
+    months: Tuple[NumberedMonth, ...]
+    span: int
+    period_index: PeriodIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'period_index', PeriodIndex(self.months))
+
+    @property
+    def own_months(self) -> Tuple[NumberedMonth, ...]:
+        """Months from Zi(Y) up to, but excluding, Zi(Y+1)."""
+        return self.months[:self.span]
+
+    @property
+    def start_cst_date(self) -> date:
+        """First CST date of Zi(Y)."""
+        return self.months[0].start_cst_date
+
+    @property
+    def end_cst_date(self) -> date:
+        """First CST date of Zi(Y+1), the first date not owned by this segment."""
+        return self.months[self.span].start_cst_date
+
+    def owns(self, cst_date: date) -> bool:
+        """Return True if ``cst_date`` is numbered by this segment."""
+        return self.start_cst_date <= cst_date < self.end_cst_date
+
+
+@dataclass(frozen=True)
+class BatchPlan:
+    """Ordered year segments covering a batch span."""
+    segments: Tuple[YearSegment, ...]
+    starts: Tuple[date, ...]
+
+    def segment_for(self, cst_date: date) -> YearSegment:
+        """Return the segment that owns ``cst_date`` (a reference-meridian date)."""
+        i = bisect_right(self.starts, cst_date) - 1
+        if i < 0 or not self.segments[i].owns(cst_date):
+            raise ValueError(f"No year segment planned for {cst_date}")
+        return self.segments[i]
+
+
+class BatchPlanner:
+    """Plans one-pass ephemeris windows and per-solstice-year month segments."""
+
+    def __init__(
+        self,
+        window_planner: WindowPlanner,
+        ephemeris_service: EphemerisService,
+        month_builder: MonthBuilder,
+        term_indexer: TermIndexer,
+        leap_assigner: LeapMonthAssigner,
+    ):
+        self.logger = setup_logging()
+        self.window_planner = window_planner
+        self.ephemeris_service = ephemeris_service
+        self.month_builder = month_builder
+        self.term_indexer = term_indexer
+        self.leap_assigner = leap_assigner
+
+    def plan(self, start_utc: datetime, end_utc: datetime) -> BatchPlan:
+        """Return the year segments that own the CST dates of every instant in [start, end]."""
+        start = start_utc.replace(tzinfo=None) if start_utc.tzinfo else start_utc
+        end = end_utc.replace(tzinfo=None) if end_utc.tzinfo else end_utc
+        if end < start:
+            raise ValueError("end_utc must not be before start_utc")
+
+        to_cst_date = self.month_builder.tz_service.utc_to_cst_date
+        start_date, end_date = to_cst_date(start), to_cst_date(end)
+        solstices = self.window_planner.solstice_provider.solstices(
+            start_date.year - 1, end_date.year + 1
+        )
+        solstice_dates = {year: to_cst_date(s) for year, s in solstices.items()}
+        first_anchor = start_date.year if start_date >= solstice_dates[start_date.year] else start_date.year - 1
+        last_anchor = end_date.year if end_date >= solstice_dates[end_date.year] else end_date.year - 1
+        anchor_years = list(range(first_anchor, last_anchor + 2))
+
+        window_start = solstices[first_anchor] - timedelta(days=30)
+        # The last Zi month may start as late as the solstice's CST date
+        window_end = solstices[last_anchor + 1] + timedelta(days=45)
+
+        new_moons = self.ephemeris_service.compute_new_moons(window_start, window_end)
+        principal_terms = self.ephemeris_service.compute_principal_terms(window_start, window_end)
+        if not new_moons:
+            raise ValueError("No new moons found in calculation window")
+
+        periods = self.month_builder.build_month_periods(new_moons)
+        self.term_indexer.tag_principal_terms(periods, principal_terms)
+
+        zi_indexes = self._locate_zi_months(periods, [solstice_dates[y] for y in anchor_years])
+        if end_date >= periods[zi_indexes[-1]].start_cst_date:
+            # ``end`` falls in Zi(last + 1) before its solstice: that year owns it
+            return self.plan(start, solstices[last_anchor + 1])
+
+        segments = []
+        for k, year in enumerate(anchor_years[:-1]):
+            first, next_zi = zi_indexes[k], zi_indexes[k + 1]
+            if periods[next_zi].start_cst_date <= start_date:
+                continue  # ``start`` is already in Zi(year + 1)
+            months = self.leap_assigner.number_segment(
+                periods[first:next_zi + 2], solstices[year]
+            )
+            segments.append(YearSegment(
+                anchor_solstice=solstices[year],
+                next_solstice=solstices[year + 1],
+                months=months,
+                span=next_zi - first,
+            ))
+
+        self.logger.debug(
+            "Planned %d year segments over %d periods (%s to %s)",
+            len(segments), len(periods), window_start, window_end,
+        )
+        return BatchPlan(
+            segments=tuple(segments),
+            starts=tuple(s.start_cst_date for s in segments),
+        )
+
+    @staticmethod
+    def _locate_zi_months(periods: List[MonthPeriod], solstice_dates: List[date]) -> List[int]:
+        """Index of the period containing each (ascending) solstice CST date, in one
+        forward scan; dates are compared like principal terms in TermIndexer."""
+        indexes = []
+        i = 0
+        for solstice_date in solstice_dates:
+            while i < len(periods) and periods[i].end_cst_date <= solstice_date:
+                i += 1
+            if i == len(periods) or not periods[i].start_cst_date <= solstice_date:
+                raise ValueError("Could not find Zi month containing Winter Solstice")
+            indexes.append(i)
+        return indexes
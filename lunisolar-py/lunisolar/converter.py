@@ -0,0 +1,353 @@
+"""LunisolarConverter — long-lived, thread-safe conversion engine.
+
+The module-level ``solar_to_lunisolar`` / ``solar_to_lunisolar_batch``
+functions used to assemble the whole service pipeline (and log a
+``TimezoneHandler`` INFO line) on every call.  A converter owns those
+services once, keeps one ``TimezoneService`` / ``SexagenaryEngine`` pair
+per IANA zone, an LRU of numbered lunar-year segments keyed by anchor
+solstice year, and an optional precomputed :class:`MonthTable`.  The
+services are stateless, so a single instance can be shared by every
+request handler and thread; the caches are guarded by a lock.
+
+Each converter works on one calendar reference meridian (UTC+8 Chinese by
+default, see ``lunisolar.meridian``); ``get_converter(meridian)`` keeps one
+converter per meridian, so several national calendars can be served from
+one process, each with its own segment cache and month table.
+
+Usage:
+    from lunisolar.converter import LunisolarConverter
+
+    converter = LunisolarConverter()
+    result = converter.convert('2025-01-20', '12:00', 'Asia/Ho_Chi_Minh')
+    results = converter.convert_instants([date(2025, 1, 20), 1737331200])
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from utils import setup_logging, log_enabled
+from timezone_handler import TimezoneHandler, Instant, epoch_seconds_to_datetimes
+from shared.models import LunisolarDateDTO
+
+from .timezone_service import TimezoneService
+from .window_planner import WindowPlanner
+from .ephemeris_service import EphemerisService
+from .month_builder import MonthBuilder, TermIndexer, LeapMonthAssigner
+from .sexagenary import SexagenaryEngine
+from .resolver import LunarMonthResolver, ResultAssembler
+from .month_table import MonthTable
+from .batch_planner import BatchPlanner, YearSegment
+from .solstice_provider import SolsticeProvider
+from .meridian import CalendarMeridian, MeridianLike, get_meridian
+
+DEFAULT_SEGMENT_CACHE_SIZE = 64
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+
+class LunisolarConverter:
+    """Reusable solar → lunisolar conversion pipeline with shared caches."""
+
+    def __init__(
+        self,
+        month_table: Optional[MonthTable] = None,
+        segment_cache_size: int = DEFAULT_SEGMENT_CACHE_SIZE,
+        solstice_provider: Optional[SolsticeProvider] = None,
+        meridian: MeridianLike = None,
+    ):
+        if segment_cache_size < 1:
+            raise ValueError("segment_cache_size must be at least 1")
+        self.logger = setup_logging()
+        self.meridian: CalendarMeridian = get_meridian(meridian)
+        self.month_table = None
+        self.segment_cache_size = segment_cache_size
+
+        # Month structure is evaluated on reference-meridian dates, whatever the input zone
+        self.cst_service = TimezoneService(meridian=self.meridian)
+        self.window_planner = WindowPlanner(solstice_provider)
+        self.ephemeris_service = EphemerisService(self.meridian)
+        self.month_builder = MonthBuilder(self.cst_service)
+        self.term_indexer = TermIndexer()
+        self.leap_assigner = LeapMonthAssigner(self.meridian)
+        self.month_resolver = LunarMonthResolver(self.cst_service)
+        self.result_assembler = ResultAssembler()
+        self.batch_planner = BatchPlanner(
+            self.window_planner, self.ephemeris_service, self.month_builder,
+            self.term_indexer, self.leap_assigner,
+        )
+
+        self._lock = threading.Lock()
+        self._zones: Dict[str, Tuple[TimezoneService, SexagenaryEngine]] = {}
+        self._segments: 'OrderedDict[int, YearSegment]' = OrderedDict()
+        self.use_month_table(month_table)
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def use_month_table(self, table: Union[MonthTable, str, None]) -> Optional[MonthTable]:
+        """Install a :class:`MonthTable` (or a path to one, or None to disable).
+
+        Raises:
+            ValueError: If the table was built for a different meridian.
+        """
+        if isinstance(table, str):
+            table = MonthTable.load(table)
+        if table is not None and table.meridian != self.meridian:
+            raise ValueError(
+                f"Month table meridian {table.meridian.name!r} does not match "
+                f"converter meridian {self.meridian.name!r}"
+            )
+        self.month_table = table
+        return table
+
+    def clear_caches(self) -> None:
+        """Drop cached year segments and per-timezone services."""
+        with self._lock:
+            self._segments.clear()
+            self._zones.clear()
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def convert(
+        self,
+        solar_date: str,
+        solar_time: str = "12:00",
+        timezone_name: str = 'Asia/Shanghai',
+    ) -> LunisolarDateDTO:
+        """Convert one local solar date/time to a :class:`LunisolarDateDTO`."""
+        tz_service, sexagenary_engine = self._zone(timezone_name)
+        local_datetime = tz_service.parse_local_datetime(solar_date, solar_time)
+        target_utc = tz_service.local_to_utc(local_datetime)
+
+        verbose = log_enabled(self.logger, logging.INFO)
+        if verbose:
+            self.logger.info(f"Converting {solar_date} {solar_time} to lunisolar")
+
+        result = self._resolve_from_table(local_datetime, target_utc, sexagenary_engine)
+        if result is not None:
+            if verbose:
+                self.logger.info(f"Conversion completed from month table: {result.year}-{result.month}-{result.day}")
+            return result
+
+        target_date = self.cst_service.utc_to_cst_date(
+            target_utc.replace(tzinfo=None) if target_utc.tzinfo else target_utc
+        )
+        segment = self._owning_segment(target_date)
+        if segment is None:
+            plan = self.batch_planner.plan(target_utc, target_utc)
+            self._store_segments(plan.segments)
+            segment = plan.segment_for(target_date)
+
+        result = self._resolve_in_segment(segment, local_datetime, target_utc, sexagenary_engine)
+        if verbose:
+            self.logger.info(f"Conversion completed: {result.year}-{result.month}-{result.day}")
+        return result
+
+    def convert_batch(
+        self,
+        date_range: List[Tuple[str, str]],
+        timezone_name: str = 'Asia/Shanghai',
+    ) -> List[LunisolarDateDTO]:
+        """Convert many ``(date_str, time_str)`` pairs, in input order.
+
+        Local times are shifted to UTC in one vectorized pass over the
+        zone's :class:`OffsetTable`; year segments missing from the cache
+        are planned together in one ephemeris pass (see :class:`BatchPlanner`).
+        """
+        if not date_range:
+            return []
+
+        tz_handler = self._zone(timezone_name)[0].tz_handler
+        local_seconds = np.fromiter(
+            (
+                (tz_handler.parse_naive_datetime(solar_date, solar_time) - _UNIX_EPOCH) // _ONE_SECOND
+                for solar_date, solar_time in date_range
+            ),
+            dtype=np.int64,
+            count=len(date_range),
+        )
+        utc_seconds = tz_handler.offset_table.local_to_utc(local_seconds)
+        return self._convert_seconds(local_seconds, utc_seconds, timezone_name)
+
+    def convert_instants(
+        self,
+        values: Iterable[Instant],
+        timezone_name: str = 'Asia/Shanghai',
+        default_time: str = "12:00",
+    ) -> List[LunisolarDateDTO]:
+        """Convert ``date`` / ``datetime`` / epoch values without string parsing.
+
+        Plain dates are taken at ``default_time`` local and naive datetimes
+        as local wall-clock time; aware datetimes and epoch seconds (UTC)
+        are absolute instants whose local time comes from ``timezone_name``.
+        """
+        tz_handler = self._zone(timezone_name)[0].tz_handler
+        pairs = [tz_handler.instant_seconds(value, default_time) for value in values]
+        if not pairs:
+            return []
+        seconds = np.array(pairs, dtype=np.int64)
+        return self._convert_seconds(seconds[:, 0], seconds[:, 1], timezone_name)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _zone(self, timezone_name: str) -> Tuple[TimezoneService, SexagenaryEngine]:
+        zone = self._zones.get(timezone_name)
+        if zone is None:
+            tz_service = TimezoneService(TimezoneHandler(timezone_name))
+            zone = (tz_service, SexagenaryEngine(tz_service))
+            with self._lock:
+                zone = self._zones.setdefault(timezone_name, zone)
+        return zone
+
+    def _convert_seconds(
+        self,
+        local_seconds: np.ndarray,
+        utc_seconds: np.ndarray,
+        timezone_name: str,
+    ) -> List[LunisolarDateDTO]:
+        """Resolve parallel local / UTC epoch-second arrays, in input order."""
+        sexagenary_engine = self._zone(timezone_name)[1]
+        parsed_dates = list(zip(
+            epoch_seconds_to_datetimes(local_seconds),
+            epoch_seconds_to_datetimes(utc_seconds),
+        ))
+
+        results: List[Optional[LunisolarDateDTO]] = [None] * len(parsed_dates)
+        pending = []
+        for i, (local_dt, target_utc) in enumerate(parsed_dates):
+            result = self._resolve_from_table(local_dt, target_utc, sexagenary_engine)
+            if result is None:
+                pending.append(i)
+            else:
+                results[i] = result
+        if not pending:
+            return results
+
+        dates = {i: self.cst_service.utc_to_cst_date(parsed_dates[i][1]) for i in pending}
+        years = [d.year for d in dates.values()]
+        self.window_planner.solstice_provider.solstices(min(years) - 1, max(years))
+        owners = {i: self._owning_segment(dates[i]) for i in pending}
+        uncached = [i for i in pending if owners[i] is None]
+        if uncached:
+            instants = [parsed_dates[i][1] for i in uncached]
+            plan = self.batch_planner.plan(min(instants), max(instants))
+            self._store_segments(plan.segments)
+            for i in uncached:
+                owners[i] = plan.segment_for(dates[i])
+
+        for i in pending:
+            local_dt, target_utc = parsed_dates[i]
+            results[i] = self._resolve_in_segment(
+                owners[i], local_dt, target_utc, sexagenary_engine
+            )
+        return results
+
+    def _anchor_year(self, cst_date: date) -> int:
+        """Year of the last Winter Solstice on or before ``cst_date`` (CST dates).
+
+        The owning segment is this year's or, between the first day of the
+        next Zi month and that solstice, the next year's.
+        """
+        solstice = self.window_planner._find_winter_solstice(cst_date.year)
+        return cst_date.year if cst_date >= self.cst_service.utc_to_cst_date(solstice) else cst_date.year - 1
+
+    def _owning_segment(self, cst_date: date) -> Optional[YearSegment]:
+        """Cached segment that owns ``cst_date``, or None if it must be planned."""
+        year = self._anchor_year(cst_date)
+        for anchor in (year, year + 1):
+            segment = self._cached_segment(anchor)
+            if segment is None:
+                return None
+            if segment.owns(cst_date):
+                return segment
+        return None
+
+    def _cached_segment(self, year: int) -> Optional[YearSegment]:
+        with self._lock:
+            segment = self._segments.get(year)
+            if segment is not None:
+                self._segments.move_to_end(year)
+            return segment
+
+    def _store_segments(self, segments) -> None:
+        with self._lock:
+            for segment in segments:
+                year = segment.anchor_solstice.year
+                self._segments[year] = segment
+                self._segments.move_to_end(year)
+            while len(self._segments) > self.segment_cache_size:
+                self._segments.popitem(last=False)
+
+    def _resolve_from_table(
+        self,
+        local_datetime: datetime,
+        target_utc: datetime,
+        sexagenary_engine: SexagenaryEngine,
+    ) -> Optional[LunisolarDateDTO]:
+        """Resolve one date against the installed table; None when out of range."""
+        table = self.month_table
+        if table is None:
+            return None
+        target_naive = target_utc.replace(tzinfo=None) if target_utc.tzinfo else target_utc
+        resolved = table.resolve(self.cst_service.utc_to_cst_date(target_naive))
+        if resolved is None:
+            return None
+        row, lunar_day = resolved
+        return self._assemble(row.lunar_year, row, lunar_day, local_datetime, sexagenary_engine)
+
+    def _resolve_in_segment(
+        self,
+        segment: YearSegment,
+        local_datetime: datetime,
+        target_utc: datetime,
+        sexagenary_engine: SexagenaryEngine,
+    ) -> LunisolarDateDTO:
+        target_period = self.month_resolver.find_period_for_datetime(segment.period_index, target_utc)
+        lunar_day = self.month_resolver.calculate_lunar_day(target_utc, target_period)
+        lunar_year = self.month_resolver.calculate_lunar_year(target_period)
+        return self._assemble(lunar_year, target_period, lunar_day, local_datetime, sexagenary_engine)
+
+    def _assemble(self, lunar_year, target_period, lunar_day, local_datetime, sexagenary_engine):
+        day_ganzhi = sexagenary_engine.ganzhi_day(local_datetime)
+        return self.result_assembler.assemble_result(
+            lunar_year=lunar_year,
+            target_period=target_period,
+            lunar_day=lunar_day,
+            local_hour=local_datetime.hour,
+            year_ganzhi=sexagenary_engine.ganzhi_year(lunar_year),
+            month_ganzhi=sexagenary_engine.ganzhi_month(lunar_year, target_period.month_number),
+            day_ganzhi=day_ganzhi,
+            hour_ganzhi=sexagenary_engine.ganzhi_hour(local_datetime, day_ganzhi[0]),
+        )
+
+
+_CONVERTERS: Dict[CalendarMeridian, LunisolarConverter] = {}
+_CONVERTERS_LOCK = threading.Lock()
+
+
+def get_converter(meridian: MeridianLike = None) -> LunisolarConverter:
+    """Return the process-wide converter for a calendar meridian."""
+    meridian = get_meridian(meridian)
+    converter = _CONVERTERS.get(meridian)
+    if converter is None:
+        with _CONVERTERS_LOCK:
+            converter = _CONVERTERS.get(meridian)
+            if converter is None:
+                converter = _CONVERTERS[meridian] = LunisolarConverter(meridian=meridian)
+    return converter
+
+
+def get_default_converter() -> LunisolarConverter:
+    """Return the process-wide converter behind the module-level API (UTC+8)."""
+    return get_converter()
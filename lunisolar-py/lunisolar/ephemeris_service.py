@@ -1,7 +1,7 @@
 """EphemerisService — single-pass computation of new moons and principal terms."""
 
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime
+from typing import List, Tuple
 
 from skyfield.api import utc
 
@@ -9,18 +9,53 @@ from utils import setup_logging
 from solar_terms import calculate_solar_terms
 from moon_phases import calculate_moon_phases
 from shared.models import PrincipalTerm
+from ephemeris.event_cache import get_event_cache, us_to_datetime
+
+from .meridian import CalendarMeridian, MeridianLike, get_meridian
+
+
+def _new_moons_in_year(year: int):
+    """Event-cache filler: new moon instants (µs) in one UTC calendar year."""
+    rows = calculate_moon_phases(datetime(year, 1, 1, tzinfo=utc), datetime(year + 1, 1, 1, tzinfo=utc))
+    times = [timestamp * 1_000_000 for timestamp, phase_index, _ in rows if phase_index == 0]
+    if not times:
+        raise ValueError(f"No new moons computed for {year}")
+    return times, [0] * len(times)
+
+
+def _solar_terms_in_year(year: int):
+    """Event-cache filler: all 24 solar terms (µs, skyfield index) in one UTC year."""
+    rows = calculate_solar_terms(datetime(year, 1, 1, tzinfo=utc), datetime(year + 1, 1, 1, tzinfo=utc))
+    if not rows:
+        raise ValueError(f"No solar terms computed for {year}")
+    return [row[0] * 1_000_000 for row in rows], [row[1] for row in rows]
+
+
+def _cached_events(kind: str, start: datetime, end: datetime, compute_year):
+    """Return ``[(naive_utc, code)]`` for cached ``kind`` events in [start, end],
+    or None when the persistent event cache is disabled."""
+    cache = get_event_cache()
+    if cache is None:
+        return None
+    times, codes = cache.events_between(kind, start, end, compute_year)
+    return [(us_to_datetime(t), int(c)) for t, c in zip(times.tolist(), codes.tolist())]
 
 
 class EphemerisService:
     """Single-pass computation of new moons and principal terms."""
 
-    def __init__(self):
+    def __init__(self, meridian: MeridianLike = None):
         self.logger = setup_logging()
+        self.meridian: CalendarMeridian = get_meridian(meridian)
 
     def compute_new_moons(self, start: datetime, end: datetime) -> List[datetime]:
         """Return sorted UTC instants of new moons in [start, end].
-        One pass only per window."""
+        One pass only per window; served from the event cache when enabled."""
         try:
+            cached = _cached_events('new_moons', start, end, _new_moons_in_year)
+            if cached is not None:
+                return [instant for instant, _ in cached]
+
             if start.tzinfo is None:
                 start_aware = start.replace(tzinfo=utc)
             else:
@@ -44,10 +79,32 @@ class EphemerisService:
             self.logger.error(f"Error computing new moons: {e}")
             return []
 
+    def compute_solar_terms(self, start: datetime, end: datetime) -> List[Tuple[datetime, int]]:
+        """Return ``(naive_utc, skyfield_index)`` for all 24 solar terms in [start, end].
+        One ``find_discrete`` pass; served from the event cache when enabled."""
+        try:
+            cached = _cached_events('solar_terms', start, end, _solar_terms_in_year)
+            if cached is not None:
+                return cached
+
+            start_aware = start.replace(tzinfo=utc) if start.tzinfo is None else start
+            end_aware = end.replace(tzinfo=utc) if end.tzinfo is None else end
+            return [
+                (datetime.fromtimestamp(timestamp, tz=utc).replace(tzinfo=None), int(idx))
+                for timestamp, idx, _zht, _zhs, _vn in calculate_solar_terms(start_aware, end_aware)
+            ]
+        except Exception as e:
+            self.logger.error(f"Error computing solar terms: {e}")
+            return []
+
     def compute_principal_terms(self, start: datetime, end: datetime) -> List[PrincipalTerm]:
-        """Return principal terms (Z1..Z12) with UTC instants and CST dates
-        precomputed for date-only mapping."""
+        """Return principal terms (Z1..Z12) with UTC instants and reference-meridian
+        (CST by default) dates precomputed for date-only mapping."""
         try:
+            cached = _cached_events('solar_terms', start, end, _solar_terms_in_year)
+            if cached is not None:
+                return [self._principal_term(instant, idx) for instant, idx in cached if idx % 2 == 0]
+
             if start.tzinfo is None:
                 start_aware = start.replace(tzinfo=utc)
             else:
@@ -64,19 +121,23 @@ class EphemerisService:
             for timestamp, idx, zht, zhs, vn in solar_terms:
                 if idx % 2 == 0:
                     term_datetime = datetime.fromtimestamp(timestamp, tz=utc).replace(tzinfo=None)
-                    principal_term_number = (idx // 2) + 1
-                    if principal_term_number > 12:
-                        principal_term_number -= 12
-
-                    cst_date = (term_datetime + timedelta(hours=8)).date()
-
-                    principal_terms.append(PrincipalTerm(
-                        instant_utc=term_datetime,
-                        cst_date=cst_date,
-                        term_index=principal_term_number
-                    ))
+                    principal_terms.append(self._principal_term(term_datetime, idx))
 
             return principal_terms
         except Exception as e:
             self.logger.error(f"Error computing principal terms: {e}")
             return []
+
+    def _principal_term(self, term_datetime: datetime, idx: int) -> PrincipalTerm:
+        """Map an even skyfield solar-term index (0 = spring equinox) to Z1..Z12."""
+        principal_term_number = (idx // 2) + 1
+        if principal_term_number > 12:
+            principal_term_number -= 12
+
+        cst_date = self.meridian.to_date(term_datetime)
+
+        return PrincipalTerm(
+            instant_utc=term_datetime,
+            cst_date=cst_date,
+            term_index=principal_term_number
+        )
@@ -0,0 +1,202 @@
+"""CalendarMeridian — the reference clock that defines lunisolar dates.
+
+A lunar month starts on the civil date of its new moon, and a principal
+term counts for the month holding its civil date; both dates are read on
+one reference clock.  The Chinese calendar uses UTC+8 (120°E), the
+Vietnamese UTC+7 and the Korean UTC+9, and several of them changed
+meridian in the 20th century.  A meridian is therefore a step function
+from UTC instants to offsets: a fixed offset for the modern calendars, or
+a schedule of ``(utc_instant, offset)`` switches for historical ones.
+
+The meridian only changes how UTC instants map to calendar dates, so new
+moon, solar term and solstice instants (and the event cache holding them)
+are shared; month tables and year segments are built per meridian.
+
+Usage:
+    from lunisolar.meridian import get_meridian
+
+    get_meridian('vietnamese').to_date(datetime(2025, 1, 28, 17, 0))   # 2025-01-29
+    get_meridian('Asia/Seoul')    # standard-time history of an IANA zone
+"""
+
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+_SECONDS_PER_DAY = 86400
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_UNIX_EPOCH_ORDINAL = _UNIX_EPOCH.toordinal()
+
+Offset = Union[int, float, timedelta]
+
+
+def _offset_seconds(offset: Offset) -> int:
+    """Hours (int/float) or a timedelta -> whole seconds."""
+    if isinstance(offset, timedelta):
+        return int(offset.total_seconds())
+    return int(round(offset * 3600))
+
+
+class CalendarMeridian:
+    """Reference UTC offset (possibly changing over time) of a national calendar."""
+
+    __slots__ = ('name', '_switches', '_offsets')
+
+    def __init__(
+        self,
+        name: str,
+        offset: Offset,
+        transitions: Sequence[Tuple[datetime, Offset]] = (),
+    ):
+        """
+        Args:
+            name: Label used in logs and saved month tables.
+            offset: Offset in effect before the first transition (hours or timedelta).
+            transitions: Ascending ``(naive_utc_instant, new_offset)`` switches.
+        """
+        switches = [int((instant - _UNIX_EPOCH).total_seconds()) for instant, _ in transitions]
+        if any(b <= a for a, b in zip(switches, switches[1:])):
+            raise ValueError("Meridian transitions must be strictly ascending")
+        self.name = name
+        self._switches = tuple(switches)
+        self._offsets = (_offset_seconds(offset),) + tuple(_offset_seconds(o) for _, o in transitions)
+
+    @classmethod
+    def from_timezone(cls, timezone_name: str) -> 'CalendarMeridian':
+        """Standard-time (DST removed) offset history of an IANA zone."""
+        import pytz
+
+        tz = pytz.timezone(timezone_name)
+        infos = getattr(tz, '_transition_info', None)
+        if not infos:
+            return cls(timezone_name, tz.utcoffset(datetime(2000, 1, 1)))
+
+        transitions = []
+        current = infos[0][0] - infos[0][1]
+        for instant, (utcoffset, dst, _) in zip(tz._utc_transition_times[1:], infos[1:]):
+            standard = utcoffset - dst
+            if standard != current:
+                transitions.append((instant, standard))
+                current = standard
+        return cls(timezone_name, infos[0][0] - infos[0][1], transitions)
+
+    # ------------------------------------------------------------------
+    # Identity
+    # ------------------------------------------------------------------
+
+    @property
+    def key(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Hashable schedule; meridians with the same schedule share tables."""
+        return self._switches, self._offsets
+
+    @property
+    def is_fixed(self) -> bool:
+        """True when the offset never changes."""
+        return not self._switches
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CalendarMeridian) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"CalendarMeridian({self.name!r}, {len(self._offsets)} offset(s))"
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    def offset_at(self, utc_datetime: datetime) -> timedelta:
+        """Offset in effect at a naive (or aware) UTC instant."""
+        if not self._switches:
+            return timedelta(seconds=self._offsets[0])
+        if utc_datetime.tzinfo is not None:
+            utc_datetime = utc_datetime.replace(tzinfo=None)
+        seconds = (utc_datetime - _UNIX_EPOCH).total_seconds()
+        return timedelta(seconds=self._offsets[bisect_right(self._switches, seconds)])
+
+    def to_date(self, utc_datetime: datetime) -> date:
+        """Calendar date of a UTC instant on this meridian."""
+        return (utc_datetime + self.offset_at(utc_datetime)).date()
+
+    def ordinals(self, epoch_seconds: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`to_date` as proleptic-Gregorian ordinals (int64)."""
+        epoch_seconds = np.asarray(epoch_seconds, dtype=np.int64)
+        if self._switches:
+            offsets = np.asarray(self._offsets, dtype=np.int64)
+            offset = offsets[np.searchsorted(self._switches, epoch_seconds, side='right')]
+        else:
+            offset = self._offsets[0]
+        return np.floor_divide(epoch_seconds + offset, _SECONDS_PER_DAY) + _UNIX_EPOCH_ORDINAL
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """JSON-serializable schedule (offsets in seconds)."""
+        return {
+            "name": self.name,
+            "offset_seconds": list(self._offsets),
+            "transitions_utc": [
+                (_UNIX_EPOCH + timedelta(seconds=s)).isoformat() for s in self._switches
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CalendarMeridian':
+        """Rebuild a meridian from :meth:`to_dict` output."""
+        offsets = data["offset_seconds"]
+        transitions = [
+            (datetime.fromisoformat(instant), timedelta(seconds=offset))
+            for instant, offset in zip(data.get("transitions_utc", []), offsets[1:])
+        ]
+        return cls(data["name"], timedelta(seconds=offsets[0]), transitions)
+
+
+CHINESE = CalendarMeridian('chinese', 8)
+VIETNAMESE = CalendarMeridian('vietnamese', 7)
+KOREAN = CalendarMeridian('korean', 9)
+# Beijing mean solar time (116°25'E) until the 1929 switch to 120°E
+CHINESE_HISTORICAL = CalendarMeridian(
+    'chinese-historical', timedelta(hours=7, minutes=45, seconds=40),
+    [(datetime(1928, 12, 31, 16, 0), 8)],
+)
+# North Vietnam moved its calendar from UTC+8 to UTC+7 on 1967-08-08
+VIETNAMESE_HISTORICAL = CalendarMeridian(
+    'vietnamese-historical', 8, [(datetime(1967, 8, 7, 16, 0), 7)],
+)
+
+MERIDIANS: Dict[str, CalendarMeridian] = {
+    meridian.name: meridian
+    for meridian in (CHINESE, VIETNAMESE, KOREAN, CHINESE_HISTORICAL, VIETNAMESE_HISTORICAL)
+}
+
+DEFAULT_MERIDIAN = CHINESE
+
+MeridianLike = Union[CalendarMeridian, str, int, float, timedelta, None]
+
+
+def get_meridian(value: MeridianLike = None) -> CalendarMeridian:
+    """Resolve a meridian from an instance, a preset name (``'chinese'``,
+    ``'vietnamese'``, ``'korean'``, ...), an IANA zone name, or a fixed
+    offset in hours.  None means the Chinese UTC+8 default."""
+    if value is None:
+        return DEFAULT_MERIDIAN
+    if isinstance(value, CalendarMeridian):
+        return value
+    if isinstance(value, str):
+        preset = MERIDIANS.get(value.lower())
+        if preset is not None:
+            return preset
+        try:
+            return CalendarMeridian.from_timezone(value)
+        except Exception as e:
+            raise ValueError(f"Unknown calendar meridian: {value!r}") from e
+    if isinstance(value, (int, float, timedelta)) and not isinstance(value, bool):
+        seconds = _offset_seconds(value)
+        return CalendarMeridian(f"UTC{'+' if seconds >= 0 else '-'}{timedelta(seconds=abs(seconds))}", value)
+    raise TypeError(f"Expected a CalendarMeridian, name or offset, got {type(value).__name__}")
@@ -2,11 +2,12 @@
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
-from utils import setup_logging
-from shared.models import PrincipalTerm, MonthPeriod
+from utils import setup_logging, log_enabled
+from shared.models import PrincipalTerm, MonthPeriod, NumberedMonth
 from .timezone_service import TimezoneService
+from .meridian import CalendarMeridian, MeridianLike, get_meridian
 
 
 class MonthBuilder:
@@ -37,7 +38,7 @@ class MonthBuilder:
             )
             periods.append(period)
 
-        self.logger.debug(f"Built {len(periods)} month periods")
+        self.logger.debug("Built %d month periods", len(periods))
         return periods
 
 
@@ -50,20 +51,84 @@ class TermIndexer:
     def tag_principal_terms(self, periods: List[MonthPeriod], terms: List[PrincipalTerm]) -> None:
         """For each term, find the MonthPeriod whose CST startDate <= term.cstDate < endDate.
         If term.cstDate == period.endCstDate, skip (belongs to next month).
-        Set period.hasPrincipalTerm = True."""
-        for term in terms:
-            for period in periods:
-                if period.start_cst_date <= term.cst_date < period.end_cst_date:
-                    period.has_principal_term = True
-                    self.logger.debug(f"Term Z{term.term_index} mapped to month period {period.index}")
-                    break
+        Set period.hasPrincipalTerm = True.
+
+        Periods are contiguous and ascending, so terms are merged in one
+        forward pass after sorting them by CST date: O(n log n + m).
+        """
+        debug = log_enabled(self.logger, logging.DEBUG)
+        i, count = 0, len(periods)
+        for term in sorted(terms, key=lambda t: t.cst_date):
+            while i < count and periods[i].end_cst_date <= term.cst_date:
+                i += 1
+            if i == count:
+                break
+            period = periods[i]
+            if period.start_cst_date <= term.cst_date:
+                period.has_principal_term = True
+                if debug:
+                    self.logger.debug("Term Z%d mapped to month period %d", term.term_index, period.index)
+
+
+class NumberingTrace:
+    """Structured record of one month-numbering pass.
+
+    Only created when DEBUG logging is enabled for the calling context; the
+    report text is built in ``__str__``, i.e. when a handler formats it.
+    """
+
+    def __init__(self, anchor_solstice_utc: datetime, zi_month_index: int):
+        self.anchor_solstice_utc = anchor_solstice_utc
+        self.zi_month_index = zi_month_index
+        self.steps: List[Tuple[int, MonthPeriod, int, int, bool]] = []
+        self.periods: List[tuple] = []
+
+    def step(self, index: int, period: MonthPeriod, previous: int, assigned: int, is_leap: bool) -> None:
+        """Record the number assigned to one period after the Zi month."""
+        self.steps.append((index, period, previous, assigned, is_leap))
+
+    def finish(self, periods: List[MonthPeriod]) -> None:
+        """Snapshot the final numbering for the summary section."""
+        self.periods = [
+            (p.month_number, p.is_leap, p.has_principal_term, p.start_cst_date, p.end_cst_date)
+            for p in periods
+        ]
+
+    def __str__(self) -> str:
+        bar, rule = "=" * 80, "-" * 80
+        lines = [
+            bar,
+            "MONTH NUMBERING TRACE",
+            bar,
+            f"Winter Solstice (Z11) at: {self.anchor_solstice_utc}",
+            f"Zi month (month 11) found at period index: {self.zi_month_index}",
+            rule,
+        ]
+        for index, period, previous, assigned, is_leap in self.steps:
+            kind = "LEAP" if is_leap else "regular"
+            lines.append(
+                f"Period {index:2d}: {period.start_cst_date} to {period.end_cst_date} "
+                f"term={'Y' if period.has_principal_term else 'N'} "
+                f"previous={previous} -> {kind} month {assigned}"
+            )
+        if self.zi_month_index > 0:
+            lines.append(f"{self.zi_month_index} period(s) before the Zi month remain unnumbered")
+        lines += [rule, "FINAL MONTH NUMBERING SUMMARY", rule]
+        for i, (number, leap, term, start, end) in enumerate(self.periods):
+            lines.append(
+                f"Period {i:2d}: Month {number:2d} [{'LEAP' if leap else '    '}] "
+                f"Term:{'Y' if term else 'N'} | {start} to {end}"
+            )
+        lines.append(bar)
+        return "\n".join(lines)
 
 
 class LeapMonthAssigner:
     """Assigns month numbers and leap status using no-zhongqi rule."""
 
-    def __init__(self):
+    def __init__(self, meridian: MeridianLike = None):
         self.logger = setup_logging()
+        self.meridian: CalendarMeridian = get_meridian(meridian)
 
     def assign_month_numbers(self, periods: List[MonthPeriod], anchor_solstice_utc: datetime) -> None:
         """Assign month numbers starting from Zi month (month 11).
@@ -73,82 +138,94 @@ class LeapMonthAssigner:
         2. Iterate forward from Zi month through all subsequent periods:
            - Regular months (with principal term): increment month number (11->12->1->2->...)
            - Leap months (no principal term): take the preceding month's number
-        """
-        self.logger.info("=" * 80)
-        self.logger.info("MONTH NUMBERING DEBUG - Starting month numbering process")
-        self.logger.info("=" * 80)
 
+        A :class:`NumberingTrace` is logged at DEBUG level; nothing is
+        formatted when DEBUG is disabled for the calling context.
+        """
         zi_month_index = self._find_zi_month(periods, anchor_solstice_utc)
         if zi_month_index == -1:
             raise ValueError("Could not find Zi month containing Winter Solstice")
 
-        self.logger.info(f"Winter Solstice (Z11) at: {anchor_solstice_utc}")
-        self.logger.info(f"Zi month (month 11) found at period index: {zi_month_index}")
-        self.logger.info(f"  Period start: {periods[zi_month_index].start_cst_date}")
-        self.logger.info(f"  Period end: {periods[zi_month_index].end_cst_date}")
-        self.logger.info(f"  Has principal term: {periods[zi_month_index].has_principal_term}")
+        trace = None
+        if log_enabled(self.logger, logging.DEBUG):
+            trace = NumberingTrace(anchor_solstice_utc, zi_month_index)
 
         # Assign Zi month
         periods[zi_month_index].month_number = 11
         periods[zi_month_index].is_leap = False
 
         # Assign subsequent months (forward pass)
-        self.logger.info("\n" + "-" * 80)
-        self.logger.info("FORWARD PASS - Assigning months after Zi month (11)")
-        self.logger.info("-" * 80)
-
         current_month_number = 11
         for i in range(zi_month_index + 1, len(periods)):
             period = periods[i]
-
-            self.logger.info(f"\n{'='*60}")
-            self.logger.info(f"FORWARD PASS - Processing period index {i}:")
-            self.logger.info(f"{'='*60}")
-            self.logger.info(f"  Period dates: {period.start_cst_date} to {period.end_cst_date}")
-            self.logger.info(f"  Has principal term: {period.has_principal_term}")
-            self.logger.info(f"  Current tracker (represents previous month number): {current_month_number}")
+            previous = current_month_number
 
             if period.has_principal_term:
-                old_value = current_month_number
-                self.logger.info(f"\n  HAS PRINCIPAL TERM - This is a REGULAR month")
-                self.logger.info(f"  Formula: ({old_value} % 12) + 1 = {(old_value % 12) + 1}")
                 current_month_number = (current_month_number % 12) + 1
                 period.month_number = current_month_number
                 period.is_leap = False
-                self.logger.info(f"  -> RESULT: Regular month {current_month_number} assigned")
             else:
-                self.logger.info(f"\n  NO PRINCIPAL TERM - This is a LEAP month")
                 period.month_number = current_month_number
                 period.is_leap = True
-                self.logger.info(f"  -> RESULT: Leap month {current_month_number} assigned")
-
-        if zi_month_index > 0:
-            self.logger.info("\n" + "-" * 80)
-            self.logger.info(f"NOTE: {zi_month_index} period(s) before Zi month exist in window")
-            self.logger.info("These are outside the calculation scope and remain unnumbered")
-            self.logger.info("-" * 80)
-
-        # Summary
-        self.logger.info("\n" + "=" * 80)
-        self.logger.info("FINAL MONTH NUMBERING SUMMARY")
-        self.logger.info("=" * 80)
-        for i, period in enumerate(periods):
-            leap_indicator = "LEAP" if period.is_leap else "    "
-            term_indicator = "Y" if period.has_principal_term else "N"
-            self.logger.info(
-                f"Period {i:2d}: Month {period.month_number:2d} [{leap_indicator}] "
-                f"Term:{term_indicator} | {period.start_cst_date} to {period.end_cst_date}"
-            )
-        self.logger.info("=" * 80 + "\n")
+
+            if trace is not None:
+                trace.step(i, period, previous, current_month_number, period.is_leap)
+
+        if trace is not None:
+            trace.finish(periods)
+            self.logger.debug("%s", trace)
+
+    def number_segment(self, periods: List[MonthPeriod], anchor_solstice_utc: datetime) -> Tuple[NumberedMonth, ...]:
+        """Return the months from the Zi month onward, numbered for one solstice anchor.
+
+        Same no-zhongqi rule as :meth:`assign_month_numbers`, but the input
+        periods are left untouched and the result is an immutable tuple, so a
+        batch numbers each anchor once and resolves all of its dates against it.
+        """
+        zi_month_index = self._find_zi_month(periods, anchor_solstice_utc)
+        if zi_month_index == -1:
+            raise ValueError("Could not find Zi month containing Winter Solstice")
+
+        segment = []
+        current_month_number = 11
+        for i in range(zi_month_index, len(periods)):
+            period = periods[i]
+            is_leap = False
+            if i > zi_month_index:
+                if period.has_principal_term:
+                    current_month_number = (current_month_number % 12) + 1
+                else:
+                    is_leap = True
+            segment.append(NumberedMonth(
+                index=period.index,
+                start_utc=period.start_utc,
+                end_utc=period.end_utc,
+                start_cst_date=period.start_cst_date,
+                end_cst_date=period.end_cst_date,
+                has_principal_term=period.has_principal_term,
+                is_leap=is_leap,
+                month_number=current_month_number,
+            ))
+
+        self.logger.debug(
+            "Numbered %d months from Zi month at period %d (solstice %s)",
+            len(segment), zi_month_index, anchor_solstice_utc,
+        )
+        return tuple(segment)
 
     def _find_zi_month(self, periods: List[MonthPeriod], anchor_solstice_utc: datetime) -> int:
-        """Find the month period that contains the Winter Solstice."""
+        """Find the month period that contains the Winter Solstice.
+
+        Compared on CST dates, like :meth:`TermIndexer.tag_principal_terms`:
+        a new moon later on the solstice's CST date still starts the Zi month.
+        """
         if anchor_solstice_utc.tzinfo is not None:
             solstice_naive = anchor_solstice_utc.replace(tzinfo=None)
         else:
             solstice_naive = anchor_solstice_utc
+        solstice_date = self.meridian.to_date(solstice_naive)
 
         for i, period in enumerate(periods):
-            if period.start_utc <= solstice_naive < period.end_utc:
+            if period.start_cst_date <= solstice_date < period.end_cst_date:
                 return i
         return -1
@@ -0,0 +1,328 @@
+"""MonthTable — precomputed lunar month boundaries with O(log n) lookup.
+
+The ephemeris pipeline (new moons, principal terms, two winter solstices)
+is deterministic, so the month structure of a whole year range can be
+built once offline and shipped as a small versioned JSON file.  Each row
+holds one lunar month: its CST start date, month number, leap flag and
+lunar year.  ``solar_to_lunisolar`` resolves covered dates by bisecting
+the start-date column and only falls back to root-finding outside the
+table's range.
+
+Dates are read on the table's reference meridian (UTC+8 by default); a
+table built for another meridian (``--meridian vietnamese``) records it
+and is only served by converters using the same one.
+
+Usage:
+    python -m lunisolar.month_table --start 1900 --end 2100 --output month_table.json
+"""
+
+import argparse
+import json
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+from config import EPHEMERIS_FILE
+from utils import setup_logging, quiet_logging, write_static_json
+
+from .timezone_service import TimezoneService
+from .window_planner import WindowPlanner
+from .ephemeris_service import EphemerisService
+from .month_builder import MonthBuilder, TermIndexer, LeapMonthAssigner
+from .resolver import LunarMonthResolver
+from .batch_planner import BatchPlanner
+from .meridian import CalendarMeridian, MeridianLike, get_meridian
+
+# Bump whenever the row layout or the numbering rules change; tables with a
+# different version are rejected on load instead of silently misresolving.
+MONTH_TABLE_VERSION = 1
+
+
+class MonthTableRow(NamedTuple):
+    """One lunar month of a :class:`MonthTable`.
+
+    Exposes the same ``start_cst_date`` / ``month_number`` / ``is_leap``
+    attributes as :class:`MonthPeriod`, so it can stand in for a period in
+    ``LunarMonthResolver.calculate_lunar_day`` and ``ResultAssembler``.
+    """
+    index: int
+    start_cst_date: date
+    end_cst_date: date
+    month_number: int
+    is_leap: bool
+    lunar_year: int
+
+
+class MonthTable:
+    """Columnar table of lunar months sorted by CST start date."""
+
+    def __init__(
+        self,
+        start_ordinals: List[int],
+        month_numbers: List[int],
+        leap_flags: List[bool],
+        lunar_years: List[int],
+        end_ordinal: int,
+        start_year: int,
+        end_year: int,
+        ephemeris: str = "",
+        version: int = MONTH_TABLE_VERSION,
+        meridian: MeridianLike = None,
+    ):
+        if not start_ordinals:
+            raise ValueError("MonthTable requires at least one month")
+        if not (len(start_ordinals) == len(month_numbers) == len(leap_flags) == len(lunar_years)):
+            raise ValueError("MonthTable columns must have equal length")
+        self._starts = array('i', start_ordinals)
+        self._months = array('b', month_numbers)
+        self._leaps = array('b', [1 if flag else 0 for flag in leap_flags])
+        self._years = array('i', lunar_years)
+        self._end = end_ordinal
+        self.start_year = start_year
+        self.end_year = end_year
+        self.ephemeris = ephemeris
+        self.version = version
+        self.meridian: CalendarMeridian = get_meridian(meridian)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def start_ordinals(self) -> array:
+        """Proleptic-Gregorian ordinals of each month's CST start date."""
+        return self._starts
+
+    @property
+    def month_numbers(self) -> array:
+        """Month number (1..12) of each row."""
+        return self._months
+
+    @property
+    def leap_flags(self) -> array:
+        """Leap flag (0/1) of each row."""
+        return self._leaps
+
+    @property
+    def lunar_years(self) -> array:
+        """Lunar year of each row."""
+        return self._years
+
+    @property
+    def end_ordinal(self) -> int:
+        """Ordinal of the first CST date after the table (exclusive bound)."""
+        return self._end
+
+    @property
+    def first_date(self) -> date:
+        """First CST date covered by the table."""
+        return date.fromordinal(self._starts[0])
+
+    @property
+    def last_date(self) -> date:
+        """Last CST date covered by the table (inclusive)."""
+        return date.fromordinal(self._end - 1)
+
+    def covers(self, cst_date: date) -> bool:
+        """Return True if ``cst_date`` falls inside the table's range."""
+        return self._starts[0] <= cst_date.toordinal() < self._end
+
+    def row(self, i: int) -> MonthTableRow:
+        """Return row ``i`` as a :class:`MonthTableRow`."""
+        end = self._starts[i + 1] if i + 1 < len(self._starts) else self._end
+        return MonthTableRow(
+            index=i,
+            start_cst_date=date.fromordinal(self._starts[i]),
+            end_cst_date=date.fromordinal(end),
+            month_number=self._months[i],
+            is_leap=bool(self._leaps[i]),
+            lunar_year=self._years[i],
+        )
+
+    def lookup(self, cst_date: date) -> Optional[MonthTableRow]:
+        """Return the month containing ``cst_date``, or None outside the table."""
+        ordinal = cst_date.toordinal()
+        if not self._starts[0] <= ordinal < self._end:
+            return None
+        return self.row(bisect_right(self._starts, ordinal) - 1)
+
+    def resolve(self, cst_date: date) -> Optional[Tuple[MonthTableRow, int]]:
+        """Return ``(row, lunar_day)`` for ``cst_date``, or None outside the table."""
+        row = self.lookup(cst_date)
+        if row is None:
+            return None
+        lunar_day = (cst_date - row.start_cst_date).days + 1
+        return row, max(1, min(30, lunar_day))
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable representation of the table."""
+        return {
+            "version": self.version,
+            "start_year": self.start_year,
+            "end_year": self.end_year,
+            "ephemeris": self.ephemeris,
+            "meridian": self.meridian.to_dict(),
+            "end_cst_date": date.fromordinal(self._end).isoformat(),
+            "months": [
+                [date.fromordinal(s).isoformat(), m, l, y]
+                for s, m, l, y in zip(self._starts, self._months, self._leaps, self._years)
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MonthTable':
+        """Rebuild a table from :meth:`to_dict` output, checking its version."""
+        version = data.get("version")
+        if version != MONTH_TABLE_VERSION:
+            raise ValueError(
+                f"Unsupported month table version {version!r} (expected {MONTH_TABLE_VERSION})"
+            )
+        months = data["months"]
+        return cls(
+            start_ordinals=[date.fromisoformat(m[0]).toordinal() for m in months],
+            month_numbers=[m[1] for m in months],
+            leap_flags=[bool(m[2]) for m in months],
+            lunar_years=[m[3] for m in months],
+            end_ordinal=date.fromisoformat(data["end_cst_date"]).toordinal(),
+            start_year=data["start_year"],
+            end_year=data["end_year"],
+            ephemeris=data.get("ephemeris", ""),
+            version=version,
+            meridian=CalendarMeridian.from_dict(data["meridian"]) if "meridian" in data else None,
+        )
+
+    def save(self, path: str) -> int:
+        """Write the table as compact JSON. Returns the number of months written."""
+        write_static_json(path, self.to_dict())
+        return len(self)
+
+    @classmethod
+    def load(cls, path: str) -> 'MonthTable':
+        """Load a table previously written by :meth:`save`."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    # ------------------------------------------------------------------
+    # Growing
+    # ------------------------------------------------------------------
+
+    def extended(self, start_year: int, end_year: int, quiet: bool = True) -> 'MonthTable':
+        """Table covering the union of this table's years and ``start_year`` .. ``end_year``.
+
+        Only the missing years are built; their months are spliced onto this
+        table's rows, so growing a table a year at a time never re-sweeps the
+        years it already holds.
+        """
+        table = self
+        if start_year < self.start_year:
+            table = MonthTable.build(start_year, self.start_year - 1, quiet, self.meridian).joined(table)
+        if end_year > self.end_year:
+            table = table.joined(MonthTable.build(self.end_year + 1, end_year, quiet, self.meridian))
+        return table
+
+    def joined(self, later: 'MonthTable') -> 'MonthTable':
+        """This table followed by the months of ``later`` from this table's end on."""
+        if later.meridian != self.meridian:
+            raise ValueError("Cannot join month tables on different meridians")
+        first = bisect_left(later._starts, self._end)
+        if later._end <= self._end:
+            return self
+        if first == len(later) or later._starts[first] != self._end:
+            raise ValueError("Month tables are not contiguous")
+        return MonthTable(
+            start_ordinals=self._starts + later._starts[first:],
+            month_numbers=self._months + later._months[first:],
+            leap_flags=self._leaps + later._leaps[first:],
+            lunar_years=self._years + later._years[first:],
+            end_ordinal=later._end,
+            start_year=min(self.start_year, later.start_year),
+            end_year=max(self.end_year, later.end_year),
+            ephemeris=self.ephemeris,
+            meridian=self.meridian,
+        )
+
+    # ------------------------------------------------------------------
+    # Offline build
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        start_year: int,
+        end_year: int,
+        quiet: bool = True,
+        meridian: MeridianLike = None,
+    ) -> 'MonthTable':
+        """Build a table covering Gregorian years ``start_year`` .. ``end_year``
+        with dates on ``meridian`` (default: Chinese, UTC+8).
+
+        Runs the regular MonthBuilder / TermIndexer / LeapMonthAssigner
+        pipeline over the whole span once via :class:`BatchPlanner`, then
+        takes each solstice year's own months: those from Zi(Y) up to
+        (excluding) Zi(Y+1), numbered from the Winter Solstice of year Y.
+        """
+        if end_year < start_year:
+            raise ValueError("end_year must not be before start_year")
+
+        meridian = get_meridian(meridian)
+        with quiet_logging(quiet):
+            tz_service = TimezoneService(meridian=meridian)
+            month_resolver = LunarMonthResolver(tz_service)
+            planner = BatchPlanner(
+                WindowPlanner(), EphemerisService(meridian), MonthBuilder(tz_service),
+                TermIndexer(), LeapMonthAssigner(meridian),
+            )
+            plan = planner.plan(datetime(start_year, 1, 1), datetime(end_year, 12, 31, 23, 59, 59))
+
+            starts, months, leaps, years = [], [], [], []
+            for segment in plan.segments:
+                for period in segment.own_months:
+                    starts.append(period.start_cst_date.toordinal())
+                    months.append(period.month_number)
+                    leaps.append(period.is_leap)
+                    years.append(month_resolver.calculate_lunar_year(period))
+
+            last = plan.segments[-1]
+            end_ordinal = last.months[last.span].start_cst_date.toordinal()
+            return cls(
+                start_ordinals=starts,
+                month_numbers=months,
+                leap_flags=leaps,
+                lunar_years=years,
+                end_ordinal=end_ordinal,
+                start_year=start_year,
+                end_year=end_year,
+                ephemeris=os.path.basename(EPHEMERIS_FILE),
+                meridian=meridian,
+            )
+
+
+def main() -> None:
+    """Build a month table offline and write it to disk."""
+    logger = setup_logging()
+    parser = argparse.ArgumentParser(description='Build a precomputed lunisolar month table.')
+    parser.add_argument('--start', type=int, default=1900, help='First Gregorian year to cover.')
+    parser.add_argument('--end', type=int, default=2100, help='Last Gregorian year to cover.')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Output JSON path (default: output/month_table_<start>_<end>.json).')
+    parser.add_argument('--meridian', type=str, default='chinese',
+                        help="Calendar meridian: chinese, vietnamese, korean, a preset "
+                             "'*-historical' schedule, or an IANA zone (default: chinese).")
+    args = parser.parse_args()
+
+    meridian = get_meridian(args.meridian)
+    suffix = '' if meridian == get_meridian() else f'_{meridian.name.replace("/", "_")}'
+    output = args.output or os.path.join('output', f'month_table_{args.start}_{args.end}{suffix}.json')
+    logger.info(f"Building month table for {args.start}-{args.end} ({meridian.name})")
+    table = MonthTable.build(args.start, args.end, meridian=meridian)
+    count = table.save(output)
+    logger.info(f"✅ Wrote {count} lunar months ({table.first_date} to {table.last_date}) to {output}")
+
+
+if __name__ == '__main__':
+    main()
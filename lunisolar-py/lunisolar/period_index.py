@@ -0,0 +1,51 @@
+"""PeriodIndex — bisect lookup over a sorted sequence of month periods.
+
+Month periods are contiguous and ordered by start date, so the CST start
+dates alone locate a date: the owning period is the last one starting on
+or before it.  The index keeps those start dates as proleptic-Gregorian
+ordinals in an ``array('i')`` (the same layout :class:`MonthTable` uses)
+and answers each lookup with one ``bisect_right``.
+"""
+
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Generic, Optional, Sequence, TypeVar
+
+P = TypeVar('P')
+
+
+class PeriodIndex(Generic[P]):
+    """Sorted, array-backed index of periods exposing ``start_cst_date`` /
+    ``end_cst_date`` (MonthPeriod, NumberedMonth, MonthTableRow)."""
+
+    __slots__ = ('periods', '_starts', '_ends')
+
+    def __init__(self, periods: Sequence[P]):
+        self.periods = periods
+        self._starts = array('i', [p.start_cst_date.toordinal() for p in periods])
+        self._ends = array('i', [p.end_cst_date.toordinal() for p in periods])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self):
+        return iter(self.periods)
+
+    @property
+    def start_ordinals(self) -> array:
+        """CST start-date ordinals, ascending."""
+        return self._starts
+
+    def position(self, cst_date: date) -> int:
+        """Return the index of the period containing ``cst_date``, or -1."""
+        ordinal = cst_date.toordinal()
+        i = bisect_right(self._starts, ordinal) - 1
+        if i >= 0 and ordinal < self._ends[i]:
+            return i
+        return -1
+
+    def find(self, cst_date: date) -> Optional[P]:
+        """Return the period with ``start_cst_date <= cst_date < end_cst_date``."""
+        i = self.position(cst_date)
+        return self.periods[i] if i >= 0 else None
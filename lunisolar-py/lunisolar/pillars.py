@@ -0,0 +1,138 @@
+"""Day and hour pillars from the local civil clock alone.
+
+The day pillar is a continuous 60-day count from 0004-01-31 and the hour
+pillar follows from the day stem via 五鼠遁, so neither depends on the
+lunar month structure.  This module computes them with pure integer
+arithmetic over ``shared.sexagenary`` — no Skyfield import and no
+ephemeris file — for single datetimes or whole NumPy arrays.
+
+Inputs are *local wall-clock* times: naive ``datetime`` objects, or
+``datetime64`` / int64 epoch-second arrays expressing local time as if it
+were UTC.  Aware datetimes are used at their own wall-clock time.
+
+Usage:
+    from lunisolar.pillars import day_hour_pillars, day_hour_pillars_array
+
+    day_hour_pillars(datetime(2025, 1, 20, 23, 30)).hour_chars   # ('丙', '子')
+
+    slots = np.arange('2025-01-01', '2026-01-01', dtype='datetime64[m]')
+    day_hour_pillars_array(slots)['hour_cycle']
+
+    python -m lunisolar pillars --date 2025-01-20 --time 23:30
+"""
+
+from datetime import date, datetime
+from typing import NamedTuple, Tuple, Union
+
+import numpy as np
+
+from shared import sexagenary as kernel
+
+PILLARS_DTYPE = np.dtype([
+    ('day_cycle', np.int8),
+    ('hour_cycle', np.int8),
+])
+
+_SECONDS_PER_DAY = 86400
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Vectorized forms of the kernel tables
+_CYCLE_STEMS = np.array(kernel.CYCLE_STEMS, dtype=np.int64)
+_ZI_HOUR_STEM = np.array(kernel.ZI_HOUR_STEM, dtype=np.int64)
+_STEM_BRANCH_CYCLE = np.array(kernel.STEM_BRANCH_CYCLE, dtype=np.int64)
+
+
+class DayHourPillars(NamedTuple):
+    """Day and hour cycle numbers (1..60) of one local datetime."""
+    day_cycle: int
+    hour_cycle: int
+
+    @property
+    def day_chars(self) -> Tuple[str, str]:
+        """(stem, branch) characters of the day pillar."""
+        return kernel.cycle_chars(self.day_cycle)
+
+    @property
+    def hour_chars(self) -> Tuple[str, str]:
+        """(stem, branch) characters of the hour pillar."""
+        return kernel.cycle_chars(self.hour_cycle)
+
+
+def day_pillar(value: Union[date, datetime]) -> int:
+    """Day pillar cycle number of a local civil date (or datetime)."""
+    return kernel.day_cycle_from_ordinal(value.toordinal())
+
+
+def hour_pillar(value: datetime) -> int:
+    """Hour pillar cycle number of a local datetime (23:00 uses the next day's stem)."""
+    return kernel.hour_cycle(day_pillar(value), value.hour, value.minute)
+
+
+def day_hour_pillars(value: datetime) -> DayHourPillars:
+    """Day and hour pillars of a local datetime."""
+    day_cycle = day_pillar(value)
+    return DayHourPillars(day_cycle, kernel.hour_cycle(day_cycle, value.hour, value.minute))
+
+
+def local_day_hour_cycles(local_seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(day_cycle, hour_cycle, minute_of_day)`` int64 arrays for local
+    wall-clock epoch seconds."""
+    local_days = np.floor_divide(local_seconds, _SECONDS_PER_DAY)
+    minute_of_day = (local_seconds - local_days * _SECONDS_PER_DAY) // 60
+    day_index = (local_days + (_UNIX_EPOCH_ORDINAL - kernel.DAY_CYCLE_ANCHOR_ORDINAL)) % 60
+
+    # 五鼠遁: 23:00-23:59 belongs to the next day's Zi hour
+    hour_branch = ((minute_of_day + 60) // 120) % 12
+    zi_day_stem = _CYCLE_STEMS[(day_index + (minute_of_day >= 23 * 60)) % 60]
+    hour_stem = (_ZI_HOUR_STEM[zi_day_stem] + hour_branch) % 10
+    return day_index + 1, _STEM_BRANCH_CYCLE[hour_stem, hour_branch], minute_of_day
+
+
+def day_hour_pillars_array(local_instants) -> np.ndarray:
+    """Vectorized day/hour pillars.
+
+    Args:
+        local_instants: ``datetime64`` array (any unit) or int64 epoch seconds,
+                        both read as local wall-clock time
+
+    Returns:
+        Structured array of ``PILLARS_DTYPE`` with the input's shape
+    """
+    arr = np.asarray(local_instants)
+    if arr.dtype.kind == 'M':
+        seconds = arr.astype('datetime64[s]').astype(np.int64)
+    elif arr.dtype.kind in 'iu':
+        seconds = arr.astype(np.int64, copy=False)
+    else:
+        raise TypeError(f"Expected datetime64 or integer epoch seconds, got dtype {arr.dtype}")
+
+    out = np.empty(seconds.shape, dtype=PILLARS_DTYPE)
+    day_cycle, hour_cycle, _ = local_day_hour_cycles(seconds)
+    out['day_cycle'] = day_cycle
+    out['hour_cycle'] = hour_cycle
+    return out
+
+
+def main(argv=None) -> None:
+    """``python -m lunisolar pillars`` — print day/hour pillars without the ephemeris."""
+    import argparse
+    from datetime import timedelta
+
+    parser = argparse.ArgumentParser(
+        prog='python -m lunisolar pillars',
+        description='Day and hour pillars from the local civil clock (no ephemeris needed).',
+    )
+    parser.add_argument('--date', type=str, required=True, help='Local date in YYYY-MM-DD format')
+    parser.add_argument('--time', type=str, default='12:00', help='Local time in HH:MM format')
+    parser.add_argument('--count', type=int, default=1, help='Number of consecutive slots to print')
+    parser.add_argument('--step', type=int, default=120, help='Minutes between slots (default: 120)')
+    args = parser.parse_args(argv)
+
+    start = datetime.strptime(f"{args.date} {args.time}", '%Y-%m-%d %H:%M')
+    for i in range(args.count):
+        slot = start + timedelta(minutes=args.step * i)
+        pillars = day_hour_pillars(slot)
+        day_stem, day_branch = pillars.day_chars
+        hour_stem, hour_branch = pillars.hour_chars
+        print(f"{slot:%Y-%m-%d %H:%M}  Day: {day_stem}{day_branch} [{pillars.day_cycle}]  "
+              f"Hour: {hour_stem}{hour_branch} [{pillars.hour_cycle}]")
@@ -1,11 +1,12 @@
 """LunarMonthResolver, ResultAssembler — resolve target month and assemble result."""
 
 from datetime import datetime
-from typing import List, Tuple
+from typing import Sequence, Tuple, Union
 
 from utils import setup_logging
 from shared.models import MonthPeriod, LunisolarDateDTO
 from .timezone_service import TimezoneService
+from .period_index import PeriodIndex
 
 
 class LunarMonthResolver:
@@ -15,8 +16,16 @@ class LunarMonthResolver:
         self.logger = setup_logging()
         self.tz_service = timezone_service
 
-    def find_period_for_datetime(self, periods: List[MonthPeriod], target_utc: datetime) -> MonthPeriod:
-        """Match by CST date-only boundaries: startCstDate <= targetCstDate < endCstDate."""
+    def find_period_for_datetime(
+        self,
+        periods: Union[PeriodIndex, Sequence[MonthPeriod]],
+        target_utc: datetime,
+    ) -> MonthPeriod:
+        """Match by CST date-only boundaries: startCstDate <= targetCstDate < endCstDate.
+
+        Pass a :class:`PeriodIndex` to resolve many dates against the same
+        periods in O(log m) each; a plain sequence is indexed on the fly.
+        """
         if target_utc.tzinfo is not None:
             target_naive = target_utc.replace(tzinfo=None)
         else:
@@ -24,11 +33,12 @@ class LunarMonthResolver:
 
         target_cst_date = self.tz_service.utc_to_cst_date(target_naive)
 
-        for period in periods:
-            if period.start_cst_date <= target_cst_date < period.end_cst_date:
-                return period
-
-        raise ValueError(f"No period found for date {target_cst_date}")
+        if not isinstance(periods, PeriodIndex):
+            periods = PeriodIndex(periods)
+        period = periods.find(target_cst_date)
+        if period is None:
+            raise ValueError(f"No period found for date {target_cst_date}")
+        return period
 
     def calculate_lunar_day(self, target_utc: datetime, period: MonthPeriod) -> int:
         """Return day-in-month using CST date-only difference from period.startCstDate, bounded 1..30."""
@@ -0,0 +1,151 @@
+"""SolsticeProvider — memoized Winter Solstice lookup.
+
+Every conversion anchors on two or three Winter Solstices, and the same
+years come up again and again.  The provider keeps an LRU-bounded
+per-year cache, reads through the persistent event cache when it is
+enabled, and only falls back to root-finding on a miss.  Searches are
+bracketed to 10 December .. 1 January, where the December solstice
+always falls, instead of sweeping all four seasons of the whole year;
+``solstices(year_start, year_end)`` resolves a whole range of years with
+a single ``find_discrete`` sweep.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from skyfield import almanac
+
+from utils import setup_logging
+from ephemeris.registry import get_ephemeris, get_timescale
+from ephemeris.event_cache import get_event_cache, datetime_to_us, us_to_datetime
+
+WINTER_SOLSTICE_SEASON = 3
+DEFAULT_SOLSTICE_CACHE_SIZE = 512
+
+# Search bracket (month, day) in the solstice's own year; the upper bound is
+# 1 January of the following year.
+_BRACKET_START = (12, 10)
+
+
+class SolsticeProvider:
+    """Per-year Winter Solstice instants (naive UTC) with an LRU cache."""
+
+    def __init__(self, maxsize: int = DEFAULT_SOLSTICE_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.logger = setup_logging()
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._cache: 'OrderedDict[int, datetime]' = OrderedDict()
+
+    def winter_solstice(self, year: int) -> datetime:
+        """Return the Winter Solstice of ``year``."""
+        with self._lock:
+            solstice = self._cache.get(year)
+            if solstice is not None:
+                self._cache.move_to_end(year)
+                return solstice
+
+        cache = get_event_cache()
+        if cache is not None:
+            times, _ = cache.events('winter_solstices', year, year, self._solstice_event)
+            solstice = us_to_datetime(times[0]) if len(times) else self._search(year)
+        else:
+            solstice = self._search(year)
+        self._remember(year, solstice)
+        return solstice
+
+    def solstices(self, year_start: int, year_end: int) -> Dict[int, datetime]:
+        """Return ``{year: solstice}`` for ``year_start`` .. ``year_end`` (inclusive).
+
+        Years already in the LRU are served from it; the rest come from the
+        event cache or from one bracketed ``find_discrete`` sweep.
+        """
+        if year_end < year_start:
+            raise ValueError("year_end must not be before year_start")
+
+        with self._lock:
+            found = {y: self._cache[y] for y in range(year_start, year_end + 1) if y in self._cache}
+        missing = [y for y in range(year_start, year_end + 1) if y not in found]
+        if not missing:
+            return found
+
+        first, last = missing[0], missing[-1]
+        cache = get_event_cache()
+        if cache is None:
+            swept = self._sweep(first, last)
+        else:
+            swept = {}
+            if not any(lo <= first and last <= hi for lo, hi in cache.coverage('winter_solstices')):
+                swept = self._sweep(first, last)
+
+            def compute_year(year):
+                if year in swept:
+                    return [datetime_to_us(swept[year])], [WINTER_SOLSTICE_SEASON]
+                return self._solstice_event(year)
+
+            times, _ = cache.events('winter_solstices', first, last, compute_year)
+            swept = {instant.year: instant for instant in map(us_to_datetime, times.tolist())}
+
+        for year in missing:
+            solstice = swept.get(year)
+            if solstice is None:
+                solstice = self._search(year)
+            found[year] = solstice
+            self._remember(year, solstice)
+        return found
+
+    def clear(self) -> None:
+        """Drop every memoized solstice."""
+        with self._lock:
+            self._cache.clear()
+
+    def _remember(self, year: int, solstice: datetime) -> None:
+        with self._lock:
+            self._cache[year] = solstice
+            self._cache.move_to_end(year)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def _solstice_event(self, year: int):
+        """Event-cache filler: the Winter Solstice (µs, season 3) of one year."""
+        return [datetime_to_us(self._search(year))], [WINTER_SOLSTICE_SEASON]
+
+    def _search(self, year: int) -> datetime:
+        """Root-find the Winter Solstice of ``year`` inside the December bracket."""
+        solstice = self._sweep(year, year).get(year)
+        if solstice is None:
+            raise ValueError(f"Winter solstice not found for year {year}")
+        return solstice
+
+    def _sweep(self, year_start: int, year_end: int) -> Dict[int, datetime]:
+        """One ``find_discrete`` pass from the first bracket to the last."""
+        ts = get_timescale()
+        eph = get_ephemeris()
+
+        t0 = ts.utc(year_start, *_BRACKET_START)
+        t1 = ts.utc(year_end + 1, 1, 1)
+        t, y = almanac.find_discrete(t0, t1, almanac.seasons(eph))
+
+        found = {}
+        for time, season in zip(t, y):
+            if season == WINTER_SOLSTICE_SEASON:
+                solstice = time.utc_datetime().replace(tzinfo=None)
+                found[solstice.year] = solstice
+        return found
+
+
+_DEFAULT_PROVIDER: Optional[SolsticeProvider] = None
+_DEFAULT_PROVIDER_LOCK = threading.Lock()
+
+
+def get_solstice_provider() -> SolsticeProvider:
+    """Return the process-wide :class:`SolsticeProvider`."""
+    global _DEFAULT_PROVIDER
+    if _DEFAULT_PROVIDER is None:
+        with _DEFAULT_PROVIDER_LOCK:
+            if _DEFAULT_PROVIDER is None:
+                _DEFAULT_PROVIDER = SolsticeProvider()
+    return _DEFAULT_PROVIDER
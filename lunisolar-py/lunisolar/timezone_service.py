@@ -1,23 +1,30 @@
 """TimezoneService — handles timezone conversions and CST date-only comparisons."""
 
-from datetime import datetime, timedelta, date
+from datetime import datetime, date
 from typing import Optional
 
 from utils import setup_logging
 from timezone_handler import TimezoneHandler
 
+from .meridian import CalendarMeridian, MeridianLike, get_meridian
+
 
 class TimezoneService:
     """Handles timezone conversions and CST date-only comparisons."""
     
-    def __init__(self, timezone_handler: Optional[TimezoneHandler] = None):
+    def __init__(
+        self,
+        timezone_handler: Optional[TimezoneHandler] = None,
+        meridian: MeridianLike = None,
+    ):
         self.logger = setup_logging()
         self.tz_handler = timezone_handler or TimezoneHandler.create_cst_handler()
+        self.meridian: CalendarMeridian = get_meridian(meridian)
     
     def utc_to_cst_date(self, utc_datetime: datetime) -> date:
-        """Convert UTC datetime to CST date for date-only comparisons."""
-        cst_datetime = utc_datetime + timedelta(hours=8)
-        return cst_datetime.date()
+        """Convert UTC datetime to the calendar date on the reference meridian
+        (CST, UTC+8, unless configured otherwise) for date-only comparisons."""
+        return self.meridian.to_date(utc_datetime)
     
     def parse_local_datetime(self, date_str: str, time_str: str = "12:00") -> datetime:
         """Parse local date/time string to datetime object."""
@@ -0,0 +1,145 @@
+"""Vectorized lunisolar conversion over NumPy arrays of UTC instants.
+
+``solar_to_lunisolar_batch`` parses, resolves and assembles a frozen DTO
+per date, which tops out at thousands of rows per second.  This module
+takes a whole ``datetime64`` / int64-epoch array at once and returns a
+structured array of lunar year/month/day/leap flag plus the four
+sexagenary cycle numbers.  Month membership is one ``np.searchsorted``
+over the month start dates of a :class:`MonthTable`; everything else is
+modular arithmetic on int64 columns.
+
+Usage:
+    import numpy as np
+    from lunisolar.vectorized import solar_to_lunisolar_array
+
+    hours = np.arange('2000-01-01', '2030-01-01', dtype='datetime64[h]')
+    result = solar_to_lunisolar_array(hours, 'Asia/Ho_Chi_Minh')
+    result['month'], result['day_cycle']
+"""
+
+import threading
+from datetime import date
+from typing import Dict, Optional
+
+import numpy as np
+
+from timezone_handler import get_offset_table, to_epoch_seconds
+
+from .api import get_month_table
+from .month_table import MonthTable
+from .meridian import CalendarMeridian, MeridianLike, get_meridian
+from .pillars import local_day_hour_cycles
+
+LUNISOLAR_DTYPE = np.dtype([
+    ('year', np.int32),
+    ('month', np.int8),
+    ('day', np.int8),
+    ('is_leap', np.bool_),
+    ('hour', np.int8),
+    ('year_cycle', np.int8),
+    ('month_cycle', np.int8),
+    ('day_cycle', np.int8),
+    ('hour_cycle', np.int8),
+])
+
+# Tables built on demand (one per meridian) when no installed table covers the request;
+# each grows to the union of every span requested so far.
+_AUTO_TABLES: Dict[CalendarMeridian, MonthTable] = {}
+_AUTO_TABLES_LOCK = threading.Lock()
+
+
+def _cycle_from_indexes(stem0: np.ndarray, branch0: np.ndarray) -> np.ndarray:
+    """1..60 cycle number from 0-based stem/branch indexes of equal parity."""
+    return (6 * stem0 - 5 * branch0) % 60 + 1
+
+
+def _covering_table(
+    table: Optional[MonthTable],
+    meridian: CalendarMeridian,
+    first: date,
+    last: date,
+) -> MonthTable:
+    """Pick a month table on ``meridian`` covering [first, last], building one if necessary."""
+    for candidate in (table, get_month_table(meridian), _AUTO_TABLES.get(meridian)):
+        if candidate is not None and candidate.covers(first) and candidate.covers(last):
+            return candidate
+    if table is not None:
+        raise ValueError(f"Month table does not cover {first} .. {last}")
+
+    with _AUTO_TABLES_LOCK:
+        auto = _AUTO_TABLES.get(meridian)
+        if auto is None:
+            auto = MonthTable.build(first.year, last.year, meridian=meridian)
+        elif not (auto.covers(first) and auto.covers(last)):
+            # Build only the missing years and keep everything already covered
+            auto = auto.extended(first.year, last.year)
+        _AUTO_TABLES[meridian] = auto
+        return auto
+
+
+def solar_to_lunisolar_array(
+    instants,
+    timezone_name: str = 'Asia/Shanghai',
+    table: Optional[MonthTable] = None,
+    meridian: MeridianLike = None,
+) -> np.ndarray:
+    """Convert an array of UTC instants to lunisolar dates and sexagenary cycles.
+
+    Args:
+        instants: ``datetime64`` array (any unit, interpreted as UTC) or int64
+                  Unix epoch seconds
+        timezone_name: IANA timezone used for the local civil day/hour that
+                       drives the day and hour pillars
+        table: Month table to resolve against.  Defaults to the table installed
+               with ``use_month_table``; if none covers the span, a per-meridian
+               table is built (or grown) to cover the Gregorian years involved.
+        meridian: Calendar reference meridian (default: the table's, else UTC+8)
+
+    Returns:
+        Structured array of ``LUNISOLAR_DTYPE`` with the same shape as ``instants``
+    """
+    epoch = to_epoch_seconds(instants)
+    out = np.empty(epoch.shape, dtype=LUNISOLAR_DTYPE)
+    if epoch.size == 0:
+        return out
+
+    if meridian is None:
+        meridian = table.meridian if table is not None else get_meridian()
+    else:
+        meridian = get_meridian(meridian)
+        if table is not None and table.meridian != meridian:
+            raise ValueError(f"Month table meridian {table.meridian.name!r} does not match {meridian.name!r}")
+
+    cst_ordinal = meridian.ordinals(epoch)
+    table = _covering_table(
+        table,
+        meridian,
+        date.fromordinal(int(cst_ordinal.min())),
+        date.fromordinal(int(cst_ordinal.max())),
+    )
+
+    # Month membership: one binary search per element over month start dates
+    starts = np.frombuffer(table.start_ordinals, dtype=np.int32).astype(np.int64)
+    row = np.searchsorted(starts, cst_ordinal, side='right') - 1
+    lunar_year = np.frombuffer(table.lunar_years, dtype=np.int32)[row].astype(np.int64)
+    month = np.frombuffer(table.month_numbers, dtype=np.int8)[row].astype(np.int64)
+
+    out['year'] = lunar_year
+    out['month'] = month
+    out['day'] = np.clip(cst_ordinal - starts[row] + 1, 1, 30)
+    out['is_leap'] = np.frombuffer(table.leap_flags, dtype=np.int8)[row] != 0
+
+    # Year and month pillars (4 AD Jiazi anchor, Wu Hu Dun first-month stem)
+    out['year_cycle'] = (lunar_year - 4) % 60 + 1
+    year_stem = (lunar_year - 4) % 10
+    month_stem = ((year_stem % 5) * 2 + 2 + month - 1) % 10
+    out['month_cycle'] = _cycle_from_indexes(month_stem, (month + 1) % 12)
+
+    # Day and hour pillars follow the local civil clock
+    local = get_offset_table(timezone_name).utc_to_local(epoch)
+    day_cycle, hour_cycle, minute_of_day = local_day_hour_cycles(local)
+    out['day_cycle'] = day_cycle
+    out['hour_cycle'] = hour_cycle
+    out['hour'] = minute_of_day // 60
+
+    return out
@@ -1,20 +1,19 @@
 """WindowPlanner — plans calculation windows around Winter Solstice anchors."""
 
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Optional, Tuple
 
-from skyfield.api import load
-from skyfield import almanac
-
-from config import EPHEMERIS_FILE
 from utils import setup_logging
 
+from .solstice_provider import SolsticeProvider, get_solstice_provider
+
 
 class WindowPlanner:
     """Plans calculation windows around Winter Solstice anchors."""
     
-    def __init__(self):
+    def __init__(self, solstice_provider: Optional[SolsticeProvider] = None):
         self.logger = setup_logging()
+        self.solstice_provider = solstice_provider or get_solstice_provider()
     
     def compute_window(self, target_utc: datetime) -> Tuple[datetime, datetime]:
         """Return [start, end] window framing two consecutive Winter Solstices
@@ -26,9 +25,10 @@ class WindowPlanner:
             
         target_year = target_naive.year
         
-        solstice_current = self._find_winter_solstice(target_year)
-        solstice_prev = self._find_winter_solstice(target_year - 1)
-        solstice_next = self._find_winter_solstice(target_year + 1)
+        solstices = self.solstice_provider.solstices(target_year - 1, target_year + 1)
+        solstice_prev = solstices[target_year - 1]
+        solstice_current = solstices[target_year]
+        solstice_next = solstices[target_year + 1]
         
         if target_naive >= solstice_current:
             anchor_start = solstice_current
@@ -46,22 +46,7 @@ class WindowPlanner:
     def _find_winter_solstice(self, year: int) -> datetime:
         """Find Winter Solstice for a given year."""
         try:
-            ts = load.timescale()
-            eph = load(EPHEMERIS_FILE)
-            
-            t0 = ts.utc(year, 1, 1)
-            t1 = ts.utc(year + 1, 1, 1)
-            t, y = almanac.find_discrete(t0, t1, almanac.seasons(eph))
-            
-            for time, season in zip(t, y):
-                if season == 3:  # Winter solstice
-                    solstice_datetime = time.utc_datetime()
-                    return solstice_datetime.replace(tzinfo=None)
-            
-            raise ValueError(f"Winter solstice not found for year {year}")
+            return self.solstice_provider.winter_solstice(year)
         except Exception as e:
             self.logger.error(f"Error finding winter solstice for {year}: {e}")
             raise
-        finally:
-            if 'eph' in locals():
-                del eph
@@ -13,8 +13,8 @@ Example:
 from datetime import datetime, timedelta
 from typing import List
 import numpy as np
-from skyfield.api import utc, load
-from config import EPHEMERIS_FILE
+from skyfield.api import utc
+from ephemeris.registry import get_ephemeris, get_timescale
 from utils import setup_logging, write_csv_file, parse_date_args
 
 def calculate_moon_illumination(start_time: datetime, end_time: datetime) -> List[str]:
@@ -30,8 +30,8 @@ def calculate_moon_illumination(start_time: datetime, end_time: datetime) -> Lis
     """
     logger = setup_logging()
     try:
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
+        ts = get_timescale()
+        eph = get_ephemeris()
         earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
         
         # Calculate total time span and number of 2-hour intervals
@@ -100,9 +100,6 @@ def calculate_moon_illumination(start_time: datetime, end_time: datetime) -> Lis
     except Exception as e:
         logger.error(f"Error calculating moon illumination: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def main():
     """Main function for moon illumination calculation."""
@@ -2,8 +2,8 @@
 shared — Cross-module shared data
 ===================================
 
-Canonical definitions of Heavenly Stems, Earthly Branches, and shared data models
-used by lunisolar, huangdao, and bazi packages.
+Canonical definitions of Heavenly Stems, Earthly Branches, the sexagenary
+lookup kernel, and shared data models used by lunisolar, huangdao, and bazi.
 """
 
 from .constants import (
@@ -18,8 +18,11 @@ from .constants import (
     PRINCIPAL_TERM_NAMES,
 )
 
+from . import sexagenary
+
 from .models import (
     PrincipalTerm,
     MonthPeriod,
+    NumberedMonth,
     LunisolarDateDTO,
 )
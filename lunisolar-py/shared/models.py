@@ -30,6 +30,23 @@ class MonthPeriod:
     month_number: int = 0  # 1..12, with Zi month=11
 
 
+@dataclass(frozen=True)
+class NumberedMonth:
+    """Immutable lunar month with its final number and leap status.
+
+    Attribute-compatible with :class:`MonthPeriod`, but produced once per
+    solstice anchor and safe to share between dates, batches and threads.
+    """
+    index: int
+    start_utc: datetime
+    end_utc: datetime
+    start_cst_date: date
+    end_cst_date: date
+    has_principal_term: bool
+    is_leap: bool
+    month_number: int
+
+
 @dataclass(frozen=True)
 class LunisolarDateDTO:
     """Complete lunisolar date with stems, branches, and cycles."""
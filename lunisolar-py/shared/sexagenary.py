@@ -0,0 +1,93 @@
+"""
+Sexagenary Kernel
+=================
+
+Precomputed lookup tables for the 60-cycle (干支) and integer-only pillar
+functions built on them.  Stems and branches are 0-based indexes
+(0 = 甲 / 子); cycle numbers are 1..60 (1 = 甲子), matching
+``LunisolarDateDTO``.  Every pillar is a couple of table indexes, with no
+string scanning or per-call dict construction, so the batch and
+vectorized paths can share the same rules as ``SexagenaryEngine``.
+
+Pure Python with no third-party imports; safe to use where the ephemeris
+stack is not installed.
+"""
+
+from datetime import date
+from typing import Dict, Tuple
+
+from .constants import STEM_CHARS, BRANCH_CHARS
+
+# cycle (1..60) -> 0-based stem / branch, and the characters
+CYCLE_STEMS: Tuple[int, ...] = tuple(i % 10 for i in range(60))
+CYCLE_BRANCHES: Tuple[int, ...] = tuple(i % 12 for i in range(60))
+CYCLE_STEM_CHARS: Tuple[str, ...] = tuple(STEM_CHARS[s] for s in CYCLE_STEMS)
+CYCLE_BRANCH_CHARS: Tuple[str, ...] = tuple(BRANCH_CHARS[b] for b in CYCLE_BRANCHES)
+
+# [stem][branch] -> cycle 1..60; 0 where stem and branch differ in parity
+STEM_BRANCH_CYCLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple((6 * s - 5 * b) % 60 + 1 if s % 2 == b % 2 else 0 for b in range(12))
+    for s in range(10)
+)
+
+# 五虎遁: year stem -> stem of lunar month 1 (甲/己 -> 丙, 乙/庚 -> 戊, ...)
+FIRST_MONTH_STEM: Tuple[int, ...] = tuple((s % 5) * 2 + 2 for s in range(5)) * 2
+# 五鼠遁: day stem -> stem of the Zi hour (甲/己 -> 甲, 乙/庚 -> 丙, ...)
+ZI_HOUR_STEM: Tuple[int, ...] = tuple((s % 5) * 2 for s in range(5)) * 2
+
+STEM_INDEX: Dict[str, int] = {ch: i for i, ch in enumerate(STEM_CHARS)}
+
+# 0004-01-31 is a 甲子 day and 4 AD a 甲子 year
+DAY_CYCLE_ANCHOR_ORDINAL = date(4, 1, 31).toordinal()
+YEAR_CYCLE_ANCHOR = 4
+
+
+def cycle_of(stem: int, branch: int) -> int:
+    """Cycle number (1..60) of a 0-based stem/branch pair."""
+    cycle = STEM_BRANCH_CYCLE[stem][branch]
+    if not cycle:
+        raise ValueError(f"Stem {stem} and branch {branch} differ in parity")
+    return cycle
+
+
+def year_cycle(lunar_year: int) -> int:
+    """Year pillar cycle number for a lunar year."""
+    return (lunar_year - YEAR_CYCLE_ANCHOR) % 60 + 1
+
+
+def month_cycle(lunar_year: int, lunar_month: int) -> int:
+    """Month pillar cycle number; month 1 is 寅, stems follow 五虎遁."""
+    year_stem = CYCLE_STEMS[(lunar_year - YEAR_CYCLE_ANCHOR) % 60]
+    stem = (FIRST_MONTH_STEM[year_stem] + lunar_month - 1) % 10
+    return STEM_BRANCH_CYCLE[stem][(lunar_month + 1) % 12]
+
+
+def day_cycle(day: date) -> int:
+    """Day pillar cycle number for a local civil date."""
+    return day_cycle_from_ordinal(day.toordinal())
+
+
+def day_cycle_from_ordinal(ordinal: int) -> int:
+    """Day pillar cycle number for a proleptic-Gregorian ordinal."""
+    return (ordinal - DAY_CYCLE_ANCHOR_ORDINAL) % 60 + 1
+
+
+def hour_branch(hour: int, minute: int = 0) -> int:
+    """0-based branch of the double hour; 23:00-00:59 is 子 (0)."""
+    return ((hour * 60 + minute + 60) // 120) % 12
+
+
+def hour_cycle(day_cycle_number: int, hour: int, minute: int = 0) -> int:
+    """Hour pillar cycle number for a local civil day and time.
+
+    ``day_cycle_number`` is the pillar of the civil date; 23:00-23:59 takes
+    its Zi-hour stem from the following day (五鼠遁 boundary rule).
+    """
+    branch = hour_branch(hour, minute)
+    day_stem = CYCLE_STEMS[(day_cycle_number - 1 + (hour >= 23)) % 60]
+    return STEM_BRANCH_CYCLE[(ZI_HOUR_STEM[day_stem] + branch) % 10][branch]
+
+
+def cycle_chars(cycle: int) -> Tuple[str, str]:
+    """(stem_char, branch_char) of a cycle number."""
+    return CYCLE_STEM_CHARS[cycle - 1], CYCLE_BRANCH_CHARS[cycle - 1]
@@ -1419,5 +1419,490 @@ class TestHelpers(unittest.TestCase):
         self.assertIsInstance(result, bool)
 
 
+# ============================================================
+# New Tests: Natal Analysis Cache
+# ============================================================
+
+class TestAnalysisCache(unittest.TestCase):
+
+    def setUp(self):
+        from bazi import AnalysisCache
+        self.cache = AnalysisCache(maxsize=2)
+
+    def test_hits_and_misses(self):
+        from bazi import natal_analysis
+        first = natal_analysis(1, 22, 7, 4, 'male', cache=self.cache)
+        second = natal_analysis(1, 22, 7, 4, 'M', cache=self.cache)
+        self.assertIs(first, second)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 1, 1))
+
+    def test_matches_uncached_analysis(self):
+        from bazi import natal_analysis
+        result = natal_analysis(1, 22, 7, 4, 'male', cache=self.cache)
+        chart = build_chart(1, 22, 7, 4, 'male')
+        self.assertEqual(result['chart'], chart)
+        self.assertEqual(result['comprehensive'], comprehensive_analysis(chart))
+        self.assertEqual(result['rating'], rate_chart(chart))
+
+    def test_results_are_read_only(self):
+        from bazi import natal_analysis, thaw
+        result = natal_analysis(1, 2, 3, 4, 'female', cache=self.cache)
+        with self.assertRaises(TypeError):
+            result['score'] = 0
+        with self.assertRaises(TypeError):
+            result['comprehensive']['punishments'].append({})
+        copy = thaw(result)
+        copy['chart']['gender'] = 'male'
+        self.assertEqual(result['chart']['gender'], 'female')
+
+    def test_lru_bound(self):
+        from bazi import natal_analysis
+        for day_cycle in (3, 5, 7):
+            natal_analysis(1, 2, day_cycle, 4, 'male', cache=self.cache)
+        self.assertEqual(self.cache.stats().size, 2)
+        natal_analysis(1, 2, 3, 4, 'male', cache=self.cache)
+        self.assertEqual(self.cache.stats().misses, 4)
+
+    def test_shelve_backend(self):
+        import os
+        import tempfile
+        from bazi import AnalysisCache, ShelveBackend, natal_analysis
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'natal')
+            stored = natal_analysis(1, 2, 3, 4, 'male', cache=AnalysisCache(backend=ShelveBackend(path)))
+            reopened = AnalysisCache(backend=ShelveBackend(path))
+            self.assertEqual(natal_analysis(1, 2, 3, 4, 'male', cache=reopened), stored)
+            self.assertEqual(reopened.stats().hits, 1)
+
+    def test_shelve_backend_shared_between_instances(self):
+        import os
+        import tempfile
+        import threading
+        from bazi import ShelveBackend
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'shared')
+            backends = [ShelveBackend(path) for _ in range(4)]
+
+            def write(i):
+                for j in range(10):
+                    backends[i].set(f'{i}-{j}', j)
+
+            threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(len(backends[0]), 40)
+            self.assertEqual(backends[1].get('3-9'), 9)
+
+    def test_concurrent_misses_compute_once(self):
+        import threading
+        import time
+        from bazi.cache import ChartSignature
+        calls = []
+
+        def compute(signature):
+            calls.append(signature)
+            time.sleep(0.05)
+            return {'day_cycle': signature.day_cycle}
+
+        signature = ChartSignature.of(1, 2, 3, 4, 'male')
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(
+                self.cache.get_or_compute(signature, 'test', compute)))
+            for _ in range(6)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'day_cycle': 3}] * 6)
+        stats = self.cache.stats()
+        self.assertEqual((stats.hits, stats.misses), (5, 1))
+
+    def test_failed_compute_is_retried(self):
+        from bazi.cache import ChartSignature
+        signature = ChartSignature.of(1, 2, 3, 4, 'male')
+
+        def fail(signature):
+            raise RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            self.cache.get_or_compute(signature, 'test', fail)
+        self.assertEqual(self.cache.get_or_compute(signature, 'test', lambda s: 1), 1)
+
+    def test_freeze_plain_mappings(self):
+        from types import MappingProxyType
+        from bazi import FrozenDict, Chart
+        from bazi.frozen import freeze, thaw
+        frozen = freeze(MappingProxyType({'a': [1]}))
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertEqual(frozen, {'a': [1]})
+        self.assertEqual(thaw(MappingProxyType({'a': (1,)})), {'a': (1,)})
+        chart = freeze(build_chart(1, 2, 3, 4, 'male'))
+        self.assertIsInstance(chart, Chart)
+        with self.assertRaises(TypeError):
+            chart['gender'] = 'female'
+
+    def test_invalid_signature(self):
+        from bazi import natal_analysis
+        with self.assertRaises(ValueError):
+            natal_analysis(0, 2, 3, 4, 'male', cache=self.cache)
+        with self.assertRaises(ValueError):
+            natal_analysis(1, 2, 3, 4, 'x', cache=self.cache)
+
+
+# ============================================================
+# New Tests: Integer-coded Chart
+# ============================================================
+
+class TestChart(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = build_chart(43, 15, 9, 37, 'M')  # 丙午, 戊寅, 壬申, 庚子
+
+    def test_integer_fields(self):
+        from bazi import Chart
+        self.assertIsInstance(self.chart, Chart)
+        self.assertEqual(self.chart.cycles, (43, 15, 9, 37))
+        self.assertEqual(self.chart.stems, (2, 4, 8, 6))
+        self.assertEqual(self.chart.branches, (6, 2, 8, 0))
+        self.assertEqual(self.chart.day_master, 8)
+        self.assertEqual(self.chart.branch_mask, (1 << 6) | (1 << 2) | (1 << 8) | 1)
+        self.assertTrue(self.chart.has_branch(0))
+        self.assertFalse(self.chart.has_branch(1))
+        self.assertEqual(self.chart.hidden[3], (9,))  # 子 hides 癸
+
+    def test_dict_view(self):
+        self.assertEqual(self.chart['gender'], 'male')
+        self.assertEqual(self.chart['day_master'], {'stem': '壬', 'element': 'Water'})
+        year = self.chart['pillars']['year']
+        self.assertEqual((year['stem'], year['branch'], year['ten_god']), ('丙', '午', '偏财'))
+        self.assertEqual(year['nayin']['chinese'], '天河水')
+        self.assertEqual(set(self.chart), {'pillars', 'day_master', 'gender'})
+        self.assertEqual(self.chart.to_dict(), self.chart)
+
+    def test_json_and_mutation(self):
+        import json
+        chart = build_chart(1, 2, 3, 4, 'male')
+        self.assertEqual(json.dumps(chart), json.dumps(chart.to_dict()))
+        chart['gender'] = 'female'
+        self.assertEqual(chart.gender, 'female')
+        chart['note'] = 'x'
+        self.assertEqual(json.loads(json.dumps(chart))['note'], 'x')
+        # Pillars and day master always follow the integers
+        with self.assertRaises(TypeError):
+            chart['pillars']['day']['branch'] = '子'
+        with self.assertRaises(TypeError):
+            chart['day_master'] = {'stem': '甲', 'element': 'Wood'}
+        with self.assertRaises(TypeError):
+            del chart['gender']
+        chart['pillars'] = build_chart(43, 15, 9, 37, 'male')['pillars']
+        self.assertEqual(chart.cycles, (43, 15, 9, 37))
+        self.assertEqual((chart.day_master, chart['day_master']['stem']), (8, '壬'))
+        self.assertEqual(chart['pillars']['year']['ten_god'], '偏财')
+        frozen = chart.copy(frozen=True)
+        self.assertEqual(json.dumps(frozen), json.dumps(chart))
+        with self.assertRaises(TypeError):
+            frozen['gender'] = 'male'
+        with self.assertRaises(TypeError):
+            frozen['pillars']['day']['stem'] = '甲'
+        with self.assertRaises(TypeError):
+            frozen.update(gender='male')
+
+    def test_layout_renders_on_first_access(self):
+        import json
+        chart = build_chart(43, 15, 9, 37, 'male')
+        longevity_map(chart)
+        legacy = build_chart(43, 15, 9, 37, 'male').to_dict()
+        self.assertEqual(dict.__len__(chart), 1)  # only gender is stored
+        strength = score_day_master(chart)[1]
+        self.assertEqual(score_day_master(chart), score_day_master(legacy))
+        self.assertEqual(classify_structure(chart, strength), classify_structure(legacy, strength))
+        self.assertEqual(weighted_ten_god_distribution(chart), weighted_ten_god_distribution(legacy))
+        self.assertEqual(dict.__len__(chart), 1)
+        self.assertEqual(rate_chart(chart), rate_chart(legacy))
+        self.assertEqual(chart, build_chart(43, 15, 9, 37, 'male'))
+        self.assertEqual(list(chart), ['pillars', 'day_master', 'gender'])
+        self.assertTrue(json.dumps(build_chart(43, 15, 9, 37, 'male')).startswith('{"pillars": {"year"'))
+        self.assertIs(chart['pillars']['day'], build_chart(1, 2, 9, 4, 'male')['pillars']['day'])
+
+    def test_from_dict_round_trip(self):
+        from bazi import Chart, as_chart
+        rebuilt = as_chart(self.chart.to_dict())
+        self.assertEqual(rebuilt.cycles, self.chart.cycles)
+        self.assertEqual(rebuilt, self.chart)
+        self.assertIs(as_chart(self.chart), self.chart)
+        bad = self.chart.to_dict()
+        bad['pillars']['day']['branch'] = '丑'  # 壬丑 is not a sexagenary pair
+        with self.assertRaises(ValueError):
+            Chart.from_dict(bad)
+
+    def test_pickle(self):
+        import pickle
+        restored = pickle.loads(pickle.dumps(self.chart))
+        self.assertEqual(restored.cycles, self.chart.cycles)
+        self.assertEqual(restored, self.chart)
+
+    def test_invalid_cycle(self):
+        with self.assertRaises(ValueError):
+            build_chart(1, 2, 3, 61, 'male')
+
+    def test_dict_charts_still_accepted(self):
+        from bazi import void_in_pillars
+        legacy = self.chart.to_dict()
+        self.assertEqual(longevity_map(legacy), longevity_map(self.chart))
+        self.assertEqual(void_in_pillars(legacy), void_in_pillars(self.chart))
+
+
+# ============================================================
+# New Tests: Branch Bitmask Detection
+# ============================================================
+
+class TestBranchMasks(unittest.TestCase):
+
+    def test_pair_flags_match_tables(self):
+        from bazi.branch_masks import PAIR_FLAGS, HE, CHONG, HAI
+        from bazi import LIU_HE, LIU_CHONG, HARM_PAIRS
+        for a, ba in enumerate(EARTHLY_BRANCHES):
+            for b, bb in enumerate(EARTHLY_BRANCHES):
+                pair = frozenset({ba, bb})
+                self.assertEqual(bool(PAIR_FLAGS[a][b] & HE), pair in LIU_HE)
+                self.assertEqual(bool(PAIR_FLAGS[a][b] & CHONG), pair in LIU_CHONG)
+                self.assertEqual(bool(PAIR_FLAGS[a][b] & HAI), pair in HARM_PAIRS)
+
+    def test_masks(self):
+        from bazi.branch_masks import branch_mask, clash_mask
+        self.assertEqual(branch_mask('子午'), branch_mask([0, 6]))
+        self.assertEqual(clash_mask(branch_mask('子寅')), branch_mask('午申'))
+
+    def test_pair_tag_table(self):
+        from bazi.branch_masks import pair_tag_table
+        tags = pair_tag_table([0, 0, 1, 7])  # 子 子 丑 未
+        self.assertEqual(tags[6], ('冲', '冲', '害', '合'))  # 午 vs 子, 子, 丑, 未
+        self.assertEqual(tags[1], ('合', '合', '冲'))  # 丑 vs 子, 子, 未
+        self.assertEqual(tags[3], ())  # 卯
+
+    def test_dict_and_chart_inputs_agree(self):
+        chart = build_chart(43, 15, 9, 37, 'male')
+        self.assertEqual(detect_branch_interactions(chart),
+                         detect_branch_interactions(chart.to_dict()))
+
+    def test_dynamic_interactions(self):
+        from bazi import detect_dynamic_interactions
+        chart = build_chart(43, 15, 9, 37, 'male')  # 午 寅 申 子
+        result = detect_dynamic_interactions(chart, {'luck': '戌', 'annual': 4})
+        self.assertEqual(result['六冲'], [{'pillars': ('luck', 'annual'), 'branches': ('戌', '辰')}])
+        self.assertEqual(set(result['三合']),
+                         {frozenset('申子辰'), frozenset('寅午戌')})
+        self.assertEqual([e['pillars'] for e in result['半三合']],
+                         [('year', 'luck'), ('hour', 'annual')])
+        self.assertEqual(detect_dynamic_interactions(chart, {})['六冲'], [])
+
+    def test_dynamic_validation(self):
+        from bazi import detect_dynamic_interactions
+        chart = build_chart(43, 15, 9, 37, 'male')
+        with self.assertRaises(ValueError):
+            detect_dynamic_interactions(chart, {'year': '子'})
+        with self.assertRaises(ValueError):
+            detect_dynamic_interactions(chart, {'luck': 'X'})
+        with self.assertRaises(ValueError):
+            detect_dynamic_interactions(chart, {'luck': 12})
+
+
+# ============================================================
+# New Tests: Columnar Projection Engine
+# ============================================================
+
+class TestProjectionEngine(unittest.TestCase):
+
+    def setUp(self):
+        from bazi import Projector
+        self.chart = build_chart(43, 15, 9, 37, 'male')  # 午 寅 申 子, DM 壬
+        self.projector = Projector(self.chart)
+
+    def test_tables_match_scalar_functions(self):
+        from bazi import TEN_GOD_NAMES
+        from bazi.projection_engine import TEN_GOD_BY_CYCLE, LIFE_STAGE_BY_CYCLE
+        for dm in range(10):
+            for cycle in range(1, 61):
+                stem, branch = (cycle - 1) % 10, (cycle - 1) % 12
+                self.assertEqual(TEN_GOD_NAMES[TEN_GOD_BY_CYCLE[dm, cycle]], ten_god(dm, stem))
+                self.assertEqual(LIFE_STAGE_BY_CYCLE[dm, cycle], changsheng_stage(dm, branch)[0])
+
+    def test_project_columns(self):
+        from bazi import interaction_names
+        from bazi.branch_masks import CHONG
+        records = self.projector.project(range(1, 61))
+        self.assertEqual(len(records), 60)
+        wu = records[30]  # cycle 31 = 甲午
+        self.assertEqual(wu['cycle'], 31)
+        # 午 clashes natal 子 and half-combines with natal 寅
+        self.assertEqual(interaction_names(int(wu['interactions'])), ['六冲', '半三合'])
+        clash_branches = {(int(c) - 1) % 12 for c in records['cycle'][records['interactions'] & CHONG != 0]}
+        self.assertEqual(clash_branches, {0, 6, 8, 2})  # 子, 午, 申, 寅
+        with self.assertRaises(ValueError):
+            self.projector.project([0])
+
+    def test_rendered_fields(self):
+        records = self.projector.project([31])
+        (fields,) = self.projector.iter_fields(records)
+        self.assertEqual(fields['ganzhi'], '甲午')
+        self.assertEqual(fields['ten_god'], ten_god(8, 0))
+        self.assertEqual(fields['life_stage'], life_stage_detail(8, 6))
+        self.assertEqual(fields['interactions'], ['冲'])
+
+    def test_day_and_year_cycles(self):
+        from datetime import date
+        from bazi import day_cycles, year_cycles
+        from shared.sexagenary import day_cycle
+        start = date(2024, 2, 10)
+        cycles = day_cycles(start.toordinal(), 61)
+        self.assertEqual(int(cycles[0]), day_cycle(start))
+        self.assertEqual(int(cycles[1]), int(cycles[0]) % 60 + 1)
+        self.assertEqual(cycles[60], cycles[0])
+        self.assertEqual(year_cycles(1984, 2).tolist(), [1, 2])
+
+    def test_day_projection_length(self):
+        from datetime import date
+        from bazi import generate_day_projections
+        days = generate_day_projections(self.chart, date(2024, 1, 1), date(2024, 1, 31))
+        self.assertEqual(len(days), 31)
+        self.assertEqual(days[-1]['date'], '2024-01-31')
+
+
+# ============================================================
+# New Tests: Streaming Projections
+# ============================================================
+
+class TestStreamingProjections(unittest.TestCase):
+
+    def setUp(self):
+        self.chart = build_chart(43, 15, 9, 37, 'male')
+
+    def _stub_moon_phases(self):
+        """Synthetic new moons every 29.53 days; records each search window."""
+        from datetime import datetime, timezone
+        from bazi import projections
+        epoch = datetime(2000, 1, 6, 18, 14, tzinfo=timezone.utc).timestamp()
+        windows = []
+
+        def phases(start, end):
+            windows.append((start, end))
+            period = 29.530588853 * 86400
+            k = int((start.timestamp() - epoch) // period)
+            out = []
+            while epoch + k * period <= end.timestamp():
+                ts = epoch + k * period
+                if ts >= start.timestamp():
+                    out.append((int(ts), 0, 'New Moon'))
+                k += 1
+            return out
+
+        original = projections.calculate_moon_phases
+        projections.calculate_moon_phases = phases
+        self.addCleanup(setattr, projections, 'calculate_moon_phases', original)
+        return windows
+
+    def test_new_moons_stream_one_lunar_year_at_a_time(self):
+        from datetime import date
+        from itertools import islice
+        from bazi import get_new_moon_dates
+        from bazi.projections import iter_new_moon_dates
+        windows = self._stub_moon_phases()
+        moons = get_new_moon_dates(date(2024, 1, 1), 40)
+        self.assertEqual(len(moons), 40)
+        self.assertEqual(len(set(moons)), 40)
+        self.assertTrue(all(29 <= (b - a).days <= 30 for a, b in zip(moons, moons[1:])))
+        self.assertTrue(all((end - start).days <= 390 for start, end in windows))
+
+        windows.clear()
+        next(iter_new_moon_dates(date(2024, 1, 1)))
+        self.assertEqual(len(windows), 1)
+        self.assertEqual(list(islice(iter_new_moon_dates(date(2024, 1, 1)), 40)), moons)
+
+    def _stub_batch(self):
+        """Fake solar_to_lunisolar_batch; records the size of every call."""
+        from types import SimpleNamespace
+        from bazi import projections
+        calls = []
+
+        def batch(date_tuples, quiet=True):
+            calls.append(len(date_tuples))
+            return [
+                SimpleNamespace(month_cycle=(i % 60) + 1, year=2024, month=i % 12 + 1,
+                                day=1, is_leap_month=False)
+                for i, _ in enumerate(date_tuples)
+            ]
+
+        original = projections.solar_to_lunisolar_batch
+        projections.solar_to_lunisolar_batch = batch
+        self.addCleanup(setattr, projections, 'solar_to_lunisolar_batch', original)
+        return calls
+
+    def test_month_stream_batches_and_numbering(self):
+        from datetime import date
+        from itertools import islice
+        from bazi.projections import iter_month_projections
+        calls = self._stub_batch()
+        months = list(iter_month_projections(
+            self.chart, date(2020, 1, 1), date(2022, 6, 1), use_new_moons=False))
+        self.assertEqual(len(months), 31)  # 30-day steps through the first date >= end
+        self.assertEqual(calls, [13, 13, 5])
+        self.assertEqual([m['month_num'] for m in months], list(range(1, 32)))
+        self.assertEqual(months[13]['date'], '2021-01-25')  # first entry of the second batch
+        self.assertNotIn('lunisolar_date', months[0])
+
+        calls.clear()
+        self.assertEqual(len(list(islice(iter_month_projections(
+            self.chart, date(2020, 1, 1), None, use_new_moons=False), 20))), 20)
+        self.assertEqual(calls, [13, 13])
+
+    def test_new_moon_month_stream_stops_at_end_date(self):
+        from datetime import date
+        from bazi import generate_month_projections
+        from bazi.projections import iter_month_projections, get_new_moon_dates
+        self._stub_moon_phases()
+        calls = self._stub_batch()
+        end = date(2025, 6, 30)
+        months = list(iter_month_projections(self.chart, date(2024, 1, 1), end))
+        moons = [d for d in get_new_moon_dates(date(2024, 1, 1), 40) if d <= end]
+        self.assertEqual([m['date'] for m in months], [d.isoformat() for d in moons])
+        self.assertEqual(sum(calls), len(moons))
+        self.assertTrue(all(n <= 13 for n in calls))
+        self.assertEqual(months[-1]['month_num'], len(moons))
+        self.assertEqual(len(months[0]['lunisolar_date']), 5)
+        self.assertEqual(len(generate_month_projections(self.chart, date(2024, 1, 1), end)), 36)
+
+    def test_day_stream_is_unbounded(self):
+        from datetime import date
+        from itertools import islice
+        from bazi.projections import iter_day_projections
+        days = list(islice(iter_day_projections(self.chart, date(2024, 1, 1)), 800))
+        self.assertEqual(len(days), 800)
+        self.assertEqual(days[-1]['day_num'], 800)
+        self.assertEqual(days[366]['date'], '2025-01-01')
+
+    def test_long_spans_are_not_truncated(self):
+        from datetime import date
+        from bazi import generate_day_projections
+        days = generate_day_projections(self.chart, date(2000, 1, 1), date(2020, 12, 31))
+        self.assertEqual(len(days), (date(2020, 12, 31) - date(2000, 1, 1)).days + 1)
+        self.assertEqual(len(generate_day_projections(self.chart, date(2000, 1, 1), None)), 100)
+        self.assertEqual(len(generate_day_projections(self.chart, date(2000, 1, 2), date(2000, 1, 1))), 1)
+
+    def test_year_stream(self):
+        from itertools import islice
+        from bazi import generate_year_projections
+        from bazi.projections import iter_year_projections
+        stream = list(islice(iter_year_projections(self.chart, 1900), 150))
+        self.assertEqual([e['year'] for e in stream], list(range(1900, 2050)))
+        self.assertEqual(stream, generate_year_projections(self.chart, 1900, 2049))
+        self.assertEqual(generate_year_projections(self.chart, 2030, 2020), [])
+
+
 if __name__ == '__main__':
     unittest.main()
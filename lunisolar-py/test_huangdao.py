@@ -0,0 +1,287 @@
+"""
+Tests for the Huangdao systems (十二建星 / 大黄道).
+
+Solar-term lookups run against an in-memory ephemeris stand-in, so these
+tests do not need the NASA DE440 file.
+"""
+
+import unittest
+import logging
+import os
+import sys
+
+# Suppress all logging during tests
+logging.disable(logging.CRITICAL)
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import io
+import json
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from huangdao.calculator import HuangdaoCalculator
+from huangdao.construction_stars import ConstructionStars
+from huangdao.constants import BRANCH_INDEX, BUILDING_BRANCH_BY_MONTH
+from shared.constants import BRANCH_CHARS
+from huangdao.export import write_csv, write_jsonl
+from huangdao.great_yellow_path import GreatYellowPath
+from huangdao.records import HUANGDAO_DAY_DTYPE, HuangdaoDay, records_to_array
+from huangdao.search import match_mask
+
+
+class _StubEphemeris:
+    """Stands in for EphemerisService: fixed solar terms, counts sweeps."""
+
+    # 立春 (21) and 雨水 (22) 2025, 驚蟄 (23) 2025, 立春 (21) 2026 — naive UTC
+    TERMS = [
+        (datetime(2025, 2, 3, 14, 10), 21),
+        (datetime(2025, 2, 18, 10, 6), 22),
+        (datetime(2025, 3, 5, 8, 7), 23),
+        (datetime(2026, 2, 3, 20, 2), 21),
+    ]
+
+    def __init__(self):
+        self.calls = []
+
+    def compute_solar_terms(self, start, end):
+        self.calls.append((start, end))
+        return [(t, idx) for t, idx in self.TERMS if start <= t <= end]
+
+
+class TestPrincipalTermDates(unittest.TestCase):
+    """Sectional-term days come from one sweep per span, on local dates."""
+
+    def test_year_is_indexed_once(self):
+        stub = _StubEphemeris()
+        stars = ConstructionStars('Asia/Ho_Chi_Minh', ephemeris_service=stub)
+        self.assertTrue(stars._is_principal_solar_term_day(datetime(2025, 2, 3)))
+        self.assertTrue(stars._is_principal_solar_term_day(date(2025, 3, 5)))
+        self.assertFalse(stars._is_principal_solar_term_day(date(2025, 2, 18)))  # 雨水 is a zhongqi
+        self.assertFalse(stars._is_principal_solar_term_day(date(2025, 2, 4)))
+        self.assertEqual(len(stub.calls), 1)
+        # Local year bounds: 2025-01-01 00:00 +07 is 2024-12-31 17:00 UTC
+        self.assertEqual(stub.calls[0], (datetime(2024, 12, 31, 17, 0), datetime(2025, 12, 31, 17, 0)))
+
+    def test_dates_follow_the_local_zone(self):
+        stars = ConstructionStars('Asia/Tokyo', ephemeris_service=_StubEphemeris())
+        self.assertEqual(stars.principal_term_dates(2026), frozenset({date(2026, 2, 4)}))
+
+    def test_load_years_splits_one_sweep(self):
+        stub = _StubEphemeris()
+        stars = ConstructionStars('Asia/Ho_Chi_Minh', ephemeris_service=stub)
+        stars.load_years(2025, 2026)
+        self.assertEqual(stars.principal_term_dates(2025), frozenset({date(2025, 2, 3), date(2025, 3, 5)}))
+        self.assertEqual(stars.principal_term_dates(2026), frozenset({date(2026, 2, 4)}))
+        self.assertEqual(len(stub.calls), 1)
+
+
+class _WinterTermsStub(_StubEphemeris):
+    """大雪 2024, 小寒 / 立春 / 驚蟄 2025."""
+
+    TERMS = [
+        (datetime(2024, 12, 6, 22, 17), 17),
+        (datetime(2025, 1, 5, 9, 33), 19),
+        (datetime(2025, 2, 3, 14, 10), 21),
+        (datetime(2025, 3, 5, 8, 7), 23),
+    ]
+
+
+class TestClosedFormStars(unittest.TestCase):
+    """Stars resolve per date from the sectional-term month, no previous day needed."""
+
+    def setUp(self):
+        self.stars = ConstructionStars('Asia/Ho_Chi_Minh', ephemeris_service=_WinterTermsStub())
+
+    def test_building_branch_follows_sectional_terms(self):
+        self.assertEqual(self.stars.building_branch_index(date(2025, 1, 1)), 0)   # 大雪 -> 子
+        self.assertEqual(self.stars.building_branch_index(date(2025, 1, 5)), 1)   # 小寒 -> 丑
+        self.assertEqual(self.stars.building_branch_index(date(2025, 2, 2)), 1)
+        self.assertEqual(self.stars.building_branch_index(date(2025, 2, 3)), 2)   # 立春 -> 寅
+
+    def test_star_repeats_on_sectional_term_day(self):
+        before, on = self.stars.star_index(date(2025, 2, 2)), self.stars.star_index(date(2025, 2, 3))
+        self.assertEqual(before, on)
+        self.assertEqual(self.stars.star_index(date(2025, 2, 4)), (on + 1) % 12)
+        # 2025-02-03 is a 卯 day in the 寅 month: 除
+        self.assertEqual(self.stars.get_construction_star(datetime(2025, 2, 3)), '除')
+
+    def test_vectorized_matches_scalar(self):
+        import numpy as np
+        days = np.arange('2025-01-01', '2025-03-31', dtype='datetime64[D]')
+        expected = [self.stars.star_index(d) for d in days.tolist()]
+        self.assertEqual(self.stars.star_indexes(days).tolist(), expected)
+        self.assertEqual(self.stars.building_branch_indexes(days).tolist(),
+                         [self.stars.building_branch_index(d) for d in days.tolist()])
+        self.assertEqual(self.stars.sectional_term_mask(days).tolist(),
+                         [self.stars._is_principal_solar_term_day(d) for d in days.tolist()])
+
+
+class TestLookupTables(unittest.TestCase):
+    """The 12x12 tables agree with the per-day rules cell by cell."""
+
+    def test_spirit_table(self):
+        from huangdao.tables import SPIRIT_TABLE, spirit_indexes
+        gyp = GreatYellowPath()
+        for month in range(1, 13):
+            for branch in range(12):
+                self.assertEqual(SPIRIT_TABLE[month, branch], gyp.spirit_index(month, branch))
+        self.assertEqual(spirit_indexes([1, 11], [3, 8]).tolist(), [3, 0])
+
+    def test_star_tables(self):
+        from huangdao.tables import LUNAR_MONTH_STAR_TABLE, STAR_TABLE, star_indexes
+        stars = ConstructionStars('Asia/Ho_Chi_Minh', ephemeris_service=_StubEphemeris())
+        for building in range(12):
+            for branch in range(12):
+                self.assertEqual(STAR_TABLE[building, branch], stars._star_index_from_branches(building, branch))
+        for month, building in BUILDING_BRANCH_BY_MONTH.items():
+            self.assertEqual(LUNAR_MONTH_STAR_TABLE[month].tolist(), STAR_TABLE[BRANCH_INDEX[building]].tolist())
+        self.assertEqual(star_indexes(2, [2, 3, 1]).tolist(), [0, 1, 11])
+
+    def test_tables_are_read_only(self):
+        from huangdao.tables import SPIRIT_TABLE
+        with self.assertRaises(ValueError):
+            SPIRIT_TABLE[1, 0] = 5
+
+
+class TestHuangdaoDay(unittest.TestCase):
+    """Day records hold integers only; strings are rendered on demand."""
+
+    def setUp(self):
+        self.calculator = HuangdaoCalculator('Asia/Ho_Chi_Minh')
+        self.calculator.construction_stars = ConstructionStars(
+            'Asia/Ho_Chi_Minh', ephemeris_service=_WinterTermsStub())
+        # 2025-02-03: 卯 day of lunar month 1
+        self.dto = SimpleNamespace(month=1, is_leap_month=False, day_branch='卯')
+
+    def test_record_is_integer_coded(self):
+        record = self.calculator.day_record(date(2025, 2, 3), self.dto)
+        self.assertEqual(record, HuangdaoDay(date(2025, 2, 3).toordinal(), 1, 3, 3, 2, 1, False, True))
+        self.assertEqual((record.star_char, record.score, record.spirit_enum.chinese), ('除', 4, '朱雀'))
+        self.assertFalse(record.is_yellow_path)
+
+    def test_dict_rendering_matches_day_info(self):
+        info = self.calculator.calculate_day_info(datetime(2025, 2, 3), self.dto)
+        self.assertEqual(info["date"], "2025-02-03")
+        self.assertEqual(info["building_branch"], "寅")
+        self.assertEqual(info["gyp_path_type"], "黑道")
+        self.assertEqual(info, self.calculator.day_record(date(2025, 2, 3), self.dto).to_dict())
+
+    def test_month_calendar_header_uses_sectional_terms(self):
+        import contextlib
+        import huangdao.calculator as calculator_module
+
+        def batch(date_tuples, timezone_name, quiet=True):
+            # Lunar month 1 from 2025-01-29; day branches from the day cycle
+            return [
+                SimpleNamespace(month=12 if date.fromisoformat(d) < date(2025, 1, 29) else 1,
+                                is_leap_month=False,
+                                day_branch=BRANCH_CHARS[(date.fromisoformat(d).toordinal() + 2) % 12])
+                for d, _ in date_tuples
+            ]
+
+        original = calculator_module.solar_to_lunisolar_batch
+        calculator_module.solar_to_lunisolar_batch = batch
+        self.addCleanup(setattr, calculator_module, 'solar_to_lunisolar_batch', original)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.calculator.print_month_calendar(2025, 2)
+        header = out.getvalue().splitlines()[4]
+        self.assertEqual(header, "Lunar Month: 1 | Building Branch: 丑 (Chǒu) from 01, 寅 (Yín) from 03")
+
+    def test_structured_array(self):
+        record = self.calculator.day_record(date(2025, 2, 3), self.dto)
+        packed = records_to_array([record, record])
+        self.assertEqual(packed.dtype, HUANGDAO_DAY_DTYPE)
+        self.assertEqual(HUANGDAO_DAY_DTYPE.itemsize, 11)
+        self.assertEqual(HuangdaoDay(*packed[0].tolist()), record)
+
+
+def _synthetic_records(start, end):
+    """Deterministic stand-in for ``HuangdaoCalculator.day_records``."""
+    first, last = start.toordinal(), end.toordinal()
+    return records_to_array(
+        HuangdaoDay(o, o % 12, (o // 2) % 12, (o - 3) % 12, 2, (o // 30) % 12 + 1, False, o % 15 == 0)
+        for o in range(first, last + 1)
+    )
+
+
+class TestFindDays(unittest.TestCase):
+    """Searches filter integer columns and stop at the limit."""
+
+    def setUp(self):
+        self.calculator = HuangdaoCalculator('Asia/Ho_Chi_Minh')
+        self.built = []
+
+        def day_records(start, end):
+            self.built.append(start.year)
+            return _synthetic_records(start, end)
+
+        self.calculator.day_records = day_records
+
+    def test_matches_brute_force(self):
+        criteria = dict(yellow_path=True, min_score=3, avoid_clash_with='午')
+        found = self.calculator.find_days('2025-03-01', '2026-06-30', **criteria)
+        expected = [
+            HuangdaoDay(*row) for row in _synthetic_records(date(2025, 3, 1), date(2026, 6, 30)).tolist()
+            if HuangdaoDay(*row).is_yellow_path and HuangdaoDay(*row).score >= 3 and row[3] != 0
+        ]
+        self.assertEqual(found, expected)
+        self.assertGreater(len(found), 0)
+
+    def test_stops_at_limit(self):
+        found = self.calculator.find_days('2025-01-01', '2034-12-31', limit=3, stars=['除', '定'])
+        self.assertEqual(len(found), 3)
+        self.assertTrue(all(day.star_char in ('除', '定') for day in found))
+        self.assertEqual(self.built, [2025])
+        # Years are indexed once and reused
+        self.calculator.find_days('2025-06-01', '2025-07-01', spirits=['青龙'])
+        self.assertEqual(self.built, [2025])
+
+    def test_generate_range_reads_day_records(self):
+        days = list(self.calculator.generate_range('2025-12-30', '2026-01-02'))
+        expected = [HuangdaoDay(*row) for row in _synthetic_records(date(2025, 12, 30), date(2026, 1, 2)).tolist()]
+        self.assertEqual(days, expected)
+        self.assertEqual(self.built, [2025, 2026])
+
+    def test_mask_filters(self):
+        records = _synthetic_records(date(2025, 1, 1), date(2025, 12, 31))
+        mask = match_mask(records, lunar_months=[3], solar_term=True)
+        self.assertTrue((records['lunar_month'][mask] == 3).all())
+        self.assertTrue(records['is_solar_term'][mask].all())
+        with self.assertRaises(ValueError):
+            match_mask(records, stars=['X'])
+        with self.assertRaises(ValueError):
+            match_mask(records, lunar_months=[13])
+
+
+class TestAlmanacExport(unittest.TestCase):
+    """Range records stream to JSON Lines and CSV without buffering."""
+
+    RECORDS = [
+        {"date": "2025-01-30", "star": "收", "score": 2, "gyp_is_auspicious": False},
+        {"date": "2025-01-31", "star": "开", "score": 3, "gyp_is_auspicious": True},
+    ]
+
+    def test_jsonl_round_trips(self):
+        stream = io.StringIO()
+        self.assertEqual(write_jsonl(iter(self.RECORDS), stream), 2)
+        lines = stream.getvalue().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], self.RECORDS)
+        self.assertIn("收", lines[0])
+
+    def test_csv_header_from_first_record(self):
+        stream = io.StringIO()
+        self.assertEqual(write_csv(iter(self.RECORDS), stream), 2)
+        rows = stream.getvalue().splitlines()
+        self.assertEqual(rows[0], "date,star,score,gyp_is_auspicious")
+        self.assertEqual(rows[2], "2025-01-31,开,3,True")
+
+    def test_range_must_be_ordered(self):
+        calculator = HuangdaoCalculator('Asia/Ho_Chi_Minh')
+        with self.assertRaises(ValueError):
+            next(calculator.generate_range('2025-02-01', date(2025, 1, 31)))
+
+
+if __name__ == '__main__':
+    unittest.main()
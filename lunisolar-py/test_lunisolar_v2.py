@@ -12,6 +12,9 @@ import unittest
 import logging
 import sys
 import os
+import tempfile
+import threading
+from unittest import mock
 
 # Suppress all logging during tests
 logging.disable(logging.CRITICAL)
@@ -23,7 +26,40 @@ _ORIG_CWD = os.getcwd()
 os.chdir(_REPO_ROOT)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from datetime import date, datetime, timedelta
+
 from lunisolar_v2 import solar_to_lunisolar, solar_to_lunisolar_batch
+from lunisolar.api import use_month_table
+from lunisolar.month_builder import LeapMonthAssigner, TermIndexer
+from lunisolar.period_index import PeriodIndex
+from utils import quiet_logging, setup_logging
+from shared.models import MonthPeriod, PrincipalTerm
+from shared import sexagenary
+from lunisolar.month_table import MonthTable
+from lunisolar.solstice_provider import SolsticeProvider
+from lunisolar.batch_planner import BatchPlan, BatchPlanner, YearSegment
+from lunisolar.ephemeris_service import EphemerisService
+from lunisolar.vectorized import solar_to_lunisolar_array
+from lunisolar.converter import LunisolarConverter, get_converter
+from lunisolar.meridian import CHINESE, VIETNAMESE, VIETNAMESE_HISTORICAL, CalendarMeridian, get_meridian
+from lunisolar.pillars import day_hour_pillars, day_hour_pillars_array
+from ephemeris.event_cache import EventCache, datetime_to_us
+from ephemeris.registry import EphemerisRegistry, get_registry
+from timezone_handler import TimezoneHandler, get_offset_table
+
+
+def _sample_month_table() -> MonthTable:
+    """Lunar months 11/2024 .. 2/2025 (CST), enough to exercise the fast path."""
+    starts = [date(2024, 12, 1), date(2024, 12, 31), date(2025, 1, 29), date(2025, 2, 28)]
+    return MonthTable(
+        start_ordinals=[d.toordinal() for d in starts],
+        month_numbers=[11, 12, 1, 2],
+        leap_flags=[False, False, False, False],
+        lunar_years=[2024, 2024, 2025, 2025],
+        end_ordinal=date(2025, 3, 29).toordinal(),
+        start_year=2025,
+        end_year=2025,
+    )
 
 
 class TestLunarYearBeforeLunarNewYear(unittest.TestCase):
@@ -99,6 +135,118 @@ class TestMonthStemCorrectness(unittest.TestCase):
         self.assertEqual(result.month_branch, '丑')
 
 
+class TestSexagenaryKernel(unittest.TestCase):
+    """Integer pillar tables agree with the classical rules."""
+
+    def test_stem_branch_table(self):
+        self.assertEqual(sexagenary.cycle_of(0, 0), 1)
+        self.assertEqual(sexagenary.cycle_of(9, 11), 60)
+        self.assertEqual(sexagenary.cycle_chars(sexagenary.cycle_of(2, 4)), ('丙', '辰'))
+        with self.assertRaises(ValueError):
+            sexagenary.cycle_of(0, 1)
+
+    def test_month_and_hour_pillars(self):
+        # 2025 is 乙巳: month 1 is 戊寅, month 12 is 己丑
+        self.assertEqual(sexagenary.cycle_chars(sexagenary.month_cycle(2025, 1)), ('戊', '寅'))
+        self.assertEqual(sexagenary.cycle_chars(sexagenary.month_cycle(2025, 12)), ('己', '丑'))
+        # 2025-01-20 is a 己丑 day; 23:30 belongs to the next (庚寅) day's 丙子 hour
+        day = sexagenary.day_cycle(date(2025, 1, 20))
+        self.assertEqual(sexagenary.cycle_chars(day), ('己', '丑'))
+        self.assertEqual(sexagenary.cycle_chars(sexagenary.hour_cycle(day, 0, 30)), ('甲', '子'))
+        self.assertEqual(sexagenary.cycle_chars(sexagenary.hour_cycle(day, 23, 30)), ('丙', '子'))
+
+
+class TestPillars(unittest.TestCase):
+    """Ephemeris-free day/hour pillars, scalar and vectorized."""
+
+    def test_array_matches_scalar(self):
+        import numpy as np
+        start = datetime(1969, 12, 30, 22, 0)
+        slots = [start + timedelta(minutes=37 * i) for i in range(400)]
+        result = day_hour_pillars_array(np.array(slots, dtype='datetime64[m]'))
+        for slot, row in zip(slots, result):
+            self.assertEqual(tuple(day_hour_pillars(slot)), (row['day_cycle'], row['hour_cycle']))
+
+    def test_zi_hour_rolls_to_next_day_stem(self):
+        pillars = day_hour_pillars(datetime(2025, 1, 20, 23, 30))
+        self.assertEqual(pillars.day_chars, ('己', '丑'))
+        self.assertEqual(pillars.hour_chars, ('丙', '子'))
+
+
+class TestOffsetTable(unittest.TestCase):
+    """Vectorized offset transitions must agree with pytz localize/astimezone."""
+
+    def test_local_to_utc_matches_pytz_around_transitions(self):
+        import numpy as np
+        import pytz
+        epoch = datetime(1970, 1, 1)
+        for name in ('America/New_York', 'Australia/Lord_Howe', 'Asia/Ho_Chi_Minh'):
+            tz = pytz.timezone(name)
+            table = get_offset_table(name)
+            local = [datetime(2024, m, d) + timedelta(minutes=15 * i)
+                     for m, d in ((3, 10), (4, 7), (10, 6), (11, 3)) for i in range(16)]
+            seconds = np.array([(dt - epoch) // timedelta(seconds=1) for dt in local], dtype=np.int64)
+            utc = table.local_to_utc(seconds)
+            for dt, got in zip(local, utc.tolist()):
+                expected = tz.localize(dt, is_dst=False).astimezone(pytz.utc).replace(tzinfo=None)
+                self.assertEqual(epoch + timedelta(seconds=got), expected, (name, dt))
+            self.assertTrue(np.array_equal(table.utc_to_local(utc[:8]), seconds[:8]))
+        self.assertIs(get_offset_table('America/New_York'), get_offset_table('America/New_York'))
+
+    def test_instant_seconds_accepts_date_datetime_and_epoch(self):
+        import pytz
+        handler = TimezoneHandler('Asia/Ho_Chi_Minh')
+        noon = 1737349200  # 2025-01-20 05:00 UTC
+        local = noon + 7 * 3600
+        self.assertEqual(handler.instant_seconds(date(2025, 1, 20)), (local, noon))
+        self.assertEqual(handler.instant_seconds(datetime(2025, 1, 20, 12, 0)), (local, noon))
+        self.assertEqual(handler.instant_seconds(datetime(2025, 1, 20, 5, 0, tzinfo=pytz.utc)), (local, noon))
+        self.assertEqual(handler.instant_seconds(noon), (local, noon))
+        with self.assertRaises(TypeError):
+            handler.instant_seconds('2025-01-20')
+
+
+class TestCalendarMeridian(unittest.TestCase):
+    """Reference meridians map UTC instants to calendar dates."""
+
+    def test_fixed_and_historical_offsets(self):
+        import numpy as np
+        instant = datetime(2025, 1, 28, 16, 30)
+        self.assertEqual(CHINESE.to_date(instant), date(2025, 1, 29))
+        self.assertEqual(VIETNAMESE.to_date(instant), date(2025, 1, 28))
+        self.assertEqual(VIETNAMESE_HISTORICAL.to_date(datetime(1960, 1, 1, 16, 30)), date(1960, 1, 2))
+        self.assertEqual(VIETNAMESE_HISTORICAL.to_date(instant), date(2025, 1, 28))
+
+        instants = [datetime(1967, 8, 7, 15, 30), datetime(1967, 8, 7, 16, 30), instant]
+        seconds = np.array([(i - datetime(1970, 1, 1)) // timedelta(seconds=1) for i in instants])
+        self.assertEqual(VIETNAMESE_HISTORICAL.ordinals(seconds).tolist(),
+                         [VIETNAMESE_HISTORICAL.to_date(i).toordinal() for i in instants])
+
+    def test_resolution_and_serialization(self):
+        self.assertIs(get_meridian(), CHINESE)
+        self.assertIs(get_meridian('Vietnamese'), VIETNAMESE)
+        self.assertEqual(get_meridian(7), VIETNAMESE)
+        # Standard time only: China's 1986-1991 summer time does not move dates
+        self.assertEqual(get_meridian('Asia/Shanghai').offset_at(datetime(1988, 7, 1)), timedelta(hours=8))
+        self.assertEqual(CalendarMeridian.from_dict(VIETNAMESE_HISTORICAL.to_dict()), VIETNAMESE_HISTORICAL)
+        with self.assertRaises(ValueError):
+            get_meridian('Not/AZone')
+
+    def test_month_tables_are_per_meridian(self):
+        table = _sample_month_table()
+        self.assertIs(table.meridian, CHINESE)
+        restored = MonthTable.from_dict(MonthTable(
+            start_ordinals=list(table.start_ordinals), month_numbers=list(table.month_numbers),
+            leap_flags=list(table.leap_flags), lunar_years=list(table.lunar_years),
+            end_ordinal=table.end_ordinal, start_year=2025, end_year=2025, meridian='vietnamese',
+        ).to_dict())
+        self.assertEqual(restored.meridian, VIETNAMESE)
+        with self.assertRaises(ValueError):
+            LunisolarConverter(month_table=table, meridian='vietnamese')
+        self.assertIs(get_converter('vietnamese'), get_converter(VIETNAMESE))
+        self.assertIsNot(get_converter('vietnamese'), get_converter())
+
+
 class TestBatchConversion(unittest.TestCase):
     """Batch conversion should produce the same results as individual calls."""
 
@@ -114,5 +262,527 @@ class TestBatchConversion(unittest.TestCase):
         self.assertEqual(batch_results[1].year_branch, '辰')
 
 
+class TestNumberSegment(unittest.TestCase):
+    """Per-anchor numbering must not mutate the shared period list."""
+
+    def _periods(self, leap_at):
+        start = datetime(2022, 12, 1)
+        periods = []
+        for i in range(14):
+            s = start + timedelta(days=30 * i)
+            e = s + timedelta(days=30)
+            periods.append(MonthPeriod(
+                index=i, start_utc=s, end_utc=e,
+                start_cst_date=s.date(), end_cst_date=e.date(),
+                has_principal_term=(i != leap_at),
+            ))
+        return periods
+
+    def test_leap_month_takes_previous_number(self):
+        periods = self._periods(leap_at=4)
+        segment = LeapMonthAssigner().number_segment(periods, datetime(2022, 12, 21))
+        numbers = [(m.month_number, m.is_leap) for m in segment[:6]]
+        self.assertEqual(numbers, [(11, False), (12, False), (1, False), (2, False), (2, True), (3, False)])
+        self.assertTrue(all(p.month_number == 0 and not p.is_leap for p in periods))
+
+    def test_segment_starts_at_zi_month(self):
+        periods = self._periods(leap_at=-1)
+        segment = LeapMonthAssigner().number_segment(periods, datetime(2023, 1, 15))
+        self.assertEqual(segment[0].index, 1)
+        self.assertEqual(segment[0].month_number, 11)
+
+
+class TestPeriodIndex(unittest.TestCase):
+    """Bisect lookup and single-pass term tagging over sorted periods."""
+
+    def _periods(self):
+        periods = TestNumberSegment()._periods(leap_at=-1)
+        for p in periods:
+            p.has_principal_term = False
+        return periods
+
+    def test_bisect_lookup_matches_boundaries(self):
+        periods = self._periods()
+        index = PeriodIndex(periods)
+        self.assertIs(index.find(date(2022, 12, 1)), periods[0])
+        self.assertIs(index.find(date(2022, 12, 31)), periods[1])
+        self.assertIs(index.find(date(2023, 6, 1)), periods[6])
+        self.assertIsNone(index.find(date(2022, 11, 30)))
+        self.assertIsNone(index.find(periods[-1].end_cst_date))
+
+    def test_merge_pass_tags_owning_periods(self):
+        periods = self._periods()
+        terms = [PrincipalTerm(instant_utc=datetime.combine(d, datetime.min.time()), cst_date=d, term_index=k)
+                 for k, d in enumerate([date(2023, 3, 1), date(2022, 12, 31), date(2030, 1, 1)], 1)]
+        TermIndexer().tag_principal_terms(periods, terms)
+        self.assertEqual([i for i, p in enumerate(periods) if p.has_principal_term], [1, 3])
+
+
+class TestQuietLogging(unittest.TestCase):
+    """Quiet mode is scoped to the calling thread and numbering traces are lazy."""
+
+    def setUp(self):
+        logging.disable(logging.NOTSET)
+
+    def tearDown(self):
+        logging.disable(logging.CRITICAL)
+
+    def test_quiet_does_not_leak_across_threads(self):
+        logger = setup_logging()
+        record = logger.makeRecord(logger.name, logging.INFO, __file__, 0, "msg", (), None)
+        seen = {}
+        with quiet_logging():
+            seen['quiet'] = logger.filter(record)
+            worker = threading.Thread(target=lambda: seen.setdefault('other', logger.filter(record)))
+            worker.start()
+            worker.join()
+        self.assertFalse(seen['quiet'])
+        self.assertTrue(seen['other'])
+        self.assertTrue(logger.filter(record))
+
+    def test_numbering_trace_only_at_debug(self):
+        periods = TestNumberSegment()._periods(leap_at=4)
+        with self.assertLogs('utils', level='DEBUG') as logs:
+            LeapMonthAssigner().assign_month_numbers(periods, datetime(2022, 12, 21))
+        self.assertIn("previous=2 -> LEAP month 2", "\n".join(logs.output))
+
+        with self.assertLogs('utils', level='INFO') as logs:
+            setup_logging().info("marker")
+            LeapMonthAssigner().assign_month_numbers(periods, datetime(2022, 12, 21))
+        self.assertEqual(len(logs.output), 1)
+
+
+class TestBatchPlan(unittest.TestCase):
+    """Multi-year batches are split into one segment per solstice year."""
+
+    def test_zi_months_located_in_one_scan(self):
+        periods = TestNumberSegment()._periods(leap_at=-1)
+        solstices = [date(2022, 12, 21), date(2023, 12, 22)]
+        self.assertEqual(BatchPlanner._locate_zi_months(periods, solstices), [0, 12])
+        # A solstice on a period's first CST date belongs to that period
+        self.assertEqual(BatchPlanner._locate_zi_months(periods, [date(2022, 12, 31)]), [1])
+        with self.assertRaises(ValueError):
+            BatchPlanner._locate_zi_months(periods, [date(2030, 12, 21)])
+
+    def test_segment_for_picks_owning_segment(self):
+        periods = TestNumberSegment()._periods(leap_at=-1)
+        segment = YearSegment(
+            anchor_solstice=datetime(2022, 12, 21), next_solstice=datetime(2023, 12, 22),
+            months=LeapMonthAssigner().number_segment(periods, datetime(2022, 12, 21)), span=12,
+        )
+        plan = BatchPlan(segments=(segment,), starts=(segment.start_cst_date,))
+        self.assertIs(plan.segment_for(date(2022, 12, 1)), segment)
+        self.assertIs(plan.segment_for(date(2023, 11, 25)), segment)
+        # Zi(2023) starts on 2023-11-26, before the solstice, and is the next year's
+        with self.assertRaises(ValueError):
+            plan.segment_for(date(2023, 11, 26))
+        with self.assertRaises(ValueError):
+            plan.segment_for(date(2022, 11, 30))
+
+
+_SYNODIC_MONTH = timedelta(days=29.530589)
+_TROPICAL_YEAR = timedelta(days=365.2422)
+# 20:00 CST; the next new moon follows at 22:00 CST on the same date
+_SOLSTICE_2023 = datetime(2023, 12, 21, 12)
+_NEW_MOON_2023 = datetime(2023, 12, 21, 14)
+
+
+class _SyntheticSolsticeProvider(SolsticeProvider):
+    """Mean-motion solstices anchored at ``_SOLSTICE_2023``."""
+
+    def _search(self, year):
+        return _SOLSTICE_2023 + (year - 2023) * _TROPICAL_YEAR
+
+    def _sweep(self, year_start, year_end):
+        return {y: self._search(y) for y in range(year_start, year_end + 1)}
+
+
+def _synthetic_new_moons(service, start, end):
+    k = int((start - _NEW_MOON_2023) / _SYNODIC_MONTH) - 1
+    moons = []
+    while _NEW_MOON_2023 + k * _SYNODIC_MONTH <= end:
+        if _NEW_MOON_2023 + k * _SYNODIC_MONTH >= start:
+            moons.append(_NEW_MOON_2023 + k * _SYNODIC_MONTH)
+        k += 1
+    return moons
+
+
+def _synthetic_principal_terms(service, start, end):
+    """Mean principal terms from ``_SOLSTICE_2023``, except Z5 of 2024: without it
+    the 2023 numbering reaches Zi(2024) as month 10, not 11."""
+    step = _TROPICAL_YEAR / 12
+    k = int((start - _SOLSTICE_2023) / step) - 1
+    terms = []
+    while _SOLSTICE_2023 + k * step <= end:
+        instant = _SOLSTICE_2023 + k * step
+        if instant >= start and k != 6:
+            terms.append(PrincipalTerm(instant_utc=instant, cst_date=CHINESE.to_date(instant),
+                                       term_index=(k + 10) % 12 + 1))
+        k += 1
+    return terms
+
+
+@mock.patch('lunisolar.solstice_provider.get_event_cache', return_value=None)
+@mock.patch.object(EphemerisService, 'compute_principal_terms', _synthetic_principal_terms)
+@mock.patch.object(EphemerisService, 'compute_new_moons', _synthetic_new_moons)
+class TestZiMonthOnSolsticeDate(unittest.TestCase):
+    """A new moon later on the solstice's CST date starts the Zi month in every path."""
+
+    def test_month_table_matches_converter_across_solstices(self, _):
+        provider = _SyntheticSolsticeProvider()
+        with mock.patch('lunisolar.window_planner.get_solstice_provider', return_value=provider):
+            table = MonthTable.build(2022, 2024)
+        converter = LunisolarConverter(solstice_provider=provider)
+
+        zi = table.lookup(date(2023, 12, 21))
+        self.assertEqual((zi.start_cst_date, zi.month_number, zi.is_leap), (date(2023, 12, 21), 11, False))
+        before = table.lookup(date(2023, 12, 20))
+        self.assertEqual((before.month_number, before.is_leap), (10, True))
+        # Zi(2024) starts on 2024-12-10, eleven days before the solstice's CST date
+        zi = table.lookup(date(2024, 12, 10))
+        self.assertEqual((zi.start_cst_date, zi.month_number, zi.is_leap), (date(2024, 12, 10), 11, False))
+        dto = converter.convert('2024-12-10', '09:00', 'Asia/Shanghai')
+        self.assertEqual((dto.year, dto.month, dto.day), (2024, 11, 1))
+        batch = converter.convert_batch([('2024-12-09', '12:00'), ('2024-12-10', '09:00')], 'Asia/Shanghai')
+        self.assertEqual([(r.month, r.day) for r in batch], [(9, 30), (11, 1)])
+
+        day = date(2022, 11, 1)
+        while day < date(2025, 2, 1):
+            row, lunar_day = table.resolve(day)
+            for local_time in ('00:30', '21:00', '23:30'):
+                dto = converter.convert(day.isoformat(), local_time, 'Asia/Shanghai')
+                self.assertEqual(
+                    (dto.year, dto.month, dto.day, dto.is_leap_month),
+                    (row.lunar_year, row.month_number, lunar_day, row.is_leap),
+                    f"{day} {local_time}",
+                )
+            day += timedelta(days=1)
+
+
+class TestEventCache(unittest.TestCase):
+    """Persistent event cache fills missing years only and reloads from disk."""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.computed = []
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _compute_year(self, year):
+        self.computed.append(year)
+        return [datetime_to_us(datetime(year, m, 15)) for m in (3, 9)], [0, 12]
+
+    def _cache(self):
+        return EventCache(self._dir.name, ephemeris_path=os.path.abspath(__file__))
+
+    def test_lazy_fill_and_reload(self):
+        cache = self._cache()
+        times, codes = cache.events('terms', 2000, 2001, self._compute_year)
+        self.assertEqual((len(times), list(codes)), (4, [0, 12, 0, 12]))
+        cache.events('terms', 1999, 2001, self._compute_year)
+        self.assertEqual(self.computed, [2000, 2001, 1999])
+
+        fresh = self._cache()
+        times, _ = fresh.events_between(
+            'terms', datetime(2000, 3, 15), datetime(2001, 3, 15), self._compute_year
+        )
+        self.assertEqual(len(times), 3)
+        self.assertEqual(fresh.coverage('terms'), [(1999, 2001)])
+        self.assertEqual(self.computed, [2000, 2001, 1999])
+
+    def test_far_request_is_a_separate_chunk(self):
+        cache = self._cache()
+        cache.events('terms', 2000, 2000, self._compute_year)
+        times, _ = cache.events('terms', 2050, 2050, self._compute_year)
+        self.assertEqual(len(times), 2)
+        self.assertEqual(self.computed, [2000, 2050])
+        self.assertEqual(cache.coverage('terms'), [(2000, 2000), (2050, 2050)])
+
+        # Adjacent and overlapping requests merge chunks; only new years are computed
+        cache.events('terms', 2048, 2049, self._compute_year)
+        times, _ = self._cache().events('terms', 2048, 2050, self._compute_year)
+        self.assertEqual(len(times), 6)
+        self.assertEqual(self.computed, [2000, 2050, 2048, 2049])
+        self.assertEqual(self._cache().coverage('terms'), [(2000, 2000), (2048, 2050)])
+
+    def test_fingerprint_uses_size_mtime_and_header(self):
+        from ephemeris.event_cache import ephemeris_fingerprint
+        path = os.path.join(self._dir.name, 'kernel.bsp')
+        with open(path, 'wb') as f:
+            f.write(b'DAF/SPK ' + bytes(200_000))
+        first = ephemeris_fingerprint(path)
+        os.utime(path, ns=(0, 0))
+        touched = ephemeris_fingerprint(path)
+        self.assertNotEqual(first, touched)
+        with open(path, 'r+b') as f:
+            f.seek(150_000)
+            f.write(b'x')  # past the hashed header, same size
+        os.utime(path, ns=(0, 0))
+        self.assertEqual(ephemeris_fingerprint(path), touched)
+
+
+class _StubKernel:
+    def __init__(self, path):
+        self.path = path
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@mock.patch('ephemeris.registry.load_file')
+class TestEphemerisRegistry(unittest.TestCase):
+    """Kernels open lazily, once per path, and are dropped on close / reload / fork."""
+
+    PATH = os.path.join(tempfile.gettempdir(), 'stub.bsp')
+
+    def test_lazy_single_load(self, load_file):
+        load_file.side_effect = _StubKernel
+        registry = EphemerisRegistry()
+        self.assertFalse(registry.is_open(self.PATH))
+        load_file.assert_not_called()
+
+        kernels = []
+        workers = [threading.Thread(target=lambda: kernels.append(registry.get(self.PATH)))
+                   for _ in range(8)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        self.assertEqual(load_file.call_count, 1)
+        self.assertTrue(all(k is kernels[0] for k in kernels))
+        self.assertIs(registry.open(self.PATH), kernels[0])
+        self.assertEqual(registry.open_paths(), [os.path.normcase(os.path.abspath(self.PATH))])
+
+    def test_close_and_reload(self, load_file):
+        load_file.side_effect = _StubKernel
+        registry = EphemerisRegistry()
+        first = registry.get(self.PATH)
+        registry.close(self.PATH)
+        self.assertTrue(first.closed)
+        self.assertFalse(registry.is_open(self.PATH))
+        second = registry.get(self.PATH)
+        self.assertIsNot(second, first)
+
+        third = registry.reload(self.PATH)
+        self.assertTrue(second.closed)
+        self.assertIsNot(third, second)
+        self.assertIs(registry.get(self.PATH), third)
+        self.assertEqual(load_file.call_count, 3)
+
+        registry.get(self.PATH + '.2')
+        registry.close()
+        self.assertEqual(registry.open_paths(), [])
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_fork_child_starts_empty(self, load_file):
+        load_file.side_effect = _StubKernel
+        registry = get_registry()
+        parent_kernel = registry.get(self.PATH)
+        self.addCleanup(registry.close, self.PATH)
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                state = b'open' if registry.is_open(self.PATH) else b'empty'
+                child_kernel = registry.get(self.PATH)
+                state += b',reopened' if child_kernel is not parent_kernel else b',shared'
+                os.write(write_fd, state)
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as pipe:
+            state = pipe.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(state, b'empty,reopened')
+        self.assertIs(registry.get(self.PATH), parent_kernel)
+        self.assertFalse(parent_kernel.closed)
+
+
+class _CountingSolsticeProvider(SolsticeProvider):
+    """Provider with a synthetic sweep that records every ephemeris pass."""
+
+    def __init__(self, maxsize):
+        super().__init__(maxsize)
+        self.sweeps = []
+
+    def _sweep(self, year_start, year_end):
+        self.sweeps.append((year_start, year_end))
+        return {y: datetime(y, 12, 21, 12) for y in range(year_start, year_end + 1)}
+
+
+@mock.patch('lunisolar.solstice_provider.get_event_cache', return_value=None)
+class TestSolsticeProvider(unittest.TestCase):
+    """Solstices are memoized per year and bulk ranges take one sweep."""
+
+    def test_bulk_range_is_one_sweep(self, _):
+        provider = _CountingSolsticeProvider(maxsize=8)
+        solstices = provider.solstices(2020, 2025)
+        self.assertEqual(sorted(solstices), list(range(2020, 2026)))
+        self.assertEqual(provider.winter_solstice(2023), datetime(2023, 12, 21, 12))
+        provider.solstices(2022, 2027)
+        self.assertEqual(provider.sweeps, [(2020, 2025), (2026, 2027)])
+
+    def test_lru_evicts_oldest_year(self, _):
+        provider = _CountingSolsticeProvider(maxsize=2)
+        for year in (2020, 2021, 2020, 2022):
+            provider.winter_solstice(year)
+        provider.winter_solstice(2020)
+        provider.winter_solstice(2021)
+        self.assertEqual(provider.sweeps, [(y, y) for y in (2020, 2021, 2022, 2021)])
+
+
+class TestMonthTable(unittest.TestCase):
+    """Precomputed month table lookup and the table-backed API fast path."""
+
+    def tearDown(self):
+        use_month_table(None)
+
+    def test_lookup_by_bisect(self):
+        table = _sample_month_table()
+        row, lunar_day = table.resolve(date(2025, 1, 20))
+        self.assertEqual((row.lunar_year, row.month_number, lunar_day), (2024, 12, 21))
+        row, lunar_day = table.resolve(date(2025, 1, 29))
+        self.assertEqual((row.lunar_year, row.month_number, lunar_day), (2025, 1, 1))
+        self.assertIsNone(table.lookup(date(2024, 11, 30)))
+        self.assertIsNone(table.lookup(date(2025, 3, 29)))
+
+    def test_round_trip_and_version_check(self):
+        data = _sample_month_table().to_dict()
+        table = MonthTable.from_dict(data)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(table.last_date, date(2025, 3, 28))
+        data["version"] = 0
+        with self.assertRaises(ValueError):
+            MonthTable.from_dict(data)
+
+    def test_fast_path_needs_no_ephemeris(self):
+        use_month_table(_sample_month_table())
+        result = solar_to_lunisolar('2025-01-20', '12:00', 'Asia/Shanghai', quiet=True)
+        self.assertEqual((result.year, result.month, result.day), (2024, 12, 21))
+        self.assertEqual((result.year_stem, result.year_branch), ('甲', '辰'))
+        self.assertEqual((result.month_stem, result.month_branch), ('丁', '丑'))
+
+        batch = solar_to_lunisolar_batch([('2025-02-15', '12:00')], 'Asia/Shanghai', quiet=True)
+        self.assertEqual((batch[0].year, batch[0].month, batch[0].day), (2025, 1, 18))
+        self.assertEqual((batch[0].year_stem, batch[0].year_branch), ('乙', '巳'))
+
+
+class TestLunisolarConverter(unittest.TestCase):
+    """A converter instance owns its services and table across calls."""
+
+    def test_reuses_zone_services_and_table(self):
+        converter = LunisolarConverter(month_table=_sample_month_table())
+        single = converter.convert('2025-01-20', '12:00', 'Asia/Ho_Chi_Minh')
+        batch = converter.convert_batch([('2025-01-20', '12:00'), ('2025-02-01', '08:30')],
+                                        'Asia/Ho_Chi_Minh')
+        self.assertEqual(batch[0], single)
+        self.assertEqual((batch[1].year, batch[1].month, batch[1].day), (2025, 1, 4))
+        self.assertIs(converter._zone('Asia/Ho_Chi_Minh'), converter._zone('Asia/Ho_Chi_Minh'))
+
+    def test_convert_instants_matches_string_batch(self):
+        converter = LunisolarConverter(month_table=_sample_month_table())
+        strings = converter.convert_batch([('2025-01-20', '12:00'), ('2025-02-01', '23:30')],
+                                          'Asia/Ho_Chi_Minh')
+        instants = converter.convert_instants([date(2025, 1, 20), datetime(2025, 2, 1, 23, 30)],
+                                              'Asia/Ho_Chi_Minh')
+        self.assertEqual(instants, strings)
+        self.assertEqual(converter.convert_instants([1737349200], 'Asia/Ho_Chi_Minh'), strings[:1])
+
+
+class TestVectorizedConverter(unittest.TestCase):
+    """Columnar conversion must agree with the per-date DTO pipeline."""
+
+    def test_matches_scalar_conversion(self):
+        import numpy as np
+        table = _sample_month_table()
+        use_month_table(table)
+        self.addCleanup(use_month_table, None)
+
+        local_times = [
+            ('2024-12-01', '00:30'), ('2025-01-20', '12:00'), ('2025-01-28', '23:15'),
+            ('2025-01-29', '00:00'), ('2025-02-15', '12:00'), ('2025-03-28', '22:59'),
+        ]
+        # Asia/Shanghai is UTC+8 over this span
+        instants = np.array([f"{d}T{t}" for d, t in local_times], dtype='datetime64[m]')
+        instants = instants - np.timedelta64(8, 'h')
+
+        out = solar_to_lunisolar_array(instants, 'Asia/Shanghai', table=table)
+        for (d, t), row in zip(local_times, out):
+            dto = solar_to_lunisolar(d, t, 'Asia/Shanghai', quiet=True)
+            expected = (dto.year, dto.month, dto.day, dto.is_leap_month, dto.hour,
+                        dto.year_cycle, dto.month_cycle, dto.day_cycle, dto.hour_cycle)
+            self.assertEqual(tuple(row.item()), expected, f"{d} {t}")
+
+    def test_out_of_range_table_raises(self):
+        import numpy as np
+        with self.assertRaises(ValueError):
+            solar_to_lunisolar_array(np.array(['2030-01-01'], dtype='datetime64[D]'),
+                                     table=_sample_month_table())
+
+
+def _grid_month_table(start_year, end_year, quiet=True, meridian=None):
+    """Stand-in for ``MonthTable.build``: 30-day months on one fixed grid."""
+    anchor = date(2000, 1, 6).toordinal()
+    k0 = (date(start_year, 1, 1).toordinal() - anchor) // 30
+    k1 = (date(end_year, 12, 31).toordinal() - anchor) // 30 + 1
+    starts = [anchor + 30 * k for k in range(k0, k1 + 1)]
+    return MonthTable(
+        start_ordinals=starts[:-1],
+        month_numbers=[(k % 12) + 1 for k in range(k0, k1)],
+        leap_flags=[False] * (k1 - k0),
+        lunar_years=[date.fromordinal(s).year for s in starts[:-1]],
+        end_ordinal=starts[-1],
+        start_year=start_year,
+        end_year=end_year,
+        meridian=meridian,
+    )
+
+
+@mock.patch.dict('lunisolar.vectorized._AUTO_TABLES', clear=True)
+class TestAutoMonthTables(unittest.TestCase):
+    """On-demand tables grow to the union of requested spans, building each year once."""
+
+    def _days(self, start, end):
+        import numpy as np
+        return np.arange(start, end, dtype='datetime64[D]')
+
+    def test_year_by_year_requests_extend_the_table(self):
+        from lunisolar.vectorized import _AUTO_TABLES
+        with mock.patch.object(MonthTable, 'build', side_effect=_grid_month_table) as build:
+            for year in (2001, 2002, 2003, 2000):
+                solar_to_lunisolar_array(self._days(f'{year}-01-01', f'{year + 1}-01-01'))
+            solar_to_lunisolar_array(self._days('2000-06-01', '2003-06-01'))
+        self.assertEqual([c.args[:2] for c in build.call_args_list],
+                         [(2001, 2001), (2002, 2002), (2003, 2003), (2000, 2000)])
+        (table,) = _AUTO_TABLES.values()
+        self.assertEqual((table.start_year, table.end_year), (2000, 2003))
+        self.assertEqual(table.to_dict(), _grid_month_table(2000, 2003, meridian=table.meridian).to_dict())
+
+    def test_concurrent_requests_build_once(self):
+        import time
+
+        def slow_build(*args, **kwargs):
+            time.sleep(0.05)
+            return _grid_month_table(*args, **kwargs)
+
+        with mock.patch.object(MonthTable, 'build', side_effect=slow_build) as build:
+            workers = [threading.Thread(target=solar_to_lunisolar_array,
+                                        args=(self._days('2010-01-01', '2010-12-31'),))
+                       for _ in range(6)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        self.assertEqual(build.call_count, 1)
+
+    def test_joined_requires_contiguous_tables(self):
+        with self.assertRaises(ValueError):
+            _grid_month_table(2000, 2000).joined(_grid_month_table(2003, 2003))
+
+
 if __name__ == '__main__':
     unittest.main()
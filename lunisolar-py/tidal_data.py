@@ -15,10 +15,11 @@ import argparse
 from datetime import datetime, timedelta
 from typing import List, Tuple
 import numpy as np
-from skyfield.api import utc, load, wgs84
-from config import (EPHEMERIS_FILE, TIDAL_INTERVAL_MINUTES, MANSION_COUNT, 
+from skyfield.api import utc, wgs84
+from config import (TIDAL_INTERVAL_MINUTES, MANSION_COUNT, 
                    MANSION_DEGREES, GM_MOON, GM_SUN, DEFAULT_LOCATION)
 from utils import setup_logging, write_csv_file
+from ephemeris.registry import get_ephemeris, get_timescale
 
 def calculate_tidal_data(start_time: datetime, end_time: datetime, 
                         location_data: Tuple[float, float]) -> List[str]:
@@ -35,8 +36,8 @@ def calculate_tidal_data(start_time: datetime, end_time: datetime,
     logger = setup_logging()
     try:
         lat, lon = location_data
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
+        ts = get_timescale()
+        eph = get_ephemeris()
         earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
         topo = wgs84.latlon(lat, lon)
         observer = earth + topo
@@ -88,9 +89,6 @@ def calculate_tidal_data(start_time: datetime, end_time: datetime,
     except Exception as e:
         logger.error(f"Error calculating tidal data: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def parse_args():
     """Parse command line arguments for tidal data calculation."""
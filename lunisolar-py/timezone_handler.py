@@ -5,13 +5,139 @@ Timezone Handler Module
 
 This module provides robust timezone conversion utilities using the `pytz` library
 to support IANA timezone names (e.g., 'Asia/Ho_Chi_Minh', 'America/New_York').
+
+For batch work, `OffsetTable` precomputes a zone's UTC-offset transitions
+once (cached per zone by `get_offset_table`) and converts whole arrays of
+epoch seconds between local wall-clock time and UTC with `searchsorted`,
+reproducing `pytz` `localize(..., is_dst=False)` for ambiguous and
+nonexistent local times.
 """
 
 import logging
-from datetime import datetime
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, Tuple, Union
+import numpy as np
 import pytz
 from utils import setup_logging
 
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+# A date, naive/aware datetime, or Unix epoch seconds
+Instant = Union[date, datetime, int, float]
+
+
+class OffsetTable:
+    """
+    UTC-offset transition table of one IANA zone.
+
+    Interval ``k`` starts at ``utc_starts[k]`` (epoch seconds) and has UTC
+    offset ``offsets[k]`` (seconds).  The first interval is open-ended
+    backwards; fixed-offset zones have a single interval.
+    """
+
+    def __init__(self, timezone_name: str):
+        tz = pytz.timezone(timezone_name)
+        self.timezone_name = timezone_name
+        transitions = getattr(tz, '_utc_transition_times', None)
+        if transitions:
+            starts = [int((t - _UNIX_EPOCH).total_seconds()) for t in transitions]
+            starts[0] = np.iinfo(np.int64).min // 2  # pytz's datetime.min sentinel
+            infos = tz._transition_info
+        else:
+            starts = [np.iinfo(np.int64).min // 2]
+            infos = [(tz.utcoffset(datetime(2000, 1, 1)), timedelta(0), None)]
+
+        self.utc_starts = np.array(starts, dtype=np.int64)
+        self.offsets = np.array([int(info[0].total_seconds()) for info in infos], dtype=np.int64)
+        self.is_dst = np.array([bool(info[1]) for info in infos], dtype=np.bool_)
+        # Local wall-clock time at which each interval begins
+        self.local_starts = self.utc_starts + self.offsets
+
+    def __len__(self) -> int:
+        return len(self.utc_starts)
+
+    def utc_offsets(self, utc_seconds) -> np.ndarray:
+        """UTC offset (seconds) in effect at each UTC epoch second."""
+        idx = np.searchsorted(self.utc_starts, utc_seconds, side='right') - 1
+        return self.offsets[np.clip(idx, 0, None)]
+
+    def utc_to_local(self, utc_seconds) -> np.ndarray:
+        """UTC epoch seconds -> local wall-clock epoch seconds."""
+        utc_seconds = np.asarray(utc_seconds, dtype=np.int64)
+        return utc_seconds + self.utc_offsets(utc_seconds)
+
+    def local_to_utc(self, local_seconds) -> np.ndarray:
+        """
+        Local wall-clock epoch seconds -> UTC epoch seconds.
+
+        Matches ``tz.localize(dt, is_dst=False)``: a time repeated by a
+        backward transition resolves to its standard-time reading, and a
+        time skipped by a forward transition uses the offset in effect
+        before the gap.
+        """
+        local_seconds = np.asarray(local_seconds, dtype=np.int64)
+        k = np.clip(np.searchsorted(self.local_starts, local_seconds, side='right') - 1, 0, None)
+        prev = np.clip(k - 1, 0, None)
+        offset = self.offsets[k]
+
+        # Repeated hour: the instant also falls inside the previous interval
+        ambiguous = (k > 0) & (local_seconds < self.utc_starts[k] + self.offsets[prev])
+        if ambiguous.any():
+            prev_std = ~self.is_dst[prev]
+            this_std = ~self.is_dst[k]
+            use_prev = np.where(
+                prev_std != this_std,
+                prev_std,
+                self.offsets[prev] < self.offsets[k],
+            )
+            offset = np.where(ambiguous & use_prev, self.offsets[prev], offset)
+        return local_seconds - offset
+
+    def utc_offset_at(self, utc_seconds: int) -> int:
+        """Scalar form of :meth:`utc_offsets`."""
+        return int(self.utc_offsets(np.int64(utc_seconds)))
+
+
+_OFFSET_TABLES: Dict[str, OffsetTable] = {}
+_OFFSET_TABLES_LOCK = threading.Lock()
+
+
+def get_offset_table(timezone_name: str) -> OffsetTable:
+    """Return the cached :class:`OffsetTable` for an IANA zone."""
+    table = _OFFSET_TABLES.get(timezone_name)
+    if table is None:
+        table = OffsetTable(timezone_name)
+        with _OFFSET_TABLES_LOCK:
+            table = _OFFSET_TABLES.setdefault(timezone_name, table)
+    return table
+
+
+def to_epoch_seconds(instants) -> np.ndarray:
+    """Normalize a datetime64 array (any unit) or integer epoch seconds to int64 seconds."""
+    arr = np.asarray(instants)
+    if arr.dtype.kind == 'M':
+        return arr.astype('datetime64[s]').astype(np.int64)
+    if arr.dtype.kind in 'iu':
+        return arr.astype(np.int64, copy=False)
+    raise TypeError(f"Expected datetime64 or integer epoch seconds, got dtype {arr.dtype}")
+
+
+def local_to_utc_array(local_instants, timezone_name: str) -> np.ndarray:
+    """Vectorized local wall-clock -> UTC; returns int64 epoch seconds."""
+    return get_offset_table(timezone_name).local_to_utc(to_epoch_seconds(local_instants))
+
+
+def utc_to_local_array(utc_instants, timezone_name: str) -> np.ndarray:
+    """Vectorized UTC -> local wall-clock; returns int64 epoch seconds."""
+    return get_offset_table(timezone_name).utc_to_local(to_epoch_seconds(utc_instants))
+
+
+def epoch_seconds_to_datetimes(seconds) -> list:
+    """int64 epoch seconds -> list of naive ``datetime`` objects."""
+    return np.asarray(seconds, dtype=np.int64).astype('datetime64[s]').tolist()
+
+
 class TimezoneHandler:
     """
     Handles timezone conversions using IANA timezone names.
@@ -79,10 +205,18 @@ class TimezoneHandler:
         Returns:
             A timezone-aware datetime object in the handler's timezone.
         """
+        # Localize the parsed datetime to the handler's timezone
+        return self.timezone.localize(self.parse_naive_datetime(date_str, time_str))
+
+    def parse_naive_datetime(self, date_str: str, time_str: str = "12:00") -> datetime:
+        """
+        Parse date and time strings into a naive local wall-clock datetime.
+        
+        Raises:
+            ValueError: If the strings are not YYYY-MM-DD / HH:MM.
+        """
         try:
-            naive_dt = datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
-            # Localize the parsed datetime to the handler's timezone
-            return self.timezone.localize(naive_dt)
+            return datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
         except ValueError:
             self.logger.error(f"Invalid date/time format: '{date_str} {time_str}'")
             raise
@@ -102,4 +236,39 @@ class TimezoneHandler:
         Returns:
             TimezoneHandler instance for CST (UTC+8)
         """
-        return TimezoneHandler('Asia/Shanghai')
\ No newline at end of file
+        return TimezoneHandler('Asia/Shanghai')
+
+    @property
+    def offset_table(self) -> OffsetTable:
+        """Cached :class:`OffsetTable` of the handler's timezone."""
+        return get_offset_table(self.timezone_name)
+
+    def instant_seconds(self, value: Instant, default_time: str = "12:00") -> Tuple[int, int]:
+        """
+        Resolve a date, datetime or epoch value without string round trips.
+
+        Args:
+            value: A ``date`` (taken at ``default_time`` local), a naive
+                   ``datetime`` (local wall-clock), an aware ``datetime``
+                   (an absolute instant), or Unix epoch seconds (UTC).
+            default_time: Local HH:MM used for plain dates.
+
+        Returns:
+            ``(local_seconds, utc_seconds)`` as epoch-second integers, where
+            ``local_seconds`` is the wall-clock time read as if it were UTC.
+        """
+        table = self.offset_table
+        if isinstance(value, datetime):
+            if value.tzinfo is None:
+                local = int((value - _UNIX_EPOCH) // timedelta(seconds=1))
+                return local, int(table.local_to_utc(np.int64(local)))
+            utc = int((value.astimezone(pytz.utc).replace(tzinfo=None) - _UNIX_EPOCH) // timedelta(seconds=1))
+        elif isinstance(value, date):
+            hour, minute = (int(part) for part in default_time.split(':'))
+            local = (value.toordinal() - _UNIX_EPOCH.toordinal()) * 86400 + hour * 3600 + minute * 60
+            return local, int(table.local_to_utc(np.int64(local)))
+        elif isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+            utc = int(np.floor(value))
+        else:
+            raise TypeError(f"Expected date, datetime or epoch seconds, got {type(value).__name__}")
+        return utc + table.utc_offset_at(utc), utc
@@ -5,9 +5,48 @@ import csv
 import sys
 import json
 import logging
-from typing import List, Dict, Any
+import contextvars
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator
 from config import OUTPUT_DIR
 
+# Per-thread / per-task quiet flag; replaces toggling the shared logger level,
+# which raced between concurrent requests.
+_QUIET = contextvars.ContextVar('lunisolar_quiet_logging', default=False)
+
+
+class _QuietFilter(logging.Filter):
+    """Drops sub-WARNING records while the current context is in quiet mode."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or not _QUIET.get()
+
+
+_QUIET_FILTER = _QuietFilter()
+
+
+@contextmanager
+def quiet_logging(enabled: bool = True) -> Iterator[None]:
+    """Suppress INFO/DEBUG records of the shared logger in the current thread
+    or task only; other concurrent callers keep their own verbosity."""
+    if not enabled:
+        yield
+        return
+    token = _QUIET.set(True)
+    try:
+        yield
+    finally:
+        _QUIET.reset(token)
+
+
+def log_enabled(logger: logging.Logger, level: int) -> bool:
+    """True if a record at ``level`` would be emitted here; use to guard
+    expensive message construction."""
+    if level < logging.WARNING and _QUIET.get():
+        return False
+    return logger.isEnabledFor(level)
+
+
 def setup_logging() -> logging.Logger:
     """Setup logging configuration.
     
@@ -15,6 +54,8 @@ def setup_logging() -> logging.Logger:
         Configured logger instance
     """
     logger = logging.getLogger(__name__)
+    if _QUIET_FILTER not in logger.filters:
+        logger.addFilter(_QUIET_FILTER)
     if not logging.getLogger().handlers:
         handler = logging.StreamHandler(sys.stdout)
         handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))